@@ -2,17 +2,27 @@
 
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from rd_burndown.core.chart_generator import get_chart_generator
+if TYPE_CHECKING:
+    from rd_burndown.core.chart_generator import ChartGenerator
 
 console = Console()
 
 
+def get_chart_generator() -> "ChartGenerator":
+    """チャートジェネレーターを取得（matplotlib の読み込みを実行時まで遅延）"""
+    from rd_burndown.core.chart_generator import (
+        get_chart_generator as _get_chart_generator,
+    )
+
+    return _get_chart_generator()
+
+
 @click.group()
 @click.pass_context
 def chart(ctx: click.Context) -> None:
@@ -3,18 +3,26 @@
 import json
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import click
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
-from rd_burndown.core.data_manager import DataManager, get_data_manager
+if TYPE_CHECKING:
+    from rd_burndown.core.data_manager import DataManager
 
 console = Console()
 
 
+def get_data_manager() -> "DataManager":
+    """データマネージャーを取得（requests 等の読み込みを実行時まで遅延）"""
+    from rd_burndown.core.data_manager import get_data_manager as _get_data_manager
+
+    return _get_data_manager()
+
+
 @click.group()
 @click.pass_context
 def data(ctx: click.Context) -> None:
@@ -113,7 +121,7 @@ def cache(ctx: click.Context, action: str, project_id: Optional[int]) -> None:
         raise click.ClickException(f"Cache operation failed: {e}") from e
 
 
-def _handle_cache_clear(data_manager: DataManager, project_id: Optional[int]) -> None:
+def _handle_cache_clear(data_manager: "DataManager", project_id: Optional[int]) -> None:
     """キャッシュクリア処理"""
     if project_id:
         console.print(
@@ -130,7 +138,7 @@ def _handle_cache_clear(data_manager: DataManager, project_id: Optional[int]) ->
 
 
 def _handle_cache_status(
-    data_manager: DataManager, project_id: Optional[int], verbose: bool
+    data_manager: "DataManager", project_id: Optional[int], verbose: bool
 ) -> None:
     """キャッシュ状態表示処理"""
     status = data_manager.get_cache_status(project_id)
@@ -188,7 +196,7 @@ def _display_global_cache_status(status: dict[str, Any], verbose: bool) -> None:
     console.print(table)
 
 
-def _handle_cache_size(data_manager: DataManager, project_id: Optional[int]) -> None:
+def _handle_cache_size(data_manager: "DataManager", project_id: Optional[int]) -> None:
     """キャッシュサイズ表示処理"""
     status = data_manager.get_cache_status(project_id)
 
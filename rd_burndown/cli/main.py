@@ -2,7 +2,7 @@
 
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
 import click
 from rich.console import Console
@@ -207,10 +207,15 @@ add_chart_commands(cli)
 add_data_commands(cli)
 
 
-def main() -> None:
-    """メイン関数"""
+def main(entry: Optional[Callable[[], Any]] = None) -> None:
+    """メイン関数
+
+    Args:
+        entry: 実行するエントリーポイント（省略時は cli）
+    """
+    entry = entry or cli
     try:
-        cli()
+        entry()
     except KeyboardInterrupt:
         console.print("\n[yellow]中断されました[/yellow]")
         sys.exit(1)
@@ -3,19 +3,36 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
-from rd_burndown.core.data_manager import get_data_manager
-from rd_burndown.core.redmine_client import get_redmine_client
+if TYPE_CHECKING:
+    from rd_burndown.core.data_manager import DataManager
+    from rd_burndown.core.redmine_client import RedmineClient
 
 console = Console()
 
 
+def get_data_manager() -> DataManager:
+    """データマネージャーを取得（requests 等の読み込みを実行時まで遅延）"""
+    from rd_burndown.core.data_manager import get_data_manager as _get_data_manager
+
+    return _get_data_manager()
+
+
+def get_redmine_client() -> RedmineClient:
+    """Redmineクライアントを取得（requests 等の読み込みを実行時まで遅延）"""
+    from rd_burndown.core.redmine_client import (
+        get_redmine_client as _get_redmine_client,
+    )
+
+    return _get_redmine_client()
+
+
 @click.group()
 @click.pass_context
 def project(ctx: click.Context) -> None:
@@ -1,6 +1,7 @@
 """チャート生成エンジン"""
 
 import logging
+import os
 from datetime import date
 from pathlib import Path
 from typing import Optional
@@ -18,6 +19,10 @@ from rd_burndown.utils.config import get_config_manager
 
 logger = logging.getLogger(__name__)
 
+# 1/true/yes/on が設定されている場合は日本語フォントの探索を省略する（テスト・CI向け）
+SKIP_FONT_PROBE_ENV = "RD_BURNDOWN_SKIP_FONT_PROBE"
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
 
 class ChartGeneratorError(Exception):
     """チャート生成エラー"""
@@ -38,6 +43,17 @@ class ChartGenerator:
         sns.set_palette("husl")
 
         # フォント設定
+        if os.environ.get(SKIP_FONT_PROBE_ENV, "").strip().lower() in _TRUTHY:
+            plt.rcParams["font.family"] = "DejaVu Sans"
+            plt.rcParams["axes.unicode_minus"] = False
+            self._no_japanese_font = True
+        else:
+            self._setup_japanese_font()
+
+        plt.rcParams["font.size"] = self.config.chart.font_size
+
+    def _setup_japanese_font(self) -> None:
+        """利用可能な日本語フォントを探索して設定"""
         self._no_japanese_font = False
         try:
             import matplotlib.font_manager as fm
@@ -96,8 +112,6 @@ class ChartGenerator:
             plt.rcParams["axes.unicode_minus"] = False
             self._no_japanese_font = True
 
-        plt.rcParams["font.size"] = self.config.chart.font_size
-
     def generate_burndown_chart(
         self,
         project_id: int,
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import weakref
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
@@ -38,6 +39,14 @@ class DataManager:
         # データベースの初期化
         self.db_manager.initialize_database()
 
+        # 読み取りは接続プールを再利用する（破棄時・終了時にクローズ）
+        self.db_manager.connect_pool()
+        self._finalizer = weakref.finalize(self, self.db_manager.close_pool)
+
+    def close(self) -> None:
+        """読み取り専用接続プールのクローズ"""
+        self._finalizer()
+
     def sync_project(
         self, project_id: int, force: bool = False, include_closed: bool = False
     ) -> None:
@@ -1,8 +1,11 @@
 """SQLiteデータベース管理システム"""
 
 import logging
+import os
+import queue
 import sqlite3
-from contextlib import contextmanager
+import threading
+from contextlib import closing, contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional, Union
@@ -11,15 +14,221 @@ from rd_burndown.utils.helpers import ensure_directory
 
 logger = logging.getLogger(__name__)
 
+# マイグレーションSQL（executescript で一括実行する）
+_V1_SCHEMA_SQL = """
+BEGIN;
+
+-- プロジェクトテーブル
+CREATE TABLE projects (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    identifier TEXT UNIQUE,
+    description TEXT,
+    status INTEGER DEFAULT 1,
+    start_date DATE,
+    end_date DATE,
+    created_on TIMESTAMP,
+    updated_on TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- チケットテーブル
+CREATE TABLE tickets (
+    id INTEGER PRIMARY KEY,
+    project_id INTEGER NOT NULL REFERENCES projects(id),
+    subject TEXT NOT NULL,
+    estimated_hours REAL,
+    status_id INTEGER,
+    status_name TEXT,
+    created_on TIMESTAMP,
+    updated_on TIMESTAMP,
+    completed_on TIMESTAMP,
+    assigned_to_id INTEGER,
+    assigned_to_name TEXT,
+    version_id INTEGER,
+    version_name TEXT,
+    custom_fields TEXT,  -- JSON形式で保存
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 日次スナップショットテーブル
+CREATE TABLE daily_snapshots (
+    id INTEGER PRIMARY KEY,
+    date DATE NOT NULL,
+    project_id INTEGER NOT NULL REFERENCES projects(id),
+    total_estimated_hours REAL NOT NULL,
+    completed_hours REAL NOT NULL,
+    remaining_hours REAL NOT NULL,
+    new_tickets_hours REAL DEFAULT 0,
+    changed_hours REAL DEFAULT 0,
+    deleted_hours REAL DEFAULT 0,
+    active_ticket_count INTEGER NOT NULL,
+    completed_ticket_count INTEGER NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(date, project_id)
+);
+
+-- スコープ変更テーブル
+CREATE TABLE scope_changes (
+    id INTEGER PRIMARY KEY,
+    date DATE NOT NULL,
+    project_id INTEGER NOT NULL REFERENCES projects(id),
+    ticket_id INTEGER,
+    ticket_subject TEXT,
+    change_type TEXT NOT NULL,
+    hours_delta REAL NOT NULL,
+    old_hours REAL,
+    new_hours REAL,
+    reason TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- インデックス作成
+CREATE INDEX idx_tickets_project_id ON tickets(project_id);
+CREATE INDEX idx_tickets_updated_on ON tickets(updated_on);
+CREATE INDEX idx_snapshots_project_date ON daily_snapshots(project_id, date);
+CREATE INDEX idx_scope_changes_project_date ON scope_changes(project_id, date);
+
+-- スキーマ変更と同じトランザクションでバージョンを記録する
+INSERT INTO schema_version (version) VALUES (1);
+
+COMMIT;
+"""
+
+_V2_SCHEMA_SQL = """
+BEGIN;
+
+-- チケット履歴テーブル
+CREATE TABLE ticket_journals (
+    id INTEGER PRIMARY KEY,
+    project_id INTEGER NOT NULL REFERENCES projects(id),
+    ticket_id INTEGER NOT NULL,
+    journal_id INTEGER NOT NULL,
+    user_id INTEGER,
+    user_name TEXT,
+    created_on TIMESTAMP NOT NULL,
+    notes TEXT,
+    details TEXT,  -- JSON形式で変更詳細を保存
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(project_id, ticket_id, journal_id)
+);
+
+-- インデックス作成
+CREATE INDEX idx_ticket_journals_project_id ON ticket_journals(project_id);
+CREATE INDEX idx_ticket_journals_ticket_id ON ticket_journals(ticket_id);
+CREATE INDEX idx_ticket_journals_created_on ON ticket_journals(created_on);
+
+-- スキーマ変更と同じトランザクションでバージョンを記録する
+INSERT INTO schema_version (version) VALUES (2);
+
+COMMIT;
+"""
+
 
 class DatabaseError(Exception):
     """データベース関連エラー"""
 
 
+class ReadOnlyPool:
+    """読み取り専用接続プール
+
+    SELECT 主体の並行処理向けに読み取り専用接続を再利用する。
+    接続は必要になった時点で上限数まで作成する。
+    """
+
+    STATEMENT_CACHE_SIZE = 256
+
+    def __init__(self, db_path: Union[str, Path], size: Optional[int] = None):
+        """
+        初期化
+
+        Args:
+            db_path: データベースファイルパス
+            size: 最大接続数（Noneの場合はCPUコア数）
+        """
+        self.db_path = Path(db_path)
+        self.size = max(1, size or os.cpu_count() or 1)
+        # None はクローズ通知（待機中のスレッドを起こすための番兵）
+        self._idle: queue.LifoQueue[Optional[sqlite3.Connection]] = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """読み取り専用接続の作成"""
+        conn = sqlite3.connect(
+            f"file:{self.db_path}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            cached_statements=self.STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only=ON")
+        conn.execute("PRAGMA cache_size=-32768")
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        """接続の取得（上限到達時は返却を待つ）"""
+        if self._closed:
+            raise DatabaseError("Connection pool is closed")
+
+        try:
+            return self._checked(self._idle.get_nowait())
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_create = self._created < self.size
+            if can_create:
+                self._created += 1
+
+        if not can_create:
+            return self._checked(self._idle.get())
+
+        try:
+            return self._connect()
+        except sqlite3.Error:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def _checked(self, conn: Optional[sqlite3.Connection]) -> sqlite3.Connection:
+        """取得した接続の検査（クローズ通知は後続の待機者へ引き継ぐ）"""
+        if conn is None:
+            self._idle.put(None)
+            raise DatabaseError("Connection pool is closed")
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """接続の返却"""
+        if self._closed:
+            conn.close()
+            return
+        self._idle.put(conn)
+
+    def close(self) -> None:
+        """プール内の全接続をクローズし、返却待ちのスレッドを起こす"""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if conn is not None:
+                conn.close()
+        self._idle.put(None)
+
+
 class DatabaseManager:
     """SQLiteデータベース管理クラス"""
 
     CURRENT_VERSION = 2
+    BACKUP_PAGES_PER_STEP: int = 1024
 
     def __init__(self, db_path: Union[str, Path]):
         """
@@ -29,6 +238,7 @@ class DatabaseManager:
             db_path: データベースファイルパス
         """
         self.db_path = Path(db_path)
+        self._read_pool: Optional[ReadOnlyPool] = None
         self._ensure_db_directory()
 
     def _ensure_db_directory(self) -> None:
@@ -36,6 +246,43 @@ class DatabaseManager:
         if self.db_path.parent != Path("."):
             ensure_directory(self.db_path.parent)
 
+    def connect_pool(self, size: Optional[int] = None) -> ReadOnlyPool:
+        """
+        読み取り専用接続プールの有効化
+
+        有効化後は get_connection(read_only=True) がプールから接続を取得する。
+        書き込み接続は従来通り都度作成する。
+
+        Args:
+            size: 最大接続数（Noneの場合はCPUコア数）
+
+        Returns:
+            ReadOnlyPool: 接続プール
+        """
+        if self._read_pool is None:
+            self._read_pool = ReadOnlyPool(self.db_path, size)
+        return self._read_pool
+
+    def close_pool(self) -> None:
+        """読み取り専用接続プールのクローズ"""
+        if self._read_pool is not None:
+            self._read_pool.close()
+            self._read_pool = None
+
+    @contextmanager
+    def _get_pooled_connection(self, pool: ReadOnlyPool):
+        """プールからの読み取り専用接続のコンテキストマネージャー"""
+        conn = None
+        try:
+            conn = pool.acquire()
+            yield conn
+        except sqlite3.Error as e:
+            logger.error(f"Database error: {e}")
+            raise DatabaseError(f"Database operation failed: {e}") from e
+        finally:
+            if conn:
+                pool.release(conn)
+
     @contextmanager
     def get_connection(self, read_only: bool = False):
         """
@@ -47,6 +294,11 @@ class DatabaseManager:
         Yields:
             sqlite3.Connection: データベース接続
         """
+        if read_only and self._read_pool is not None:
+            with self._get_pooled_connection(self._read_pool) as conn:
+                yield conn
+            return
+
         uri = f"file:{self.db_path}"
         if read_only:
             uri += "?mode=ro"
@@ -110,137 +362,19 @@ class DatabaseManager:
             migration_method = getattr(self, f"_migrate_to_v{version}", None)
 
             if migration_method:
+                # schema_version への記録は各マイグレーションSQL内で行う
                 migration_method(conn)
-                conn.execute(
-                    "INSERT INTO schema_version (version) VALUES (?)", (version,)
-                )
             else:
                 raise DatabaseError(f"Migration method for version {version} not found")
 
     def _migrate_to_v1(self, conn: sqlite3.Connection) -> None:
         """バージョン1へのマイグレーション - 初期スキーマ作成"""
-
-        # プロジェクトテーブル
-        conn.execute("""
-            CREATE TABLE projects (
-                id INTEGER PRIMARY KEY,
-                name TEXT NOT NULL,
-                identifier TEXT UNIQUE,
-                description TEXT,
-                status INTEGER DEFAULT 1,
-                start_date DATE,
-                end_date DATE,
-                created_on TIMESTAMP,
-                updated_on TIMESTAMP,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # チケットテーブル
-        conn.execute("""
-            CREATE TABLE tickets (
-                id INTEGER PRIMARY KEY,
-                project_id INTEGER NOT NULL REFERENCES projects(id),
-                subject TEXT NOT NULL,
-                estimated_hours REAL,
-                status_id INTEGER,
-                status_name TEXT,
-                created_on TIMESTAMP,
-                updated_on TIMESTAMP,
-                completed_on TIMESTAMP,
-                assigned_to_id INTEGER,
-                assigned_to_name TEXT,
-                version_id INTEGER,
-                version_name TEXT,
-                custom_fields TEXT,  -- JSON形式で保存
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # 日次スナップショットテーブル
-        conn.execute("""
-            CREATE TABLE daily_snapshots (
-                id INTEGER PRIMARY KEY,
-                date DATE NOT NULL,
-                project_id INTEGER NOT NULL REFERENCES projects(id),
-                total_estimated_hours REAL NOT NULL,
-                completed_hours REAL NOT NULL,
-                remaining_hours REAL NOT NULL,
-                new_tickets_hours REAL DEFAULT 0,
-                changed_hours REAL DEFAULT 0,
-                deleted_hours REAL DEFAULT 0,
-                active_ticket_count INTEGER NOT NULL,
-                completed_ticket_count INTEGER NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(date, project_id)
-            )
-        """)
-
-        # スコープ変更テーブル
-        conn.execute("""
-            CREATE TABLE scope_changes (
-                id INTEGER PRIMARY KEY,
-                date DATE NOT NULL,
-                project_id INTEGER NOT NULL REFERENCES projects(id),
-                ticket_id INTEGER,
-                ticket_subject TEXT,
-                change_type TEXT NOT NULL,
-                hours_delta REAL NOT NULL,
-                old_hours REAL,
-                new_hours REAL,
-                reason TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # インデックス作成
-        conn.execute("CREATE INDEX idx_tickets_project_id ON tickets(project_id)")
-        conn.execute("CREATE INDEX idx_tickets_updated_on ON tickets(updated_on)")
-        conn.execute(
-            "CREATE INDEX idx_snapshots_project_date ON daily_snapshots(project_id, date)"
-        )
-        conn.execute(
-            "CREATE INDEX idx_scope_changes_project_date ON scope_changes(project_id, date)"
-        )
-
+        conn.executescript(_V1_SCHEMA_SQL)
         logger.info("Initial schema (v1) created successfully")
 
     def _migrate_to_v2(self, conn: sqlite3.Connection) -> None:
         """バージョン2へのマイグレーション - ticket_journalsテーブル追加"""
-
-        # チケット履歴テーブル
-        conn.execute("""
-            CREATE TABLE ticket_journals (
-                id INTEGER PRIMARY KEY,
-                project_id INTEGER NOT NULL REFERENCES projects(id),
-                ticket_id INTEGER NOT NULL,
-                journal_id INTEGER NOT NULL,
-                user_id INTEGER,
-                user_name TEXT,
-                created_on TIMESTAMP NOT NULL,
-                notes TEXT,
-                details TEXT,  -- JSON形式で変更詳細を保存
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(project_id, ticket_id, journal_id)
-            )
-        """)
-
-        # インデックス作成
-        conn.execute(
-            "CREATE INDEX idx_ticket_journals_project_id ON ticket_journals(project_id)"
-        )
-        conn.execute(
-            "CREATE INDEX idx_ticket_journals_ticket_id ON ticket_journals(ticket_id)"
-        )
-        conn.execute(
-            "CREATE INDEX idx_ticket_journals_created_on ON ticket_journals(created_on)"
-        )
-
+        conn.executescript(_V2_SCHEMA_SQL)
         logger.info("ticket_journals table (v2) created successfully")
 
     def vacuum_database(self) -> None:
@@ -258,8 +392,11 @@ class DatabaseManager:
             # バージョン情報
             version = self._get_current_version(conn)
 
-            # ファイルサイズ
-            file_size = self.db_path.stat().st_size if self.db_path.exists() else 0
+            # ファイル情報（stat は1回のみ）
+            try:
+                stat_result: Optional[os.stat_result] = self.db_path.stat()
+            except FileNotFoundError:
+                stat_result = None
 
             # テーブル統計
             tables_info = {}
@@ -280,10 +417,10 @@ class DatabaseManager:
             return {
                 "version": version,
                 "file_path": str(self.db_path),
-                "file_size_bytes": file_size,
+                "file_size_bytes": stat_result.st_size if stat_result else 0,
                 "tables": tables_info,
-                "last_modified": datetime.fromtimestamp(self.db_path.stat().st_mtime)
-                if self.db_path.exists()
+                "last_modified": datetime.fromtimestamp(stat_result.st_mtime)
+                if stat_result
                 else None,
             }
 
@@ -296,12 +433,26 @@ class DatabaseManager:
 
         with (
             self.get_connection(read_only=True) as source_conn,
-            sqlite3.connect(backup_path) as backup_conn,
+            closing(sqlite3.connect(backup_path)) as backup_conn,
         ):
-            source_conn.backup(backup_conn)
+            # 書き捨てのコピー先のためジャーナル・同期書き込みを無効化
+            backup_conn.execute("PRAGMA journal_mode=OFF")
+            backup_conn.execute("PRAGMA synchronous=OFF")
+
+            # ページ単位で段階的にコピーし、ソースの読み取りロック保持を短くする
+            source_conn.backup(
+                backup_conn,
+                pages=self.BACKUP_PAGES_PER_STEP,
+                progress=self._log_backup_progress,
+            )
 
         logger.info("Database backup completed")
 
+    @staticmethod
+    def _log_backup_progress(status: int, remaining: int, total: int) -> None:
+        """バックアップ進捗のログ出力"""
+        logger.debug(f"Backup progress: {total - remaining}/{total} pages")
+
     def execute_query(
         self,
         query: str,
@@ -320,8 +471,19 @@ class DatabaseManager:
 
         Returns:
             クエリ結果
+
+        Note:
+            connect_pool() で接続プールが有効な場合、SELECT はプール接続で実行する。
+            プール接続は使い回されるため、sqlite3 の文キャッシュ
+            (cached_statements) により同一SQLの再準備が省略される。
         """
-        with self.get_connection() as conn:
+        read_only = (
+            self._read_pool is not None
+            and (fetch_one or fetch_all)
+            and query.lstrip()[:6].upper() == "SELECT"
+        )
+
+        with self.get_connection(read_only=read_only) as conn:
             cursor = conn.execute(query, params or ())
 
             if fetch_one:
@@ -1,5 +1,7 @@
 """データモデル定義"""
 
+import math
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Any, Optional
@@ -11,6 +13,24 @@ import pendulum
 class TicketData:
     """チケットデータモデル"""
 
+    # 大量に生成されるため __dict__ を持たせない
+    # （Python 3.9 をサポートするため dataclass(slots=True) ではなく明示的に定義）
+    __slots__ = (
+        "id",
+        "subject",
+        "estimated_hours",
+        "created_on",
+        "updated_on",
+        "status_id",
+        "status_name",
+        "assigned_to_id",
+        "assigned_to_name",
+        "project_id",
+        "version_id",
+        "version_name",
+        "custom_fields",
+    )
+
     id: int
     subject: str
     estimated_hours: Optional[float]
@@ -74,8 +94,18 @@ class DailySnapshot:
 
     def completion_rate(self) -> float:
         """完了率（%）"""
-        total = self.total_tickets()
-        return (self.completed_ticket_count / total * 100) if total > 0 else 0.0
+        total = self.active_ticket_count + self.completed_ticket_count
+        return self.completed_ticket_count * 100.0 / max(total, 1)
+
+
+def completion_rates(snapshots: Sequence[DailySnapshot]) -> list[float]:
+    """スナップショット群の完了率（%）を一括計算"""
+    return [
+        s.completed_ticket_count
+        * 100.0
+        / max(s.active_ticket_count + s.completed_ticket_count, 1)
+        for s in snapshots
+    ]
 
 
 @dataclass
@@ -272,19 +302,23 @@ class ProjectSummary:
 
     def is_on_track(self) -> bool:
         """予定通り進行しているか判定"""
-        if self.days_remaining is None or self.days_remaining <= 0:
+        days_remaining = self.days_remaining or 0
+        if days_remaining <= 0:
             return self.remaining_hours <= 0
 
-        required_burn_rate = self.remaining_hours / self.days_remaining
-        return self.average_burn_rate >= required_burn_rate
+        # 必要バーンレートを除算で求めず、消化可能工数と残工数を直接比較する
+        # （NaN を含む場合は比較が False となり遅延扱い）
+        return self.average_burn_rate * days_remaining >= self.remaining_hours
 
     def schedule_variance(self) -> Optional[float]:
         """スケジュール偏差（日数）"""
-        if self.average_burn_rate <= 0:
-            return None
-
-        projected_days = self.remaining_hours / self.average_burn_rate
-        return projected_days - (self.days_remaining or 0)
+        projected_days = (
+            self.remaining_hours / self.average_burn_rate
+            if self.average_burn_rate > 0
+            else math.nan
+        )
+        variance = projected_days - (self.days_remaining or 0)
+        return None if math.isnan(variance) else variance
 
     def scope_variance(self) -> float:
         """スコープ偏差（工数）"""
@@ -1,22 +1,63 @@
 """Redmine API クライアント"""
 
+import asyncio
 import contextlib
+import copy
+import functools
 import json
 import logging
+import math
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, datetime
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional, Union
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from rd_burndown import __version__
 from rd_burndown.core.models import RedmineProject, TicketData
 from rd_burndown.utils.config import Config
 
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:  # pragma: no cover - orjson は任意依存
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+_REDMINE_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _format_timestamp(value: Union[datetime, str]) -> str:
+    """日時を Redmine API のフィルタ用文字列に変換（文字列はそのまま返す）"""
+    if isinstance(value, str):
+        return value
+    return value.strftime(_REDMINE_TIMESTAMP_FORMAT)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_datetime(value: str) -> datetime:
+    """ISO形式の日時文字列をパース（同一文字列の再パースを避けるためキャッシュ）"""
+    return datetime.fromisoformat(value)
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """レスポンスボディのJSONデコード（orjson があれば優先して使用）
+
+    orjson.JSONDecodeError は json.JSONDecodeError のサブクラスのため、
+    呼び出し元のエラーハンドリングはそのまま適用される。
+    """
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
 class RedmineAPIError(Exception):
     """Redmine API エラー"""
 
@@ -25,9 +66,66 @@ class RedmineAPIError(Exception):
         self.status_code = status_code
 
 
+class _CachedResponse(NamedTuple):
+    """キャッシュ済みレスポンス（条件付きリクエスト用の検証子を含む）"""
+
+    payload: dict[str, Any]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class _TTLCache:
+    """有効期限付きLRUキャッシュ（スレッドセーフ）"""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """有効なエントリを取得（期限切れ・未登録はNone）"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                # 条件付きリクエストによる再検証のため、期限切れでも破棄しない
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        """有効期限を問わずエントリを取得（未登録はNone）"""
+        with self._lock:
+            entry = self._data.get(key)
+            return None if entry is None else entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """エントリを登録（上限超過時は最も古いものを破棄）"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """全エントリを削除"""
+        with self._lock:
+            self._data.clear()
+
+
 class RedmineClient:
     """Redmine REST API クライアント"""
 
+    MAX_PAGE_WORKERS = 8
+    CACHE_MAXSIZE = 256
+    # 変更頻度の低いマスタ系エンドポイントのキャッシュ有効期限（秒）
+    MASTER_CACHE_TTL = 3600.0
+    RESOURCE_CACHE_TTL = 300.0
+    # 接続テスト結果のキャッシュ有効期限（秒）
+    CONNECTION_CHECK_TTL = 30.0
+
     def __init__(self, config: Config) -> None:
         self.config = config
         self.base_url = config.redmine.url.rstrip("/")
@@ -36,20 +134,44 @@ class RedmineClient:
         self.verify_ssl = config.redmine.verify_ssl
 
         self.session = self._create_session()
-        self._last_request_time = 0.0
-        self._min_request_interval = 0.2  # 5 requests per second max
+        # トークンバケットによるレート制限（5 requests per second, バースト5件まで）
+        self._rate_per_second = 5.0
+        self._bucket_capacity = 5.0
+        self._tokens = self._bucket_capacity
+        self._last_refill = time.monotonic()
+        self._rate_limit_lock = threading.Lock()
+        self._response_cache = _TTLCache(self.CACHE_MAXSIZE)
+        self._inflight: dict[Hashable, Future[dict[str, Any]]] = {}
+        self._inflight_lock = threading.Lock()
+        # 接続テスト結果（有効期限, 結果）
+        self._connection_status: Optional[tuple[float, bool]] = None
 
     def _create_session(self) -> requests.Session:
         """HTTPセッションを作成"""
         session = requests.Session()
 
         # リトライ戦略設定
+        # - Retry-After ヘッダーを優先し、無い場合は指数バックオフ+ジッター
+        # - 冪等なメソッドのみ自動リトライ
+        # - リトライ上限到達時は最後のレスポンスを返し、ステータスに応じたエラーにする
         retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
+            total=5,
+            backoff_factor=0.5,
+            backoff_jitter=0.5,
+            backoff_max=10,
             status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        # 接続先は単一ホストのため、1プールで並行リクエスト分の接続を保持する
+        pool_maxsize = self.config.redmine.pool_maxsize
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=pool_maxsize,
+            pool_maxsize=pool_maxsize,
+            pool_block=False,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
@@ -57,6 +179,9 @@ class RedmineClient:
         session.headers.update(
             {
                 "Content-Type": "application/json",
+                "Accept": "application/json",
+                "Accept-Encoding": "gzip, deflate",
+                "User-Agent": f"rd-burndown/{__version__}",
                 "X-Redmine-API-Key": self.api_key,
             }
         )
@@ -64,23 +189,41 @@ class RedmineClient:
         return session
 
     def _rate_limit(self) -> None:
-        """レート制限実装"""
-        current_time = time.time()
-        elapsed = current_time - self._last_request_time
+        """レート制限実装（トークンバケット・スレッドセーフ）
+
+        バケット容量までのバーストは待機なしで送信し、
+        それを超える持続的なリクエストのみ補充レートに合わせて待機する。
+        """
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._tokens = min(
+                self._bucket_capacity, self._tokens + elapsed * self._rate_per_second
+            )
+            self._last_refill = now
 
-        if elapsed < self._min_request_interval:
-            time.sleep(self._min_request_interval - elapsed)
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return
 
-        self._last_request_time = time.time()
+            # 1トークン分が補充されるまで待機し、そのトークンを消費する
+            wait = (1.0 - self._tokens) / self._rate_per_second
+            time.sleep(wait)
+            self._tokens = 0.0
+            self._last_refill = now + wait
 
-    def _make_request(
+    def _send_request(
         self,
         method: str,
         endpoint: str,
         params: Optional[dict[str, Any]] = None,
         data: Optional[dict[str, Any]] = None,
-    ) -> dict[str, Any]:
-        """API リクエスト実行"""
+        headers: Optional[dict[str, str]] = None,
+    ) -> requests.Response:
+        """API リクエスト送信（ステータス検証済みのレスポンスを返す）
+
+        304 Not Modified はエラーとせずそのまま返す。
+        """
         self._rate_limit()
 
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
@@ -91,40 +234,132 @@ class RedmineClient:
                 url=url,
                 params=params,
                 json=data,
+                headers=headers,
                 timeout=self.timeout,
                 verify=self.verify_ssl,
             )
-
-            if response.status_code == 401:
-                raise RedmineAPIError(
-                    "認証に失敗しました。APIキーを確認してください。",
-                    response.status_code,
-                )
-            if response.status_code == 403:
-                raise RedmineAPIError(
-                    "アクセス権限がありません。", response.status_code
-                )
-            if response.status_code == 404:
-                raise RedmineAPIError(
-                    "リソースが見つかりません。", response.status_code
-                )
-            if not response.ok:
-                raise RedmineAPIError(
-                    f"API エラー: {response.status_code} - {response.text}",
-                    response.status_code,
-                )
-
-            return response.json()
-
         except requests.exceptions.ConnectionError as e:
             raise RedmineAPIError(f"接続エラー: {e}") from e
         except requests.exceptions.Timeout as e:
             raise RedmineAPIError(f"タイムアウトエラー: {e}") from e
         except requests.exceptions.RequestException as e:
             raise RedmineAPIError(f"リクエストエラー: {e}") from e
+
+        if response.status_code == 401:
+            raise RedmineAPIError(
+                "認証に失敗しました。APIキーを確認してください。",
+                response.status_code,
+            )
+        if response.status_code == 403:
+            raise RedmineAPIError("アクセス権限がありません。", response.status_code)
+        if response.status_code == 404:
+            raise RedmineAPIError("リソースが見つかりません。", response.status_code)
+        if not response.ok:
+            raise RedmineAPIError(
+                f"API エラー: {response.status_code} - {response.text}",
+                response.status_code,
+            )
+
+        return response
+
+    @staticmethod
+    def _decode_response(response: requests.Response) -> dict[str, Any]:
+        """レスポンスボディのデコード"""
+        try:
+            return _decode_json(response)
         except json.JSONDecodeError as e:
             raise RedmineAPIError(f"JSON パースエラー: {e}") from e
 
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        data: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """API リクエスト実行"""
+        response = self._send_request(method, endpoint, params=params, data=data)
+        return self._decode_response(response)
+
+    def _conditional_get(
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]],
+        stale: Optional[_CachedResponse],
+    ) -> _CachedResponse:
+        """条件付き GET リクエスト実行
+
+        期限切れのキャッシュがあれば If-None-Match / If-Modified-Since を付与し、
+        304 Not Modified の場合はボディを受信・デコードせずキャッシュ内容を再利用する。
+        """
+        headers: dict[str, str] = {}
+        if stale is not None:
+            if stale.etag:
+                headers["If-None-Match"] = stale.etag
+            if stale.last_modified:
+                headers["If-Modified-Since"] = stale.last_modified
+
+        response = self._send_request(
+            "GET", endpoint, params=params, headers=headers or None
+        )
+        if response.status_code == 304 and stale is not None:
+            return stale
+
+        return _CachedResponse(
+            payload=self._decode_response(response),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    def _cached_get(
+        self,
+        endpoint: str,
+        ttl: float,
+        params: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """キャッシュ付き GET リクエスト（冪等なエンドポイント用）
+
+        同一キーのリクエストが実行中の場合は新たに送信せず、その結果を待つ。
+        呼び出し元での変更がキャッシュに波及しないよう、常に複製を返す。
+        """
+        key = (endpoint, tuple(sorted((params or {}).items())))
+
+        with self._inflight_lock:
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                return copy.deepcopy(cached.payload)
+
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if future is None:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_leader:
+            return copy.deepcopy(future.result())
+
+        try:
+            entry = self._conditional_get(
+                endpoint, params, self._response_cache.get_stale(key)
+            )
+        except BaseException as e:
+            with self._inflight_lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+
+        # 304 の場合も同じエントリで有効期限を延長する
+        with self._inflight_lock:
+            self._response_cache.set(key, entry, ttl)
+            del self._inflight[key]
+        future.set_result(entry.payload)
+        return copy.deepcopy(entry.payload)
+
+    def clear_cache(self) -> None:
+        """GET レスポンスキャッシュと接続テスト結果をクリア"""
+        self._response_cache.clear()
+        self._connection_status = None
+
     def get_projects(self, include_closed: bool = False) -> list[dict[str, Any]]:
         """プロジェクト一覧取得"""
         params = {
@@ -144,8 +379,8 @@ class RedmineClient:
             "include": "enabled_modules,versions,issue_categories,time_entry_activities",
         }
 
-        response = self._make_request(
-            "GET", f"/projects/{project_id}.json", params=params
+        response = self._cached_get(
+            f"/projects/{project_id}.json", self.RESOURCE_CACHE_TTL, params=params
         )
         return response.get("project", {})
 
@@ -154,19 +389,29 @@ class RedmineClient:
         project_id: int,
         limit: int = 100,
         offset: int = 0,
-        updated_since: Optional[datetime] = None,
+        updated_since: Optional[Union[datetime, str]] = None,
         include_closed: bool = True,
+        include: str = "",
     ) -> dict[str, Any]:
-        """チケット一覧取得"""
-        params = {
+        """チケット一覧取得
+
+        Args:
+            updated_since: 更新日時の下限。ページング時に毎回フォーマットしないよう
+                _format_timestamp 済みの文字列も受け付ける。
+            include: 追加取得する関連データ（例: "journals"）。
+                ペイロードが大きくなるため必要な場合のみ指定する。
+        """
+        params: dict[str, Any] = {
             "project_id": project_id,
-            "limit": min(limit, 100),  # API制限
+            "limit": min(limit, self.config.redmine.max_per_page),  # API制限
             "offset": offset,
-            "include": "journals,relations",
         }
 
+        if include:
+            params["include"] = include
+
         if updated_since:
-            params["updated_on"] = f">={updated_since.strftime('%Y-%m-%dT%H:%M:%SZ')}"
+            params["updated_on"] = f">={_format_timestamp(updated_since)}"
 
         if include_closed:
             params["status_id"] = "*"  # 全ステータス（完了チケットも含む）
@@ -197,18 +442,25 @@ class RedmineClient:
     def get_project_journals(
         self,
         project_id: int,
-        limit: int = 100,
+        limit: Optional[int] = None,
         offset: int = 0,
         updated_since: Optional[datetime] = None,
     ) -> list[dict[str, Any]]:
-        """プロジェクトの全チケットのjournalsを取得"""
+        """プロジェクトの全チケットのjournalsを取得
+
+        Args:
+            limit: 1ページの件数（Noneの場合は max_per_page）。get_issues と同様に
+                max_per_page で切り詰められるため、次ページの offset は
+                max_per_page 以下の件数で進めること。
+        """
         # まずプロジェクトの全チケットを取得
         issues_response = self.get_issues(
             project_id=project_id,
-            limit=limit,
+            limit=limit or self.config.redmine.max_per_page,
             offset=offset,
             updated_since=updated_since,
             include_closed=True,
+            include="journals",
         )
 
         all_journals = []
@@ -232,14 +484,15 @@ class RedmineClient:
         """プロジェクトの全journalsを取得（ページング対応）"""
         all_journals: list[dict[str, Any]] = []
         offset = 0
-        limit = 100
+        limit = self.config.redmine.max_per_page
+        updated_since_str = _format_timestamp(updated_since) if updated_since else None
 
         while True:
             response = self.get_issues(
                 project_id=project_id,
                 limit=limit,
                 offset=offset,
-                updated_since=updated_since,
+                updated_since=updated_since_str,
                 include_closed=True,
             )
 
@@ -263,58 +516,140 @@ class RedmineClient:
                     logger.warning(f"Failed to get journals for issue {issue_id}: {e}")
                     continue
 
-            # ページング判定
-            total_count = response.get("total_count", 0)
-            if offset + limit >= total_count:
-                break
-
+            # ページング判定（サーバーが切り詰めたページサイズで進める）
+            limit = self._effective_page_size(response, limit)
             offset += limit
+            if offset >= response.get("total_count", 0):
+                break
 
         return all_journals
 
+    @staticmethod
+    def _effective_page_size(first_response: dict[str, Any], requested: int) -> int:
+        """サーバーが実際に適用したページサイズを判定
+
+        Redmine はサーバー設定の上限を超える limit を黙って切り詰めるため、
+        レスポンスの limit（無い場合は要求値）を採用する。
+        """
+        applied = first_response.get("limit", requested)
+        if not isinstance(applied, int) or applied <= 0:
+            return requested
+        return min(applied, requested)
+
+    def _page_concurrency(self, page_count: int) -> int:
+        """ページ並行取得の同時実行数を算出
+
+        接続プールの上限を超えた接続は keep-alive されずに破棄され、
+        高レイテンシ環境ではハンドシェイクのコストが支配的になるため、
+        同時実行数をプールサイズ以下に抑えて既存接続を再利用させる。
+        """
+        return max(
+            1,
+            min(
+                self.MAX_PAGE_WORKERS,
+                self.config.redmine.pool_maxsize,
+                math.ceil(self._bucket_capacity),
+                page_count,
+            ),
+        )
+
     def get_all_project_issues(
         self,
         project_id: int,
         updated_since: Optional[datetime] = None,
         include_closed: bool = True,
     ) -> list[dict[str, Any]]:
-        """プロジェクトの全チケット取得（ページング対応）"""
-        all_issues: list[dict[str, Any]] = []
-        offset = 0
-        limit = 100
+        """プロジェクトの全チケット取得（ページング対応）
 
-        while True:
-            response = self.get_issues(
-                project_id=project_id,
-                limit=limit,
-                offset=offset,
-                updated_since=updated_since,
-                include_closed=include_closed,
-            )
+        1ページ目の total_count から残りページのオフセットを算出し、
+        2ページ目以降はスレッドプールで並行取得する（レート制限は共有）。
+        """
+        fetch = functools.partial(
+            self.get_issues,
+            project_id=project_id,
+            updated_since=_format_timestamp(updated_since) if updated_since else None,
+            include_closed=include_closed,
+        )
 
-            issues = response.get("issues", [])
-            if not issues:
-                break
+        limit = self.config.redmine.max_per_page
+        first_response = fetch(limit=limit, offset=0)
+        all_issues: list[dict[str, Any]] = list(first_response.get("issues", []))
+        if not all_issues:
+            return all_issues
+
+        # ページング判定
+        total_count = first_response.get("total_count", 0)
+        page_size = self._effective_page_size(first_response, limit)
+        offsets = range(page_size, total_count, page_size)
+        if not offsets:
+            return all_issues
+
+        def fetch_page(offset: int) -> list[dict[str, Any]]:
+            return fetch(limit=page_size, offset=offset).get("issues", [])
+
+        with ThreadPoolExecutor(
+            max_workers=self._page_concurrency(len(offsets))
+        ) as executor:
+            # map は投入順に結果を返すため、オフセット順が保たれる
+            for issues in executor.map(fetch_page, offsets):
+                all_issues.extend(issues)
 
-            all_issues.extend(issues)
+        return all_issues
 
-            # ページング判定
-            total_count = response.get("total_count", 0)
-            if offset + limit >= total_count:
-                break
+    async def get_all_project_issues_async(
+        self,
+        project_id: int,
+        updated_since: Optional[datetime] = None,
+        include_closed: bool = True,
+    ) -> list[dict[str, Any]]:
+        """プロジェクトの全チケット取得（非同期版）
 
-            offset += limit
+        2ページ目以降を asyncio.gather で並行取得する。HTTP 通信は既存の
+        セッションをワーカースレッド上で実行し、レート制限を共有する。
+        """
+        fetch = functools.partial(
+            self.get_issues,
+            project_id=project_id,
+            updated_since=_format_timestamp(updated_since) if updated_since else None,
+            include_closed=include_closed,
+        )
+
+        limit = self.config.redmine.max_per_page
+        first_response = await asyncio.to_thread(fetch, limit=limit, offset=0)
+        all_issues: list[dict[str, Any]] = list(first_response.get("issues", []))
+        if not all_issues:
+            return all_issues
+
+        total_count = first_response.get("total_count", 0)
+        page_size = self._effective_page_size(first_response, limit)
+        offsets = range(page_size, total_count, page_size)
+        if not offsets:
+            return all_issues
+
+        semaphore = asyncio.Semaphore(self._page_concurrency(len(offsets)))
+
+        async def fetch_page(offset: int) -> list[dict[str, Any]]:
+            async with semaphore:
+                response = await asyncio.to_thread(
+                    fetch, limit=page_size, offset=offset
+                )
+            return response.get("issues", [])
+
+        # gather は投入順に結果を返すため、オフセット順が保たれる
+        pages = await asyncio.gather(*(fetch_page(offset) for offset in offsets))
+        for issues in pages:
+            all_issues.extend(issues)
 
         return all_issues
 
     def get_issue_statuses(self) -> list[dict[str, Any]]:
         """チケットステータス一覧取得"""
-        response = self._make_request("GET", "/issue_statuses.json")
+        response = self._cached_get("/issue_statuses.json", self.MASTER_CACHE_TTL)
         return response.get("issue_statuses", [])
 
     def get_trackers(self) -> list[dict[str, Any]]:
         """トラッカー一覧取得"""
-        response = self._make_request("GET", "/trackers.json")
+        response = self._cached_get("/trackers.json", self.MASTER_CACHE_TTL)
         return response.get("trackers", [])
 
     def get_users(self, project_id: Optional[int] = None) -> list[dict[str, Any]]:
@@ -323,35 +658,63 @@ class RedmineClient:
 
         if project_id is not None:
             # プロジェクトメンバーのみ取得
+            return self._get_project_member_users(project_id)
+        response = self._make_request("GET", "/users.json", params=params)
+        return response.get("users", [])
+
+    def _get_project_member_users(self, project_id: int) -> list[dict[str, Any]]:
+        """プロジェクトメンバーのユーザーを全ページ取得
+
+        グループのメンバーシップ（user を持たないもの）は除外する。
+        """
+        endpoint = f"/projects/{project_id}/memberships.json"
+        limit = self.config.redmine.max_per_page
+        offset = 0
+        users: list[dict[str, Any]] = []
+
+        while True:
             response = self._make_request(
-                "GET", f"/projects/{project_id}/memberships.json", params=params
+                "GET", endpoint, params={"limit": limit, "offset": offset}
             )
             memberships = response.get("memberships", [])
-            users: list[dict[str, Any]] = []
-            for membership in memberships:
-                user = membership.get("user")
-                if user:
-                    users.append(user)
-            return users
-        response = self._make_request("GET", "/users.json", params=params)
-        return response.get("users", [])
+            users.extend(m["user"] for m in memberships if m.get("user"))
+
+            limit = self._effective_page_size(response, limit)
+            offset += limit
+            if not memberships or offset >= response.get("total_count", 0):
+                return users
 
     def get_versions(self, project_id: int) -> list[dict[str, Any]]:
         """バージョン一覧取得"""
-        response = self._make_request("GET", f"/projects/{project_id}/versions.json")
+        response = self._cached_get(
+            f"/projects/{project_id}/versions.json", self.RESOURCE_CACHE_TTL
+        )
         return response.get("versions", [])
 
     def test_connection(self) -> bool:
-        """接続テスト"""
+        """接続テスト
+
+        ボディは不要なため HEAD リクエストで確認し、結果（失敗も含む）を
+        CONNECTION_CHECK_TTL 秒間キャッシュする。
+        """
+        now = time.monotonic()
+        if self._connection_status is not None:
+            expires_at, result = self._connection_status
+            if expires_at > now:
+                return result
+
         try:
-            self._make_request("GET", "/users/current.json")
-            return True
+            self._send_request("HEAD", "/users/current.json")
+            result = True
         except RedmineAPIError:
-            return False
+            result = False
+
+        self._connection_status = (now + self.CONNECTION_CHECK_TTL, result)
+        return result
 
     def get_current_user(self) -> dict[str, Any]:
         """現在のユーザー情報取得"""
-        response = self._make_request("GET", "/users/current.json")
+        response = self._cached_get("/users/current.json", self.RESOURCE_CACHE_TTL)
         return response.get("user", {})
 
     def get_project_data(self, project_id: int) -> RedmineProject:
@@ -368,10 +731,10 @@ class RedmineClient:
         for field in custom_fields:
             if field.get("name") == "開始日" and field.get("value"):
                 with contextlib.suppress(ValueError, TypeError):
-                    start_date = datetime.fromisoformat(field["value"]).date()
+                    start_date = _parse_datetime(field["value"]).date()
             elif field.get("name") == "終了日" and field.get("value"):
                 with contextlib.suppress(ValueError, TypeError):
-                    end_date = datetime.fromisoformat(field["value"]).date()
+                    end_date = _parse_datetime(field["value"]).date()
 
         return RedmineProject(
             id=project_data["id"],
@@ -379,8 +742,8 @@ class RedmineClient:
             identifier=project_data["identifier"],
             description=project_data.get("description", ""),
             status=project_data.get("status", 1),
-            created_on=datetime.fromisoformat(project_data["created_on"]),
-            updated_on=datetime.fromisoformat(project_data["updated_on"]),
+            created_on=_parse_datetime(project_data["created_on"]),
+            updated_on=_parse_datetime(project_data["updated_on"]),
             start_date=start_date,
             end_date=end_date,
             versions=versions,
@@ -401,11 +764,38 @@ class RedmineClient:
             project_id=project_id, include_closed=include_closed
         )
 
-        tickets = []
-        for issue in issues_data:
-            tickets.append(self._convert_issue_to_ticket(issue))
+        return [self._convert_issue_to_ticket(issue) for issue in issues_data]
+
+    def iter_project_tickets(
+        self, project_id: int, include_closed: bool = True
+    ) -> Iterator[TicketData]:
+        """プロジェクトのチケットをページ単位で逐次取得して TicketData を返す
+
+        全件の Issue データをメモリに保持せず、取得したページを変換した時点で
+        元データを破棄するため、大規模プロジェクトでのピークメモリを抑えられる。
+        """
+        limit = self.config.redmine.max_per_page
+        offset = 0
+
+        while True:
+            response = self.get_issues(
+                project_id=project_id,
+                limit=limit,
+                offset=offset,
+                include_closed=include_closed,
+            )
+            issues = response.get("issues", [])
+            if not issues:
+                return
+
+            for issue in issues:
+                yield self._convert_issue_to_ticket(issue)
 
-        return tickets
+            # ページング判定（サーバー側で切り詰められたページサイズに追従）
+            limit = self._effective_page_size(response, limit)
+            offset += limit
+            if offset >= response.get("total_count", 0):
+                return
 
     def get_updated_tickets(
         self, project_id: int, since_date: Optional[date] = None
@@ -419,49 +809,32 @@ class RedmineClient:
             project_id=project_id, updated_since=updated_since, include_closed=True
         )
 
-        tickets = []
-        for issue in issues_data:
-            tickets.append(self._convert_issue_to_ticket(issue))
-
-        return tickets
+        return [self._convert_issue_to_ticket(issue) for issue in issues_data]
 
     def _convert_issue_to_ticket(self, issue: dict[str, Any]) -> TicketData:
         """IssueデータをTicketDataオブジェクトに変換"""
-        # 担当者情報
-        assigned_to_id = None
-        assigned_to_name = None
-        assigned_to = issue.get("assigned_to")
-        if assigned_to:
-            assigned_to_id = assigned_to.get("id")
-            assigned_to_name = assigned_to.get("name")
-
-        # バージョン情報
-        version_id = None
-        version_name = None
-        fixed_version = issue.get("fixed_version")
-        if fixed_version:
-            version_id = fixed_version.get("id")
-            version_name = fixed_version.get("name")
-
-        # カスタムフィールド
-        custom_fields = {}
-        for field in issue.get("custom_fields", []):
-            custom_fields[field["name"]] = field.get("value")
+        # チケットごとに呼ばれるため、辞書参照と分岐を最小限にする
+        status = issue["status"]
+        assigned_to = issue.get("assigned_to") or {}
+        fixed_version = issue.get("fixed_version") or {}
 
         return TicketData(
             id=issue["id"],
             subject=issue["subject"],
             estimated_hours=issue.get("estimated_hours"),
-            created_on=datetime.fromisoformat(issue["created_on"]),
-            updated_on=datetime.fromisoformat(issue["updated_on"]),
-            status_id=issue["status"]["id"],
-            status_name=issue["status"]["name"],
-            assigned_to_id=assigned_to_id,
-            assigned_to_name=assigned_to_name,
+            created_on=_parse_datetime(issue["created_on"]),
+            updated_on=_parse_datetime(issue["updated_on"]),
+            status_id=status["id"],
+            status_name=status["name"],
+            assigned_to_id=assigned_to.get("id"),
+            assigned_to_name=assigned_to.get("name"),
             project_id=issue["project"]["id"],
-            version_id=version_id,
-            version_name=version_name,
-            custom_fields=custom_fields,
+            version_id=fixed_version.get("id"),
+            version_name=fixed_version.get("name"),
+            custom_fields={
+                field["name"]: field.get("value")
+                for field in issue.get("custom_fields", ())
+            },
         )
 
 
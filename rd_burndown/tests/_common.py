@@ -0,0 +1,22 @@
+"""テスト共通の定数
+
+conftest.py と各テストモジュールで共有するサンプルデータ用の日付・日時。
+インポート時に1回だけ生成する。
+"""
+
+from datetime import date, datetime
+
+DATE_0101 = date(2024, 1, 1)
+DATE_0110 = date(2024, 1, 10)
+DATE_0115 = date(2024, 1, 15)
+DATE_0120 = date(2024, 1, 20)
+DATE_0125 = date(2024, 1, 25)
+DATE_0131 = date(2024, 1, 31)
+DATE_0331 = date(2024, 3, 31)
+DATETIME_0101_0900 = datetime(2024, 1, 1, 9, 0, 0)
+DATETIME_0102_1000 = datetime(2024, 1, 2, 10, 0, 0)
+DATETIME_0103_1100 = datetime(2024, 1, 3, 11, 0, 0)
+DATETIME_0105_1700 = datetime(2024, 1, 5, 17, 0, 0)
+DATETIME_0110_1600 = datetime(2024, 1, 10, 16, 0, 0)
+DATETIME_0115_1700 = datetime(2024, 1, 15, 17, 0, 0)
+DATETIME_0115_1800 = datetime(2024, 1, 15, 18, 0, 0)
@@ -1,13 +1,17 @@
 """pytest設定とフィクスチャ"""
 
-import tempfile
+import os
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import asdict
-from datetime import date, datetime
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Optional
 from unittest.mock import Mock
+from uuid import uuid4
 
+import click
 import pytest
+from click.testing import CliRunner
 
 from rd_burndown.core.models import (
     DailySnapshot,
@@ -16,14 +20,124 @@ from rd_burndown.core.models import (
     ScopeChange,
     TicketData,
 )
+from rd_burndown.tests._common import (
+    DATE_0101,
+    DATE_0110,
+    DATE_0115,
+    DATE_0120,
+    DATE_0125,
+    DATE_0131,
+    DATE_0331,
+    DATETIME_0101_0900,
+    DATETIME_0102_1000,
+    DATETIME_0103_1100,
+    DATETIME_0105_1700,
+    DATETIME_0110_1600,
+    DATETIME_0115_1700,
+    DATETIME_0115_1800,
+)
 from rd_burndown.utils.config import Config, ConfigManager
 
+# テストでは日本語フォントの探索を省略する（chart_generator を読み込む前に設定）
+os.environ.setdefault("RD_BURNDOWN_SKIP_FONT_PROBE", "1")
+
+# モックRedmine APIレスポンス（インポート時に1回だけ構築し、読み取り専用ビューで共有する）
+_MOCK_REDMINE_API_RESPONSE: Mapping[str, Any] = MappingProxyType(
+    {
+        "projects": [
+            {
+                "id": 1,
+                "name": "テストプロジェクト",
+                "identifier": "test-project",
+                "description": "テスト用プロジェクト",
+                "status": 1,
+                "created_on": "2024-01-01T09:00:00Z",
+                "updated_on": "2024-01-15T17:00:00Z",
+            }
+        ],
+        "issues": [
+            {
+                "id": 1,
+                "subject": "テストチケット",
+                "estimated_hours": 8.0,
+                "created_on": "2024-01-01T09:00:00Z",
+                "updated_on": "2024-01-05T17:00:00Z",
+                "status": {"id": 1, "name": "新規"},
+                "project": {"id": 1, "name": "テストプロジェクト"},
+                "assigned_to": {"id": 100, "name": "山田太郎"},
+                "fixed_version": {"id": 1, "name": "v1.0.0"},
+            }
+        ],
+        "users": [
+            {
+                "id": 1,
+                "login": "admin",
+                "firstname": "管理者",
+                "lastname": "ユーザー",
+                "mail": "admin@example.com",
+                "admin": True,
+            }
+        ],
+        "issue_statuses": [
+            {"id": 1, "name": "新規"},
+            {"id": 2, "name": "進行中"},
+            {"id": 3, "name": "完了"},
+        ],
+        "trackers": [
+            {"id": 1, "name": "バグ"},
+            {"id": 2, "name": "機能"},
+            {"id": 3, "name": "サポート"},
+        ],
+    }
+)
+
+
+@pytest.fixture(scope="session")
+def temp_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """一時ディレクトリフィクスチャ（セッション共有）"""
+    return tmp_path_factory.mktemp("rd_burndown")
+
 
 @pytest.fixture
-def temp_dir():
-    """一時ディレクトリフィクスチャ"""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        yield Path(tmp_dir)
+def fresh_temp_dir(temp_dir: Path) -> Path:
+    """テストごとに独立した一時ディレクトリフィクスチャ"""
+    path = temp_dir / f"t{uuid4().hex}"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    """CLIテスト用ランナーフィクスチャ
+
+    CliRunner は invoke ごとに入出力を新たに用意し状態を持ち越さないため、
+    モジュール内で共有する。
+    """
+    return CliRunner()
+
+
+def _invoke_in_process(
+    command: click.Command, args: Sequence[str], obj: Optional[Any] = None
+) -> None:
+    """CliRunner を介さずにコマンドを同一プロセス内で実行する"""
+    with command.make_context(command.name, list(args), obj=obj) as ctx:
+        command.invoke(ctx)
+
+
+@pytest.fixture
+def invoke_in_process() -> Callable[..., None]:
+    """モックのみで正常終了を確認するCLIテスト用の直接実行フィクスチャ
+
+    標準入出力の差し替えと終了コードへの変換を省略し、例外はそのまま送出する。
+    エラー時の終了コードや出力内容を検証するテストでは runner を使用すること。
+    """
+    return _invoke_in_process
+
+
+@pytest.fixture
+def cfg_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """テストごとの設定ファイルパスフィクスチャ（ファイルは作成しない）"""
+    return tmp_path_factory.mktemp("cfg", numbered=True) / "config.yaml"
 
 
 @pytest.fixture
@@ -38,22 +152,24 @@ def sample_config() -> Config:
     return config
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config_manager(temp_dir: Path) -> ConfigManager:
     """設定マネージャーフィクスチャ"""
     config_path = temp_dir / "test-config.yaml"
     return ConfigManager(config_path)
 
 
-@pytest.fixture
+# 以下のサンプルデータは参照専用のため、セッション全体で1回だけ生成する。
+# テスト内で変更する場合はコピーしてから使用すること。
+@pytest.fixture(scope="session")
 def sample_ticket() -> TicketData:
     """サンプルチケットフィクスチャ"""
     return TicketData(
         id=1,
         subject="テストチケット",
         estimated_hours=8.0,
-        created_on=datetime(2024, 1, 1, 9, 0, 0),
-        updated_on=datetime(2024, 1, 5, 17, 0, 0),
+        created_on=DATETIME_0101_0900,
+        updated_on=DATETIME_0105_1700,
         status_id=1,
         status_name="新規",
         assigned_to_id=100,
@@ -65,7 +181,7 @@ def sample_ticket() -> TicketData:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tickets() -> list[TicketData]:
     """サンプルチケット群フィクスチャ"""
     return [
@@ -73,8 +189,8 @@ def sample_tickets() -> list[TicketData]:
             id=1,
             subject="ユーザー認証機能",
             estimated_hours=16.0,
-            created_on=datetime(2024, 1, 1, 9, 0, 0),
-            updated_on=datetime(2024, 1, 5, 17, 0, 0),
+            created_on=DATETIME_0101_0900,
+            updated_on=DATETIME_0105_1700,
             status_id=1,
             status_name="新規",
             assigned_to_id=100,
@@ -88,8 +204,8 @@ def sample_tickets() -> list[TicketData]:
             id=2,
             subject="データベース設計",
             estimated_hours=8.0,
-            created_on=datetime(2024, 1, 2, 10, 0, 0),
-            updated_on=datetime(2024, 1, 10, 16, 0, 0),
+            created_on=DATETIME_0102_1000,
+            updated_on=DATETIME_0110_1600,
             status_id=3,  # 完了
             status_name="完了",
             assigned_to_id=101,
@@ -103,8 +219,8 @@ def sample_tickets() -> list[TicketData]:
             id=3,
             subject="API実装",
             estimated_hours=24.0,
-            created_on=datetime(2024, 1, 3, 11, 0, 0),
-            updated_on=datetime(2024, 1, 15, 18, 0, 0),
+            created_on=DATETIME_0103_1100,
+            updated_on=DATETIME_0115_1800,
             status_id=2,
             status_name="進行中",
             assigned_to_id=102,
@@ -117,11 +233,11 @@ def sample_tickets() -> list[TicketData]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_snapshot() -> DailySnapshot:
     """サンプルスナップショットフィクスチャ"""
     return DailySnapshot(
-        date=date(2024, 1, 15),
+        date=DATE_0115,
         project_id=1,
         total_estimated_hours=100.0,
         completed_hours=30.0,
@@ -134,12 +250,12 @@ def sample_snapshot() -> DailySnapshot:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_snapshots() -> list[DailySnapshot]:
     """サンプルスナップショット群フィクスチャ"""
     return [
         DailySnapshot(
-            date=date(2024, 1, 1),
+            date=DATE_0101,
             project_id=1,
             total_estimated_hours=100.0,
             completed_hours=0.0,
@@ -151,7 +267,7 @@ def sample_snapshots() -> list[DailySnapshot]:
             completed_ticket_count=0,
         ),
         DailySnapshot(
-            date=date(2024, 1, 15),
+            date=DATE_0115,
             project_id=1,
             total_estimated_hours=105.0,
             completed_hours=30.0,
@@ -163,7 +279,7 @@ def sample_snapshots() -> list[DailySnapshot]:
             completed_ticket_count=2,
         ),
         DailySnapshot(
-            date=date(2024, 1, 31),
+            date=DATE_0131,
             project_id=1,
             total_estimated_hours=105.0,
             completed_hours=105.0,
@@ -177,11 +293,11 @@ def sample_snapshots() -> list[DailySnapshot]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_scope_change() -> ScopeChange:
     """サンプルスコープ変更フィクスチャ"""
     return ScopeChange(
-        date=date(2024, 1, 10),
+        date=DATE_0110,
         project_id=1,
         change_type="added",
         ticket_id=123,
@@ -193,12 +309,12 @@ def sample_scope_change() -> ScopeChange:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_scope_changes() -> list[ScopeChange]:
     """サンプルスコープ変更群フィクスチャ"""
     return [
         ScopeChange(
-            date=date(2024, 1, 10),
+            date=DATE_0110,
             project_id=1,
             change_type="added",
             ticket_id=123,
@@ -209,7 +325,7 @@ def sample_scope_changes() -> list[ScopeChange]:
             reason="要件追加",
         ),
         ScopeChange(
-            date=date(2024, 1, 20),
+            date=DATE_0120,
             project_id=1,
             change_type="modified",
             ticket_id=124,
@@ -220,7 +336,7 @@ def sample_scope_changes() -> list[ScopeChange]:
             reason="仕様変更",
         ),
         ScopeChange(
-            date=date(2024, 1, 25),
+            date=DATE_0125,
             project_id=1,
             change_type="removed",
             ticket_id=125,
@@ -233,7 +349,7 @@ def sample_scope_changes() -> list[ScopeChange]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_project() -> RedmineProject:
     """サンプルプロジェクトフィクスチャ"""
     return RedmineProject(
@@ -242,10 +358,10 @@ def sample_project() -> RedmineProject:
         identifier="test-project",
         description="テスト用プロジェクト",
         status=1,
-        created_on=datetime(2024, 1, 1, 9, 0, 0),
-        updated_on=datetime(2024, 1, 15, 17, 0, 0),
-        start_date=date(2024, 1, 1),
-        end_date=date(2024, 3, 31),
+        created_on=DATETIME_0101_0900,
+        updated_on=DATETIME_0115_1700,
+        start_date=DATE_0101,
+        end_date=DATE_0331,
         versions=[
             {"id": 1, "name": "v1.0.0", "status": "open"},
             {"id": 2, "name": "v1.1.0", "status": "open"},
@@ -255,7 +371,7 @@ def sample_project() -> RedmineProject:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_timeline(
     sample_snapshots: list[DailySnapshot], sample_scope_changes: list[ScopeChange]
 ) -> ProjectTimeline:
@@ -263,67 +379,63 @@ def sample_timeline(
     return ProjectTimeline(
         project_id=1,
         project_name="テストプロジェクト",
-        start_date=date(2024, 1, 1),
-        end_date=date(2024, 1, 31),
+        start_date=DATE_0101,
+        end_date=DATE_0131,
         snapshots=[asdict(snapshot) for snapshot in sample_snapshots],
         scope_changes=[asdict(change) for change in sample_scope_changes],
     )
 
 
-@pytest.fixture
-def mock_redmine_api_response() -> dict[str, Any]:
-    """モックRedmine APIレスポンスフィクスチャ"""
-    return {
-        "projects": [
-            {
-                "id": 1,
-                "name": "テストプロジェクト",
-                "identifier": "test-project",
-                "description": "テスト用プロジェクト",
-                "status": 1,
-                "created_on": "2024-01-01T09:00:00Z",
-                "updated_on": "2024-01-15T17:00:00Z",
-            }
-        ],
-        "issues": [
-            {
-                "id": 1,
-                "subject": "テストチケット",
-                "estimated_hours": 8.0,
-                "created_on": "2024-01-01T09:00:00Z",
-                "updated_on": "2024-01-05T17:00:00Z",
-                "status": {"id": 1, "name": "新規"},
-                "project": {"id": 1, "name": "テストプロジェクト"},
-                "assigned_to": {"id": 100, "name": "山田太郎"},
-                "fixed_version": {"id": 1, "name": "v1.0.0"},
-            }
-        ],
-        "users": [
-            {
-                "id": 1,
-                "login": "admin",
-                "firstname": "管理者",
-                "lastname": "ユーザー",
-                "mail": "admin@example.com",
-                "admin": True,
-            }
-        ],
-        "issue_statuses": [
-            {"id": 1, "name": "新規"},
-            {"id": 2, "name": "進行中"},
-            {"id": 3, "name": "完了"},
-        ],
-        "trackers": [
-            {"id": 1, "name": "バグ"},
-            {"id": 2, "name": "機能"},
-            {"id": 3, "name": "サポート"},
+@pytest.fixture(scope="session")
+def empty_timeline() -> ProjectTimeline:
+    """スナップショットなしのタイムラインフィクスチャ"""
+    return ProjectTimeline(
+        project_id=1,
+        project_name="Test",
+        start_date=DATE_0101,
+        end_date=DATE_0110,
+        snapshots=[],
+        scope_changes=[],
+    )
+
+
+@pytest.fixture(scope="session")
+def insufficient_timeline() -> ProjectTimeline:
+    """スナップショットが1件のみのタイムラインフィクスチャ"""
+    return ProjectTimeline(
+        project_id=1,
+        project_name="Test",
+        start_date=DATE_0101,
+        end_date=DATE_0110,
+        snapshots=[{"date": "2024-01-01", "remaining_hours": 100.0}],
+        scope_changes=[],
+    )
+
+
+@pytest.fixture(scope="session")
+def completed_timeline() -> ProjectTimeline:
+    """残工数が0（完了済み）のタイムラインフィクスチャ"""
+    return ProjectTimeline(
+        project_id=1,
+        project_name="Test",
+        start_date=DATE_0101,
+        end_date=DATE_0110,
+        snapshots=[
+            {"date": "2024-01-05", "remaining_hours": 0.0, "completed_hours": 100.0}
         ],
-    }
+        scope_changes=[],
+    )
 
 
-@pytest.fixture
-def mock_redmine_client():
-    """モックRedmineクライアントフィクスチャ"""
+@pytest.fixture(scope="session")
+def mock_redmine_api_response() -> Mapping[str, Any]:
+    """モックRedmine APIレスポンスフィクスチャ（読み取り専用）"""
+    return _MOCK_REDMINE_API_RESPONSE
+
+
+@pytest.fixture(scope="session")
+def _redmine_client_template() -> Mock:
+    """モックRedmineクライアントのテンプレート（セッションで1回だけ生成）"""
     client = Mock()
     client.test_connection.return_value = True
     client.get_current_user.return_value = {
@@ -346,12 +458,15 @@ def mock_redmine_client():
     return client
 
 
-@pytest.fixture(autouse=True)
-def reset_config_cache():
-    """設定キャッシュリセット（各テスト前に自動実行）"""
-    # ConfigManagerのキャッシュをクリア
-    yield
-    # テスト後のクリーンアップは不要
+@pytest.fixture
+def mock_redmine_client(_redmine_client_template: Mock) -> Mock:
+    """モックRedmineクライアントフィクスチャ
+
+    テンプレートの呼び出し履歴のみをリセットして返す。戻り値や side_effect は
+    テスト間で共有されるため、変更が必要なテストでは個別に Mock を作成すること。
+    """
+    _redmine_client_template.reset_mock()
+    return _redmine_client_template
 
 
 # テスト用のマーカー定義は pyproject.toml で行う
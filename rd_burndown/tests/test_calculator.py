@@ -11,6 +11,54 @@ from rd_burndown.core.calculator import (
     get_burndown_calculator,
 )
 from rd_burndown.core.models import ProjectTimeline
+from rd_burndown.tests._common import DATE_0101, DATE_0131
+
+# Built once at import time and shared read-only by the tests below.
+# ProjectTimeline keeps snapshots as plain dicts (the shape stored in the DB),
+# so the prebuilt inputs are dicts as well.
+_SNAPSHOT_START = {
+    "date": "2024-01-01",
+    "total_estimated_hours": 100.0,
+    "remaining_hours": 100.0,
+    "completed_hours": 0.0,
+    "completed_ticket_count": 0,
+}
+_SNAPSHOT_MIDDLE = {
+    "date": "2024-01-15",
+    "total_estimated_hours": 100.0,
+    "remaining_hours": 50.0,
+    "completed_hours": 50.0,
+    "completed_ticket_count": 5,
+}
+_SNAPSHOT_END = {
+    "date": "2024-01-31",
+    "total_estimated_hours": 100.0,
+    "remaining_hours": 0.0,
+    "completed_hours": 100.0,
+    "completed_ticket_count": 10,
+}
+
+_SAMPLE_TIMELINE = ProjectTimeline(
+    project_id=1,
+    project_name="Test Project",
+    start_date=DATE_0101,
+    end_date=DATE_0131,
+    snapshots=[_SNAPSHOT_START, _SNAPSHOT_MIDDLE, _SNAPSHOT_END],
+    scope_changes=[],
+)
+
+
+class FakeDataManager:
+    """Lightweight stand-in for DataManager used by BurndownCalculator."""
+
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+
+    def get_project_timeline(self, project_id):
+        if self.error is not None:
+            raise self.error
+        return self.result
 
 
 class TestCalculatorError:
@@ -26,52 +74,34 @@ class TestCalculatorError:
 class TestBurndownCalculator:
     """Test BurndownCalculator class."""
 
-    @pytest.fixture
-    def mock_data_manager(self):
-        """Create a mock data manager."""
-        return Mock()
-
-    @pytest.fixture
-    def calculator(self):
-        """Create a BurndownCalculator instance."""
-        with patch("rd_burndown.core.calculator.get_data_manager") as mock_get_dm:
-            mock_dm = Mock()
-            mock_get_dm.return_value = mock_dm
-            return BurndownCalculator()
+    @pytest.fixture(scope="class", autouse=True)
+    def _patch_data_manager(self):
+        """Patch get_data_manager once for the whole class.
 
-    @pytest.fixture
+        side_effect=FakeDataManager gives every BurndownCalculator its own
+        fresh data manager.
+        """
+        with patch(
+            "rd_burndown.core.calculator.get_data_manager",
+            side_effect=FakeDataManager,
+        ) as mock_get_dm:
+            yield mock_get_dm
+
+    @pytest.fixture(scope="class")
+    def calculator(self, _patch_data_manager):
+        """Create a BurndownCalculator instance shared by the whole class."""
+        return BurndownCalculator()
+
+    @pytest.fixture(autouse=True)
+    def _reset_data_manager(self, calculator):
+        """Give the shared calculator a fresh data manager for every test."""
+        calculator.data_manager = FakeDataManager()
+        return calculator.data_manager
+
+    @pytest.fixture(scope="module")
     def sample_timeline(self):
-        """Create a sample ProjectTimeline for testing."""
-        return ProjectTimeline(
-            project_id=1,
-            project_name="Test Project",
-            start_date=date(2024, 1, 1),
-            end_date=date(2024, 1, 31),
-            snapshots=[
-                {
-                    "date": "2024-01-01",
-                    "total_estimated_hours": 100.0,
-                    "remaining_hours": 100.0,
-                    "completed_hours": 0.0,
-                    "completed_ticket_count": 0,
-                },
-                {
-                    "date": "2024-01-15",
-                    "total_estimated_hours": 100.0,
-                    "remaining_hours": 50.0,
-                    "completed_hours": 50.0,
-                    "completed_ticket_count": 5,
-                },
-                {
-                    "date": "2024-01-31",
-                    "total_estimated_hours": 100.0,
-                    "remaining_hours": 0.0,
-                    "completed_hours": 100.0,
-                    "completed_ticket_count": 10,
-                },
-            ],
-            scope_changes=[],
-        )
+        """Return the shared sample ProjectTimeline (built once at import)."""
+        return _SAMPLE_TIMELINE
 
     def test_init(self):
         """Test BurndownCalculator initialization."""
@@ -81,51 +111,48 @@ class TestBurndownCalculator:
             calculator = BurndownCalculator()
             assert calculator.data_manager == mock_dm
 
-    def test_calculate_project_timeline_success(self, calculator):
-        """Test successful project timeline calculation."""
-        # Setup mock data
-        timeline_data = {
-            "project": {
-                "name": "Test Project",
-                "start_date": "2024-01-01",
-                "end_date": "2024-01-31",
-            },
-            "snapshots": [
-                {
-                    "date": "2024-01-01",
-                    "total_estimated_hours": 100.0,
-                    "remaining_hours": 100.0,
-                    "completed_hours": 0.0,
-                    "completed_ticket_count": 0,
-                }
-            ],
-            "scope_changes": [],
-        }
-
-        calculator.data_manager.get_project_timeline.return_value = timeline_data
-
-        result = calculator.calculate_project_timeline(1)
+    @pytest.fixture
+    def dm_behavior(self, request, calculator):
+        """Configure the data manager for the requested scenario."""
+        if request.param == "ok":
+            calculator.data_manager.result = {
+                "project": {
+                    "name": "Test Project",
+                    "start_date": "2024-01-01",
+                    "end_date": "2024-01-31",
+                },
+                "snapshots": [_SNAPSHOT_START],
+                "scope_changes": [],
+            }
+        elif request.param == "none":
+            calculator.data_manager.result = None
+        else:
+            calculator.data_manager.error = Exception("DB error")
+        return calculator
+
+    @pytest.mark.parametrize(
+        ("dm_behavior", "error_match"),
+        [
+            ("ok", None),
+            ("none", "Project 1 not found"),
+            ("error", "Failed to calculate project timeline"),
+        ],
+        ids=["success", "not_found", "data_manager_error"],
+        indirect=["dm_behavior"],
+    )
+    def test_calculate_project_timeline(self, dm_behavior, error_match):
+        """Test project timeline calculation for each data manager outcome."""
+        if error_match is not None:
+            with pytest.raises(CalculatorError, match=error_match):
+                dm_behavior.calculate_project_timeline(1)
+            return
+
+        result = dm_behavior.calculate_project_timeline(1)
 
         assert isinstance(result, ProjectTimeline)
         assert result.project_id == 1
         assert result.project_name == "Test Project"
 
-    def test_calculate_project_timeline_not_found(self, calculator):
-        """Test project timeline calculation when project not found."""
-        calculator.data_manager.get_project_timeline.return_value = None
-
-        with pytest.raises(CalculatorError, match="Project 1 not found"):
-            calculator.calculate_project_timeline(1)
-
-    def test_calculate_project_timeline_data_manager_error(self, calculator):
-        """Test project timeline calculation when data manager raises error."""
-        calculator.data_manager.get_project_timeline.side_effect = Exception("DB error")
-
-        with pytest.raises(
-            CalculatorError, match="Failed to calculate project timeline"
-        ):
-            calculator.calculate_project_timeline(1)
-
     def test_calculate_ideal_line_success(self, calculator, sample_timeline):
         """Test successful ideal line calculation."""
         result = calculator.calculate_ideal_line(sample_timeline)
@@ -138,18 +165,9 @@ class TestBurndownCalculator:
         # Last point should be close to 0 hours (floating point precision)
         assert abs(result[-1][1]) < 0.1
 
-    def test_calculate_ideal_line_empty_snapshots(self, calculator):
+    def test_calculate_ideal_line_empty_snapshots(self, calculator, empty_timeline):
         """Test ideal line calculation with empty snapshots."""
-        timeline = ProjectTimeline(
-            project_id=1,
-            project_name="Test",
-            start_date=date(2024, 1, 1),
-            end_date=date(2024, 1, 10),
-            snapshots=[],
-            scope_changes=[],
-        )
-
-        result = calculator.calculate_ideal_line(timeline)
+        result = calculator.calculate_ideal_line(empty_timeline)
         assert result == []
 
     def test_calculate_ideal_line_exclude_weekends(self, calculator, sample_timeline):
@@ -238,23 +256,11 @@ class TestBurndownCalculator:
         assert isinstance(result, float)
         assert result >= 0
 
-    def test_calculate_burn_rate_insufficient_data(self, calculator):
+    def test_calculate_burn_rate_insufficient_data(
+        self, calculator, insufficient_timeline
+    ):
         """Test burn rate calculation with insufficient data."""
-        timeline = ProjectTimeline(
-            project_id=1,
-            project_name="Test",
-            start_date=date(2024, 1, 1),
-            end_date=date(2024, 1, 10),
-            snapshots=[
-                {
-                    "date": "2024-01-01",
-                    "remaining_hours": 100.0,
-                }
-            ],
-            scope_changes=[],
-        )
-
-        result = calculator.calculate_burn_rate(timeline)
+        result = calculator.calculate_burn_rate(insufficient_timeline)
         assert result == 0.0
 
     def test_calculate_velocity_success(self, calculator, sample_timeline):
@@ -276,53 +282,36 @@ class TestBurndownCalculator:
         assert "days_remaining" in result
         assert "confidence" in result
 
-    def test_calculate_completion_forecast_already_completed(self, calculator):
+    def test_calculate_completion_forecast_already_completed(
+        self, calculator, completed_timeline
+    ):
         """Test completion forecast when project is already completed."""
-        timeline = ProjectTimeline(
-            project_id=1,
-            project_name="Test",
-            start_date=date(2024, 1, 1),
-            end_date=date(2024, 1, 10),
-            snapshots=[
-                {
-                    "date": "2024-01-05",
-                    "remaining_hours": 0.0,
-                    "completed_hours": 100.0,
-                }
-            ],
-            scope_changes=[],
-        )
-
-        result = calculator.calculate_completion_forecast(timeline)
+        result = calculator.calculate_completion_forecast(completed_timeline)
 
         assert result["forecast_date"] == date(2024, 1, 5)
         assert result["days_remaining"] == 0
         assert result["confidence"] == "high"
 
-    def test_get_project_start_date_from_project(self, calculator):
-        """Test project start date retrieval from project data."""
-        project_data = {"start_date": "2024-01-01"}
-        snapshots = []
-
-        result = calculator._get_project_start_date(project_data, snapshots)
-        assert result == date(2024, 1, 1)
-
-    def test_get_project_start_date_from_snapshots(self, calculator):
-        """Test project start date retrieval from snapshots."""
-        project_data = {}
-        snapshots = [{"date": "2024-01-02"}]
-
+    @pytest.mark.parametrize(
+        ("project_data", "snapshots", "expected"),
+        [
+            ({"start_date": "2024-01-01"}, [], date(2024, 1, 1)),
+            ({}, [{"date": "2024-01-02"}], date(2024, 1, 2)),
+            # None means "falls back to today's date"
+            ({}, [], None),
+        ],
+        ids=["from_project", "from_snapshots", "fallback_today"],
+    )
+    def test_get_project_start_date(
+        self, calculator, project_data, snapshots, expected
+    ):
+        """Test project start date retrieval from project data, snapshots or today."""
         result = calculator._get_project_start_date(project_data, snapshots)
-        assert result == date(2024, 1, 2)
 
-    def test_get_project_start_date_fallback_today(self, calculator):
-        """Test project start date fallback to today."""
-        project_data = {}
-        snapshots = []
-
-        result = calculator._get_project_start_date(project_data, snapshots)
-        # Should return today's date as fallback
-        assert isinstance(result, date)
+        if expected is None:
+            assert isinstance(result, date)
+        else:
+            assert result == expected
 
     def test_get_project_end_date_success(self, calculator):
         """Test successful project end date retrieval."""
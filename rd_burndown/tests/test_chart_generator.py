@@ -2,11 +2,16 @@
 
 from datetime import date
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
 
+import matplotlib
+import matplotlib.pyplot as plt
 import pytest
+import seaborn as sns
 
 from rd_burndown.core.chart_generator import (
+    SKIP_FONT_PROBE_ENV,
     ChartGenerator,
     ChartGeneratorError,
     get_chart_generator,
@@ -14,6 +19,62 @@ from rd_burndown.core.chart_generator import (
 from rd_burndown.core.models import ProjectTimeline
 
 
+# Timelines are shared across tests and must be treated as read-only inputs.
+@pytest.fixture(scope="session")
+def timeline():
+    """Standard timeline with snapshots and a scope change."""
+    return ProjectTimeline(
+        project_id=1,
+        project_name="Test Project",
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 12, 31),
+        snapshots=[
+            {
+                "date": "2024-01-01",
+                "total_estimated_hours": 100.0,
+                "remaining_hours": 100.0,
+            },
+            {
+                "date": "2024-01-02",
+                "total_estimated_hours": 100.0,
+                "remaining_hours": 90.0,
+            },
+        ],
+        scope_changes=[
+            {"date": "2024-01-01", "hours_delta": 10.0, "change_type": "added"}
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def ideal_start_timeline():
+    """Timeline used to render a real chart with an ideal start date."""
+    return ProjectTimeline(
+        project_id=1,
+        project_name="Test Project",
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 1, 10),
+        snapshots=[
+            {
+                "date": "2024-01-01",
+                "total_estimated_hours": 40.0,
+                "remaining_hours": 40.0,
+            },
+            {
+                "date": "2024-01-02",
+                "total_estimated_hours": 40.0,
+                "remaining_hours": 30.0,
+            },
+            {
+                "date": "2024-01-03",
+                "total_estimated_hours": 40.0,
+                "remaining_hours": 20.0,
+            },
+        ],
+        scope_changes=[],
+    )
+
+
 class TestChartGeneratorError:
     """Test ChartGeneratorError exception."""
 
@@ -27,9 +88,22 @@ class TestChartGeneratorError:
 class TestChartGenerator:
     """Test ChartGenerator class."""
 
-    @pytest.fixture
-    def chart_generator(self):
-        """Create a ChartGenerator instance with mocked dependencies."""
+    @pytest.fixture(autouse=True)
+    def _stub_mpl(self, monkeypatch):
+        """Stub matplotlib/seaborn entry points with one shared MagicMock."""
+        m = MagicMock()
+        monkeypatch.setattr(plt, "style", m.style)
+        monkeypatch.setattr(plt, "rcParams", {})
+        monkeypatch.setattr(plt, "subplots", m.subplots)
+        monkeypatch.setattr(plt, "close", m.close)
+        monkeypatch.setattr(plt, "setp", m.setp)
+        monkeypatch.setattr(matplotlib, "font_manager", m.font_manager)
+        monkeypatch.setattr(sns, "set_palette", m.set_palette)
+        return m
+
+    @pytest.fixture(scope="class")
+    def _shared_chart_generator(self):
+        """Create a ChartGenerator once per class with mocked dependencies."""
         with (
             patch("rd_burndown.core.chart_generator.get_config_manager") as mock_get_cm,
             patch(
@@ -39,29 +113,39 @@ class TestChartGenerator:
             patch("seaborn.set_palette"),
             patch("matplotlib.pyplot.rcParams"),
         ):
-            # Setup config mock
+            # Setup config stub (read-only, so a plain namespace is enough)
             mock_config_manager = Mock()
-            mock_config = Mock()
-            mock_config.output.output_dir = "output"
-            mock_config.output.default_dpi = 300
-            mock_config.chart.font_size = 12
-            # チャートスタイル設定を追加
-            mock_config.chart.colors.ideal = "blue"
-            mock_config.chart.colors.actual = "red"
-            mock_config.chart.colors.grid = "gray"
-            mock_config.chart.colors.background = "white"
-            mock_config.chart.line_styles.ideal = "-"
-            mock_config.chart.line_styles.actual = "-"
+            mock_config = SimpleNamespace(
+                output=SimpleNamespace(output_dir="output", default_dpi=300),
+                chart=SimpleNamespace(
+                    font_size=12,
+                    # チャートスタイル設定を追加
+                    colors=SimpleNamespace(
+                        ideal="blue",
+                        actual="red",
+                        scope="green",
+                        dynamic_ideal="orange",
+                        grid="gray",
+                        background="white",
+                    ),
+                    line_styles=SimpleNamespace(
+                        ideal="-", actual="-", scope="-", dynamic_ideal="--"
+                    ),
+                ),
+            )
             mock_config_manager.load_config.return_value = mock_config
 
-            # Setup calculator mock
-            mock_calculator = Mock()
-
             mock_get_cm.return_value = mock_config_manager
-            mock_get_calc.return_value = mock_calculator
+            mock_get_calc.return_value = Mock()
 
             return ChartGenerator()
 
+    @pytest.fixture
+    def chart_generator(self, _shared_chart_generator):
+        """Return the shared ChartGenerator with a fresh calculator mock."""
+        _shared_chart_generator.calculator = Mock()
+        return _shared_chart_generator
+
     def test_init_success(self):
         """Test successful ChartGenerator initialization."""
         with (
@@ -69,14 +153,9 @@ class TestChartGenerator:
             patch(
                 "rd_burndown.core.chart_generator.get_burndown_calculator"
             ) as mock_get_calc,
-            patch("matplotlib.pyplot.style.use"),
-            patch("seaborn.set_palette"),
-            patch("matplotlib.font_manager"),
-            patch("matplotlib.pyplot.rcParams"),
         ):
             mock_config_manager = Mock()
-            mock_config = Mock()
-            mock_config.chart.font_size = 12
+            mock_config = SimpleNamespace(chart=SimpleNamespace(font_size=12))
             mock_config_manager.load_config.return_value = mock_config
             mock_get_cm.return_value = mock_config_manager
             mock_get_calc.return_value = Mock()
@@ -87,29 +166,84 @@ class TestChartGenerator:
             assert cg.config == mock_config
             assert hasattr(cg, "_no_japanese_font")
 
-    def test_generate_burndown_chart_success(self, chart_generator):
-        """Test successful burndown chart generation."""
-        # Mock timeline data
-        timeline = ProjectTimeline(
-            project_id=1,
-            project_name="Test Project",
-            start_date=date(2024, 1, 1),
-            end_date=date(2024, 12, 31),
-            snapshots=[
-                {"date": "2024-01-01", "remaining_hours": 100.0},
-                {"date": "2024-01-02", "remaining_hours": 90.0},
-            ],
-            scope_changes=[],
-        )
+    @pytest.mark.parametrize(
+        ("fonts", "expected_family", "no_japanese_font"),
+        [
+            (["DejaVu Sans", "Noto Sans CJK JP"], "Noto Sans CJK JP", False),
+            (["DejaVu Sans"], "DejaVu Sans", True),
+            ([], "DejaVu Sans", True),
+        ],
+        ids=["japanese", "limited", "none"],
+    )
+    def test_init_probes_fonts(
+        self, monkeypatch, _stub_mpl, fonts, expected_family, no_japanese_font
+    ):
+        """Test font probing when the skip flag is not set."""
+        monkeypatch.delenv(SKIP_FONT_PROBE_ENV, raising=False)
+        _stub_mpl.font_manager.fontManager.ttflist = [
+            SimpleNamespace(name=name) for name in fonts
+        ]
+
+        with (
+            patch("rd_burndown.core.chart_generator.get_config_manager"),
+            patch("rd_burndown.core.chart_generator.get_burndown_calculator"),
+        ):
+            cg = ChartGenerator()
+
+        assert cg._no_japanese_font is no_japanese_font
+        assert plt.rcParams["font.family"] == expected_family
+
+    @pytest.mark.parametrize("value", ["1", "true", "YES"])
+    def test_init_skips_font_probe(self, monkeypatch, _stub_mpl, value):
+        """Test that the font probe is skipped when the flag is set."""
+        monkeypatch.setenv(SKIP_FONT_PROBE_ENV, value)
 
+        with (
+            patch("rd_burndown.core.chart_generator.get_config_manager"),
+            patch("rd_burndown.core.chart_generator.get_burndown_calculator"),
+        ):
+            cg = ChartGenerator()
+
+        assert cg._no_japanese_font is True
+        assert plt.rcParams["font.family"] == "DejaVu Sans"
+        assert not _stub_mpl.font_manager.mock_calls
+
+    @pytest.mark.parametrize("value", ["0", "false", ""])
+    def test_init_probes_fonts_when_flag_is_falsy(self, monkeypatch, _stub_mpl, value):
+        """Test that falsy flag values do not skip the font probe."""
+        monkeypatch.setenv(SKIP_FONT_PROBE_ENV, value)
+        _stub_mpl.font_manager.fontManager.ttflist = [
+            SimpleNamespace(name="Noto Sans CJK JP")
+        ]
+
+        with (
+            patch("rd_burndown.core.chart_generator.get_config_manager"),
+            patch("rd_burndown.core.chart_generator.get_burndown_calculator"),
+        ):
+            cg = ChartGenerator()
+
+        assert cg._no_japanese_font is False
+        assert plt.rcParams["font.family"] == "Noto Sans CJK JP"
+
+    @pytest.mark.parametrize(
+        "public,private",
+        [
+            ("generate_burndown_chart", "_create_burndown_chart"),
+            ("generate_scope_chart", "_create_scope_chart"),
+            ("generate_combined_chart", "_create_combined_chart"),
+        ],
+        ids=["burndown", "scope", "combined"],
+    )
+    def test_generate_chart_success(self, chart_generator, timeline, public, private):
+        """Test successful chart generation for each chart type."""
         chart_generator.calculator.calculate_project_timeline.return_value = timeline
 
-        with patch.object(chart_generator, "_create_burndown_chart") as mock_create:
+        with patch.object(chart_generator, private) as mock_create:
             mock_fig = Mock()
             mock_create.return_value = mock_fig
 
-            with patch("pathlib.Path.mkdir"), patch("matplotlib.pyplot.close"):
-                output_path = chart_generator.generate_burndown_chart(
+            with patch("pathlib.Path.mkdir"):
+                output_path = getattr(chart_generator, public)(
                     project_id=1,
                     start_date=date(2024, 1, 1),
                     end_date=date(2024, 12, 31),
@@ -119,73 +253,43 @@ class TestChartGenerator:
                 mock_create.assert_called_once()
                 mock_fig.savefig.assert_called_once()
 
-    def test_generate_burndown_chart_with_output_path(self, chart_generator):
+    def test_generate_burndown_chart_with_output_path(
+        self, chart_generator, empty_timeline
+    ):
         """Test burndown chart generation with specific output path."""
-        timeline = ProjectTimeline(
-            project_id=1,
-            project_name="Test Project",
-            start_date=date(2024, 1, 1),
-            end_date=date(2024, 12, 31),
-            snapshots=[],
-            scope_changes=[],
-        )
-
-        chart_generator.calculator.calculate_project_timeline.return_value = timeline
+        calculator = chart_generator.calculator
+        calculator.calculate_project_timeline.return_value = empty_timeline
 
         with patch.object(chart_generator, "_create_burndown_chart") as mock_create:
             mock_fig = Mock()
             mock_create.return_value = mock_fig
 
-            with patch("matplotlib.pyplot.close"):
-                output_path = Path("custom_output.png")
-                result_path = chart_generator.generate_burndown_chart(
-                    project_id=1,
-                    start_date=date(2024, 1, 1),
-                    end_date=date(2024, 12, 31),
-                    output_path=output_path,
-                )
+            output_path = Path("custom_output.png")
+            result_path = chart_generator.generate_burndown_chart(
+                project_id=1,
+                start_date=date(2024, 1, 1),
+                end_date=date(2024, 12, 31),
+                output_path=output_path,
+            )
 
-                assert result_path == output_path
-                mock_fig.savefig.assert_called_once()
+            assert result_path == output_path
+            mock_fig.savefig.assert_called_once()
 
     def test_generate_burndown_chart_with_ideal_start_date(
-        self, chart_generator, tmp_path
+        self, chart_generator, ideal_start_timeline, tmp_path, monkeypatch
     ):
         """バーンダウンチャート生成（理想線開始日指定）"""
-        # プロジェクトタイムラインのモック作成
-        timeline = ProjectTimeline(
-            project_id=1,
-            project_name="Test Project",
-            start_date=date(2024, 1, 1),
-            end_date=date(2024, 1, 10),
-            snapshots=[
-                {
-                    "date": "2024-01-01",
-                    "total_estimated_hours": 40.0,
-                    "remaining_hours": 40.0,
-                },
-                {
-                    "date": "2024-01-02",
-                    "total_estimated_hours": 40.0,
-                    "remaining_hours": 30.0,
-                },
-                {
-                    "date": "2024-01-03",
-                    "total_estimated_hours": 40.0,
-                    "remaining_hours": 20.0,
-                },
-            ],
-            scope_changes=[],
-        )
-
+        # 実際に描画するため matplotlib のスタブを解除する
+        monkeypatch.undo()
         # カリキュレーターのモック設定
-        chart_generator.calculator.calculate_project_timeline.return_value = timeline
-        chart_generator.calculator.calculate_ideal_line.return_value = [
+        calculator = chart_generator.calculator
+        calculator.calculate_project_timeline.return_value = ideal_start_timeline
+        calculator.calculate_ideal_line.return_value = [
             (date(2024, 1, 2), 30.0),  # 指定日から開始
             (date(2024, 1, 3), 20.0),
             (date(2024, 1, 4), 10.0),
         ]
-        chart_generator.calculator.calculate_actual_line.return_value = [
+        calculator.calculate_actual_line.return_value = [
             (date(2024, 1, 1), 40.0),
             (date(2024, 1, 2), 30.0),
             (date(2024, 1, 3), 20.0),
@@ -204,8 +308,8 @@ class TestChartGenerator:
         assert output_path.exists()
 
         # 理想線計算が正しいパラメータで呼ばれることを確認
-        chart_generator.calculator.calculate_ideal_line.assert_called_with(
-            timeline, start_from_date=ideal_start_date
+        calculator.calculate_ideal_line.assert_called_with(
+            ideal_start_timeline, start_from_date=ideal_start_date
         )
 
     def test_generate_burndown_chart_calculation_error(self, chart_generator):
@@ -221,189 +325,61 @@ class TestChartGenerator:
                 project_id=1, start_date=date(2024, 1, 1), end_date=date(2024, 12, 31)
             )
 
-    def test_generate_scope_chart_success(self, chart_generator):
-        """Test successful scope chart generation."""
-        timeline = ProjectTimeline(
-            project_id=1,
-            project_name="Test Project",
-            start_date=date(2024, 1, 1),
-            end_date=date(2024, 12, 31),
-            snapshots=[],
-            scope_changes=[
-                {"date": "2024-01-01", "hours_delta": 10.0, "change_type": "added"}
-            ],
-        )
-
-        chart_generator.calculator.calculate_project_timeline.return_value = timeline
-
-        with patch.object(chart_generator, "_create_scope_chart") as mock_create:
-            mock_fig = Mock()
-            mock_create.return_value = mock_fig
-
-            with patch("pathlib.Path.mkdir"), patch("matplotlib.pyplot.close"):
-                output_path = chart_generator.generate_scope_chart(
-                    project_id=1,
-                    start_date=date(2024, 1, 1),
-                    end_date=date(2024, 12, 31),
-                )
-
-                assert output_path is not None
-                mock_create.assert_called_once()
-                mock_fig.savefig.assert_called_once()
-
-    def test_generate_combined_chart_success(self, chart_generator):
-        """Test successful combined chart generation."""
-        timeline = ProjectTimeline(
-            project_id=1,
-            project_name="Test Project",
-            start_date=date(2024, 1, 1),
-            end_date=date(2024, 12, 31),
-            snapshots=[],
-            scope_changes=[],
-        )
-
-        chart_generator.calculator.calculate_project_timeline.return_value = timeline
-
-        with patch.object(chart_generator, "_create_combined_chart") as mock_create:
-            mock_fig = Mock()
-            mock_create.return_value = mock_fig
-
-            with patch("pathlib.Path.mkdir"), patch("matplotlib.pyplot.close"):
-                output_path = chart_generator.generate_combined_chart(
-                    project_id=1,
-                    start_date=date(2024, 1, 1),
-                    end_date=date(2024, 12, 31),
-                )
-
-                assert output_path is not None
-                mock_create.assert_called_once()
-                mock_fig.savefig.assert_called_once()
-
-    def test_create_burndown_chart_basic(self, chart_generator):
-        """Test basic burndown chart creation."""
-        timeline = ProjectTimeline(
-            project_id=1,
-            project_name="Test Project",
-            start_date=date(2024, 1, 1),
-            end_date=date(2024, 12, 31),
-            snapshots=[
-                {"date": "2024-01-01", "remaining_hours": 100.0},
-                {"date": "2024-01-02", "remaining_hours": 90.0},
-            ],
-            scope_changes=[],
-        )
-
-        # Mock calculator methods
-        chart_generator.calculator.calculate_ideal_line.return_value = [
+    @pytest.mark.parametrize(
+        "private,args,expected_subplots",
+        [
+            # _create_burndown_chart divides width/height by dpi
+            (
+                "_create_burndown_chart",
+                (12, 8, 300),
+                {"figsize": (12 / 300, 8 / 300), "dpi": 300},
+            ),
+            # The scope/combined implementations divide by 100, not by dpi
+            ("_create_scope_chart", (True, 12, 8), {"figsize": (12 / 100, 8 / 100)}),
+            ("_create_combined_chart", (16, 10), {"figsize": (16 / 100, 10 / 100)}),
+        ],
+        ids=["burndown", "scope", "combined"],
+    )
+    def test_create_chart_basic(
+        self, chart_generator, timeline, _stub_mpl, private, args, expected_subplots
+    ):
+        """Test basic chart creation for each chart type."""
+        calculator = chart_generator.calculator
+        calculator.calculate_ideal_line.return_value = [
             (date(2024, 1, 1), 100.0),
             (date(2024, 12, 31), 0.0),
         ]
-        chart_generator.calculator.calculate_actual_line.return_value = [
+        calculator.calculate_actual_line.return_value = [
             (date(2024, 1, 1), 100.0),
             (date(2024, 1, 2), 90.0),
         ]
-
-        with patch("matplotlib.pyplot.subplots") as mock_subplots:
-            mock_fig = Mock()
-            mock_ax = Mock()
-            mock_subplots.return_value = (mock_fig, mock_ax)
-
-            with patch.object(chart_generator, "_setup_chart_style"):
-                fig = chart_generator._create_burndown_chart(timeline, 12, 8, 300)
-
-                assert fig == mock_fig
-                # The actual call divides width/height by dpi: (12/300, 8/300)
-                mock_subplots.assert_called_once_with(
-                    figsize=(12 / 300, 8 / 300), dpi=300
-                )
-
-    def test_create_scope_chart_basic(self, chart_generator):
-        """Test basic scope chart creation."""
-        timeline = ProjectTimeline(
-            project_id=1,
-            project_name="Test Project",
-            start_date=date(2024, 1, 1),
-            end_date=date(2024, 12, 31),
-            snapshots=[],
-            scope_changes=[
-                {"date": "2024-01-01", "hours_delta": 10.0, "change_type": "added"}
-            ],
-        )
-
-        # Mock calculator method
-        chart_generator.calculator.calculate_scope_trend_line.return_value = [
-            (date(2024, 1, 1), 100.0),
-            (date(2024, 1, 2), 110.0),
-        ]
-
-        with patch("matplotlib.pyplot.subplots") as mock_subplots:
-            mock_fig = Mock()
-            mock_ax = Mock()
-            mock_subplots.return_value = (mock_fig, mock_ax)
-
-            with patch.object(chart_generator, "_setup_chart_style"):
-                fig = chart_generator._create_scope_chart(timeline, True, 12, 8)
-
-                assert fig == mock_fig
-                # The actual implementation divides by 100, not by dpi
-                mock_subplots.assert_called_once_with(figsize=(12 / 100, 8 / 100))
-
-    def test_create_combined_chart_basic(self, chart_generator):
-        """Test basic combined chart creation."""
-        timeline = ProjectTimeline(
-            project_id=1,
-            project_name="Test Project",
-            start_date=date(2024, 1, 1),
-            end_date=date(2024, 12, 31),
-            snapshots=[{"date": "2024-01-01", "remaining_hours": 100.0}],
-            scope_changes=[
-                {"date": "2024-01-01", "hours_delta": 10.0, "change_type": "added"}
-            ],
-        )
-
-        # Mock calculator methods
-        chart_generator.calculator.calculate_ideal_line.return_value = [
+        calculator.calculate_dynamic_ideal_line.return_value = [
             (date(2024, 1, 1), 100.0),
             (date(2024, 12, 31), 0.0),
         ]
-        chart_generator.calculator.calculate_actual_line.return_value = [
-            (date(2024, 1, 1), 100.0)
-        ]
-        chart_generator.calculator.calculate_dynamic_ideal_line.return_value = [
+        calculator.calculate_scope_trend_line.return_value = [
             (date(2024, 1, 1), 100.0),
-            (date(2024, 12, 31), 0.0),
+            (date(2024, 1, 2), 110.0),
         ]
 
-        with patch("matplotlib.pyplot.subplots") as mock_subplots:
-            mock_fig = Mock()
-            mock_ax = Mock()
-            # Mock the ax.lines attribute to return an empty list for label checking
-            mock_ax.lines = []
-            mock_subplots.return_value = (mock_fig, mock_ax)
+        mock_subplots = _stub_mpl.subplots
+        mock_fig = Mock()
+        mock_ax = Mock()
+        # Mock the ax.lines attribute to return an empty list for label checking
+        mock_ax.lines = []
+        mock_subplots.return_value = (mock_fig, mock_ax)
 
-            with patch.object(chart_generator, "_setup_chart_style"):
-                fig = chart_generator._create_combined_chart(timeline, 16, 10)
+        with patch.object(chart_generator, "_setup_chart_style"):
+            fig = getattr(chart_generator, private)(timeline, *args)
 
-                assert fig == mock_fig
-                # The actual implementation divides by 100
-                mock_subplots.assert_called_once_with(figsize=(16 / 100, 10 / 100))
+            assert fig == mock_fig
+            mock_subplots.assert_called_once_with(**expected_subplots)
 
-    def test_setup_chart_style(self, chart_generator):
+    def test_setup_chart_style(self, chart_generator, timeline):
         """Test chart style setup."""
         mock_ax = Mock()
-        timeline = ProjectTimeline(
-            project_id=1,
-            project_name="Test Project",
-            start_date=date(2024, 1, 1),
-            end_date=date(2024, 12, 31),
-            snapshots=[{"total_estimated_hours": 100.0}],
-            scope_changes=[],
-        )
 
-        with patch("matplotlib.pyplot.setp"):
-            chart_generator._setup_chart_style(
-                mock_ax, timeline, "バーンダウンチャート"
-            )
+        chart_generator._setup_chart_style(mock_ax, timeline, "バーンダウンチャート")
 
         mock_ax.set_title.assert_called_once()
         # The mock ax calls will vary based on _no_japanese_font flag
@@ -1,156 +1,145 @@
 """CLIのテスト"""
 
-import tempfile
-from pathlib import Path
+import subprocess
+import sys
 from unittest.mock import Mock, patch
 
 import pytest
-from click.testing import CliRunner
 
-from rd_burndown.cli.main import cli, config
+from rd_burndown.cli.main import cli, config, main
 from rd_burndown.utils.config import Config
 
 
 class TestCLIMain:
     """メインCLIのテスト"""
 
-    def test_cli_help(self):
+    def test_cli_import_defers_heavy_modules(self):
+        """CLI読み込み時に重いモジュールが読み込まれないことのテスト"""
+        code = (
+            "import sys, rd_burndown.cli.main; "
+            "heavy = ('matplotlib', 'requests', 'rd_burndown.core.data_manager'); "
+            "sys.exit(any(name in sys.modules for name in heavy))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], check=False)
+        assert result.returncode == 0
+
+    def test_cli_help(self, runner):
         """CLIヘルプのテスト"""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--help"])
+        result = runner.invoke(cli, ["--help"], catch_exceptions=False)
 
-        assert result.exit_code == 0
+        assert result.exit_code == 0, result.output
         assert "Redmine バーンダウンチャート生成ツール" in result.output
         assert "project" in result.output
         assert "chart" in result.output
         assert "data" in result.output
         assert "config" in result.output
 
-    def test_cli_version(self):
+    def test_cli_version(self, runner):
         """CLIバージョンのテスト"""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--version"])
+        result = runner.invoke(cli, ["--version"], catch_exceptions=False)
 
-        assert result.exit_code == 0
+        assert result.exit_code == 0, result.output
         assert "0.1.0" in result.output
 
-    def test_cli_verbose_option(self):
+    def test_cli_verbose_option(self, runner):
         """詳細出力オプションのテスト"""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--verbose", "--help"])
+        result = runner.invoke(cli, ["--verbose", "--help"], catch_exceptions=False)
 
-        assert result.exit_code == 0
+        assert result.exit_code == 0, result.output
 
-    def test_cli_custom_config_path(self):
+    def test_cli_custom_config_path(self, runner, cfg_path):
         """カスタム設定パスのテスト"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_path = Path(tmp_dir) / "custom-config.yaml"
-            config_path.write_text("redmine:\n  url: http://custom.example.com\n")
-
-            runner = CliRunner()
-            result = runner.invoke(cli, ["--config", str(config_path), "--help"])
-
-            assert result.exit_code == 0
-
-    def test_subcommand_groups(self):
-        """サブコマンドグループのテスト"""
-        runner = CliRunner()
-
-        # 各サブコマンドグループのヘルプが表示できるかテスト
-        for subcommand in ["project", "chart", "data", "config"]:
-            result = runner.invoke(cli, [subcommand, "--help"])
-            assert result.exit_code == 0
+        cfg_path.write_text("redmine:\n  url: http://custom.example.com\n")
+
+        result = runner.invoke(
+            cli, ["--config", str(cfg_path), "--help"], catch_exceptions=False
+        )
+
+        assert result.exit_code == 0, result.output
+
+    @pytest.mark.parametrize(
+        ("group", "title"),
+        [
+            ("project", "プロジェクト管理コマンド"),
+            ("chart", "チャート生成コマンド"),
+            ("data", "データ管理コマンド"),
+            ("config", "設定管理コマンド"),
+        ],
+    )
+    def test_subcommand_help(self, runner, group, title):
+        """サブコマンドグループのヘルプのテスト"""
+        result = runner.invoke(cli, [group, "--help"], catch_exceptions=False)
+
+        assert result.exit_code == 0, result.output
+        assert title in result.output
+
+
+@pytest.fixture
+def mock_config_manager(monkeypatch, cfg_path):
+    """get_config_manager が返す設定マネージャーのモック"""
+    manager = Mock()
+    manager.config_path = cfg_path
+    manager.create_default_config.return_value = Config()
+    monkeypatch.setattr(
+        "rd_burndown.cli.main.get_config_manager", lambda config_path=None: manager
+    )
+    return manager
 
 
 class TestConfigCommands:
     """configサブコマンドのテスト"""
 
-    def test_config_help(self):
+    def test_config_help(self, runner):
         """config ヘルプのテスト"""
-        runner = CliRunner()
-        result = runner.invoke(config, ["--help"])
+        result = runner.invoke(config, ["--help"], catch_exceptions=False)
 
-        assert result.exit_code == 0
+        assert result.exit_code == 0, result.output
         assert "設定管理コマンド" in result.output
         assert "init" in result.output
         assert "show" in result.output
 
-    def test_config_init_default(self):
+    def test_config_init_default(self, runner, mock_config_manager):
         """config init デフォルトのテスト"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_path = Path(tmp_dir) / "config.yaml"
-
-            with patch("rd_burndown.cli.main.get_config_manager") as mock_get_manager:
-                mock_manager = Mock()
-                mock_manager.config_path = config_path
-                mock_manager.create_default_config.return_value = Config()
-                mock_get_manager.return_value = mock_manager
-
-                runner = CliRunner()
-                result = runner.invoke(cli, ["config", "init"])
+        result = runner.invoke(cli, ["config", "init"], catch_exceptions=False)
 
-                assert result.exit_code == 0
-                assert "デフォルト設定ファイルを作成しました" in result.output
-                mock_manager.create_default_config.assert_called_once()
+        assert result.exit_code == 0, result.output
+        assert "デフォルト設定ファイルを作成しました" in result.output
+        mock_config_manager.create_default_config.assert_called_once()
 
-    def test_config_init_file_exists(self):
+    def test_config_init_file_exists(self, runner, cfg_path, mock_config_manager):
         """config init 既存ファイルのテスト"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_path = Path(tmp_dir) / "config.yaml"
-            config_path.write_text("existing config")
+        cfg_path.write_text("existing config")
 
-            with patch("rd_burndown.cli.main.get_config_manager") as mock_get_manager:
-                mock_manager = Mock()
-                mock_manager.config_path = config_path
-                mock_get_manager.return_value = mock_manager
+        result = runner.invoke(cli, ["config", "init"], catch_exceptions=False)
 
-                runner = CliRunner()
-                result = runner.invoke(cli, ["config", "init"])
+        assert result.exit_code == 0, result.output
+        assert "設定ファイルが既に存在します" in result.output
+        assert "--force オプションを使用して上書きしてください" in result.output
 
-                assert result.exit_code == 0
-                assert "設定ファイルが既に存在します" in result.output
-                assert "--force オプションを使用して上書きしてください" in result.output
-
-    def test_config_init_force(self):
+    def test_config_init_force(self, runner, cfg_path, mock_config_manager):
         """config init --force のテスト"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_path = Path(tmp_dir) / "config.yaml"
-            config_path.write_text("existing config")
-
-            with patch("rd_burndown.cli.main.get_config_manager") as mock_get_manager:
-                mock_manager = Mock()
-                mock_manager.config_path = config_path
-                mock_manager.create_default_config.return_value = Config()
-                mock_get_manager.return_value = mock_manager
+        cfg_path.write_text("existing config")
 
-                runner = CliRunner()
-                result = runner.invoke(cli, ["config", "init", "--force"])
+        result = runner.invoke(
+            cli, ["config", "init", "--force"], catch_exceptions=False
+        )
 
-                assert result.exit_code == 0
-                assert "デフォルト設定ファイルを作成しました" in result.output
-                mock_manager.create_default_config.assert_called_once()
+        assert result.exit_code == 0, result.output
+        assert "デフォルト設定ファイルを作成しました" in result.output
+        mock_config_manager.create_default_config.assert_called_once()
 
-    def test_config_init_verbose(self):
+    def test_config_init_verbose(self, runner, mock_config_manager):
         """config init --verbose のテスト"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_path = Path(tmp_dir) / "config.yaml"
-
-            with patch("rd_burndown.cli.main.get_config_manager") as mock_get_manager:
-                mock_manager = Mock()
-                mock_manager.config_path = config_path
-                mock_manager.create_default_config.return_value = Config()
-                mock_get_manager.return_value = mock_manager
+        result = runner.invoke(
+            cli, ["--verbose", "config", "init"], catch_exceptions=False
+        )
 
-                runner = CliRunner()
-                result = runner.invoke(cli, ["--verbose", "config", "init"])
-
-                assert result.exit_code == 0
-                assert "設定ファイルパス:" in result.output
+        assert result.exit_code == 0, result.output
+        assert "設定ファイルパス:" in result.output
 
     def test_main_function_with_help(self):
         """main関数のhelpテスト"""
         import sys
-        from unittest.mock import patch
 
         from rd_burndown.cli.main import main
 
@@ -161,24 +150,14 @@ class TestConfigCommands:
         ):  # --helpはSystemExitを発生させる
             main()
 
-    def test_subcommand_groups(self):
-        """サブコマンドグループのテスト"""
-        runner = CliRunner()
 
-        # project コマンドグループ
-        result = runner.invoke(cli, ["project", "--help"])
-        assert result.exit_code == 0
-        assert "プロジェクト管理コマンド" in result.output
+def _raiser(exc: BaseException):
+    """呼び出されると指定の例外を送出するエントリーポイントを作成"""
 
-        # chart コマンドグループ
-        result = runner.invoke(cli, ["chart", "--help"])
-        assert result.exit_code == 0
-        assert "チャート生成コマンド" in result.output
+    def entry() -> None:
+        raise exc
 
-        # data コマンドグループ
-        result = runner.invoke(cli, ["data", "--help"])
-        assert result.exit_code == 0
-        assert "データ管理コマンド" in result.output
+    return entry
 
 
 class TestErrorHandling:
@@ -186,44 +165,28 @@ class TestErrorHandling:
 
     def test_keyboard_interrupt(self):
         """KeyboardInterrupt のテスト"""
-        with patch("rd_burndown.cli.main.cli") as mock_cli:
-            mock_cli.side_effect = KeyboardInterrupt()
-
-            from rd_burndown.cli.main import main
+        with pytest.raises(SystemExit) as exc_info:
+            main(entry=_raiser(KeyboardInterrupt()))
 
-            with pytest.raises(SystemExit) as exc_info:
-                main()
-
-            assert exc_info.value.code == 1
+        assert exc_info.value.code == 1
 
     def test_general_exception(self):
         """一般的な例外のテスト"""
-        with patch("rd_burndown.cli.main.cli") as mock_cli:
-            mock_cli.side_effect = Exception("Test error")
+        with pytest.raises(SystemExit) as exc_info:
+            main(entry=_raiser(Exception("Test error")))
 
-            from rd_burndown.cli.main import main
-
-            with pytest.raises(SystemExit) as exc_info:
-                main()
-
-            assert exc_info.value.code == 1
+        assert exc_info.value.code == 1
 
     def test_system_exit(self):
         """SystemExit のテスト"""
-        with patch("rd_burndown.cli.main.cli") as mock_cli:
-            mock_cli.side_effect = SystemExit(42)
-
-            from rd_burndown.cli.main import main
-
-            with pytest.raises(SystemExit) as exc_info:
-                main()
+        with pytest.raises(SystemExit) as exc_info:
+            main(entry=_raiser(SystemExit(42)))
 
-            assert exc_info.value.code == 42
+        assert exc_info.value.code == 42
 
     def test_main_function_normal_execution(self):
         """main関数の正常実行テスト"""
         import sys
-        from unittest.mock import patch
 
         from rd_burndown.cli.main import main
 
@@ -0,0 +1,22 @@
+"""CLI起動時間のベンチマークテスト"""
+
+import subprocess
+import sys
+
+# インタプリタ起動から --help 出力までを別プロセスで計測する
+_HELP_COMMAND = [
+    sys.executable,
+    "-c",
+    "from rd_burndown.cli.main import main; main()",
+    "--help",
+]
+
+
+def test_cli_help_startup(benchmark):
+    """--help 実行時間のベンチマーク（モジュール読み込みを含むプロセス全体）"""
+    result = benchmark(
+        subprocess.run, _HELP_COMMAND, capture_output=True, text=True, check=False
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "Redmine バーンダウンチャート生成ツール" in result.stdout
@@ -2,120 +2,137 @@
 
 from datetime import date
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
-from click.testing import CliRunner
+import pytest
 
 from rd_burndown.cli.chart import chart
 
-
-class TestChartCommands:
-    """チャートコマンドのテスト"""
-
-    def test_chart_group_help(self):
-        """チャートグループのヘルプテスト"""
-        runner = CliRunner()
-        result = runner.invoke(chart, ["--help"])
-        assert result.exit_code == 0
-        assert "チャート生成コマンド" in result.output
-
-    @patch("rd_burndown.cli.chart.get_chart_generator")
-    def test_burndown_chart_generate(self, mock_get_generator):
-        """バーンダウンチャート生成のテスト"""
-        mock_generator = Mock()
-        mock_generator.generate_burndown_chart.return_value = "chart.png"
-        mock_get_generator.return_value = mock_generator
-
-        runner = CliRunner()
-        result = runner.invoke(
-            chart, ["burndown", "1", "--output", "test.png"], obj={"verbose": False}
-        )
-        assert result.exit_code == 0
-
-    @patch("rd_burndown.cli.chart.get_chart_generator")
-    def test_burndown_chart_error(self, mock_get_generator):
-        """バーンダウンチャート生成エラーのテスト"""
-        mock_generator = Mock()
-        mock_generator.generate_burndown_chart.side_effect = Exception("Chart error")
-        mock_get_generator.return_value = mock_generator
-
-        runner = CliRunner()
-        result = runner.invoke(
-            chart, ["burndown", "1", "--output", "test.png"], obj={"verbose": False}
-        )
-        assert result.exit_code == 1
-
-    @patch("rd_burndown.cli.chart.get_chart_generator")
-    def test_burndown_chart_with_ideal_start_date(self, mock_get_generator):
-        """バーンダウンチャート生成（理想線開始日指定）"""
-        mock_generator = MagicMock()
-        mock_get_generator.return_value = mock_generator
-        mock_generator.generate_burndown_chart.return_value = Path("/test/chart.png")
-
-        runner = CliRunner()
-        result = runner.invoke(
-            chart,
-            ["burndown", "123", "--ideal-start-date", "2024-01-02"],
-            obj={"verbose": False},  # contextオブジェクトを追加
-        )
-
-        # デバッグ出力
-        if result.exit_code != 0:
-            print(f"Output: {result.output}")
-            print(f"Exception: {result.exception}")
-
-        assert result.exit_code == 0
-        mock_generator.generate_burndown_chart.assert_called_once_with(
-            project_id=123,
-            output_path=None,
-            start_date=None,
-            end_date=None,
-            ideal_start_date=date(2024, 1, 2),
-            width=1200,
-            height=800,
-            dpi=300,
-        )
-
-    @patch("rd_burndown.cli.chart.get_chart_generator")
-    def test_scope_chart_generate(self, mock_get_generator):
-        """スコープチャート生成のテスト"""
-        mock_generator = Mock()
-        mock_generator.generate_scope_chart.return_value = "scope.png"
-        mock_get_generator.return_value = mock_generator
-
-        runner = CliRunner()
-        result = runner.invoke(
-            chart, ["scope", "1", "--output", "scope.png"], obj={"verbose": False}
-        )
-        assert result.exit_code == 0
-
-    @patch("rd_burndown.cli.chart.get_chart_generator")
-    def test_scope_chart_error(self, mock_get_generator):
-        """スコープチャート生成エラーのテスト"""
-        mock_generator = Mock()
-        mock_generator.generate_scope_chart.side_effect = Exception("Scope error")
-        mock_get_generator.return_value = mock_generator
-
-        runner = CliRunner()
-        result = runner.invoke(
-            chart, ["scope", "1", "--output", "scope.png"], obj={"verbose": False}
-        )
-        assert result.exit_code == 1
-
-    @patch("rd_burndown.cli.chart.get_chart_generator")
-    def test_combined_chart_generate(self, mock_get_generator):
-        """統合チャート生成のテスト"""
-        mock_generator = Mock()
-        mock_generator.generate_combined_chart.return_value = "combined.png"
-        mock_get_generator.return_value = mock_generator
-
-        runner = CliRunner()
-        result = runner.invoke(
-            chart, ["combined", "1", "--output", "combined.png"], obj={"verbose": False}
-        )
-        assert result.exit_code == 0
-
-
-def add_chart_commands(cli_group):
-    """チャートコマンドをCLIに追加"""
-    cli_group.add_command(chart)
+# (サブコマンド, ChartGenerator のメソッド名, 出力パス)
+CHART_CASES = [
+    ("burndown", "generate_burndown_chart", "chart.png"),
+    ("scope", "generate_scope_chart", "scope.png"),
+    ("combined", "generate_combined_chart", "combined.png"),
+]
+
+
+_IDEAL_START = date(2024, 1, 2)
+
+# 理想線開始日指定時に generate_burndown_chart へ渡される引数（既定値込み）
+_IDEAL_START_EXPECTED_KWARGS = {
+    "project_id": 123,
+    "output_path": None,
+    "start_date": None,
+    "end_date": None,
+    "ideal_start_date": _IDEAL_START,
+    "width": 1200,
+    "height": 800,
+    "dpi": 300,
+}
+
+
+@pytest.fixture(scope="session")
+def _success_generator_template():
+    """正常系チャートジェネレーターモックのテンプレート（セッションで1回だけ生成）"""
+    generator = Mock()
+    for _, method, output in CHART_CASES:
+        getattr(generator, method).return_value = output
+    return generator
+
+
+@pytest.fixture
+def success_generator(monkeypatch, _success_generator_template):
+    """get_chart_generator が返す正常系チャートジェネレーターのモック
+
+    テンプレートの呼び出し履歴のみをリセットして返す。戻り値はテスト間で共有される
+    ため、変更が必要なテストでは個別に Mock を作成すること。
+    """
+    _success_generator_template.reset_mock()
+    monkeypatch.setattr(
+        "rd_burndown.cli.chart.get_chart_generator",
+        lambda: _success_generator_template,
+    )
+    return _success_generator_template
+
+
+def _install_generator(monkeypatch, **methods):
+    """呼び出し検証が不要なテスト用の軽量なチャートジェネレーターを差し込む"""
+    generator = SimpleNamespace(**methods)
+    monkeypatch.setattr("rd_burndown.cli.chart.get_chart_generator", lambda: generator)
+    return generator
+
+
+def _raise_chart_error(**kwargs):
+    """チャート生成失敗を模擬する"""
+    raise Exception("Chart error")
+
+
+def test_chart_group_help(runner):
+    """チャートグループのヘルプテスト"""
+    result = runner.invoke(chart, ["--help"], catch_exceptions=False)
+    assert result.exit_code == 0, result.output
+    assert "チャート生成コマンド" in result.output
+
+
+@pytest.mark.parametrize(
+    ("subcommand", "method", "output"),
+    CHART_CASES,
+    ids=[case[0] for case in CHART_CASES],
+)
+def test_chart_generate(
+    invoke_in_process, success_generator, subcommand, method, output
+):
+    """チャート生成のテスト"""
+    invoke_in_process(
+        chart,
+        [subcommand, "1", "--output", output],
+        obj={"verbose": False},
+    )
+
+    generate = getattr(success_generator, method)
+    generate.assert_called_once()
+    assert generate.call_args.kwargs["output_path"] == Path(output)
+
+
+@pytest.mark.parametrize(
+    ("subcommand", "method", "output"),
+    CHART_CASES,
+    ids=[case[0] for case in CHART_CASES],
+)
+def test_chart_generate_error(runner, monkeypatch, subcommand, method, output):
+    """チャート生成エラーのテスト"""
+    _install_generator(monkeypatch, **{method: _raise_chart_error})
+
+    result = runner.invoke(
+        chart,
+        [subcommand, "1", "--output", output],
+        obj={"verbose": False},
+        standalone_mode=False,
+    )
+    assert result.exit_code == 1
+
+
+def test_burndown_chart_with_ideal_start_date(invoke_in_process, success_generator):
+    """バーンダウンチャート生成（理想線開始日指定）"""
+    invoke_in_process(
+        chart,
+        ["burndown", "123", "--ideal-start-date", _IDEAL_START.isoformat()],
+        obj={"verbose": False},
+    )
+
+    success_generator.generate_burndown_chart.assert_called_once_with(
+        **_IDEAL_START_EXPECTED_KWARGS
+    )
+
+
+def test_get_chart_generator_delegates(monkeypatch):
+    """チャートジェネレーター取得の委譲テスト"""
+    from rd_burndown.cli.chart import get_chart_generator
+
+    generator = Mock()
+    monkeypatch.setattr(
+        "rd_burndown.core.chart_generator.get_chart_generator", lambda: generator
+    )
+
+    assert get_chart_generator() is generator
@@ -1,502 +1,394 @@
 """データCLIコマンドのテスト"""
 
-from datetime import date
-from unittest.mock import Mock, patch
+import json
+from unittest.mock import Mock
 
 import click
-from click.testing import CliRunner
+import pytest
 
 from rd_burndown.cli.data import data as data_cli
+from rd_burndown.tests._common import DATE_0101
 
+# スナップショット1件のタイムライン（エクスポート処理は変更しないため共有する）
+_SINGLE_SNAPSHOT_TIMELINE = {
+    "project": {"id": 1, "name": "Test Project"},
+    "snapshots": [{"date": "2024-01-01", "remaining_hours": 100.0}],
+    "scope_changes": [],
+}
 
-class TestDataCommands:
-    """データコマンドのテスト"""
-
-    def test_data_group_help(self):
-        """データグループのヘルプテスト"""
-        runner = CliRunner()
-        result = runner.invoke(data_cli, ["--help"])
-        assert result.exit_code == 0
-        assert "データ管理コマンド" in result.output
-
-    @patch("rd_burndown.cli.data.get_data_manager")
-    def test_data_fetch(self, mock_get_manager):
-        """データ取得のテスト"""
-        mock_manager = Mock()
-        mock_manager.fetch_project_updates.return_value = None
-        mock_manager.get_cache_status.return_value = {"error": "none"}
-        mock_get_manager.return_value = mock_manager
-
-        runner = CliRunner()
-        result = runner.invoke(data_cli, ["fetch", "1"], obj={"verbose": False})
-        assert result.exit_code == 0
-
-    @patch("rd_burndown.cli.data.get_data_manager")
-    def test_data_fetch_error(self, mock_get_manager):
-        """データ取得エラーのテスト"""
-        mock_manager = Mock()
-        mock_manager.fetch_project_updates.side_effect = Exception("Fetch error")
-        mock_get_manager.return_value = mock_manager
-
-        runner = CliRunner()
-        result = runner.invoke(data_cli, ["fetch", "1"], obj={"verbose": False})
-        assert result.exit_code == 1
-
-    @patch("rd_burndown.cli.data.get_data_manager")
-    def test_data_cache_clear(self, mock_get_manager):
-        """データキャッシュクリアのテスト"""
-        mock_manager = Mock()
-        mock_manager.clear_project_cache.return_value = None
-        mock_get_manager.return_value = mock_manager
-
-        runner = CliRunner()
-        result = runner.invoke(data_cli, ["cache", "clear"], obj={"verbose": False})
-        assert result.exit_code == 0
-
-
-class TestDataFetchCommand:
-    """Data fetch command tests."""
-
-    def test_fetch_with_full_option(self):
-        """Test fetch command with --full option."""
-        runner = CliRunner()
-        with patch("rd_burndown.cli.data.get_data_manager") as mock_dm:
-            mock_manager = Mock()
-            mock_dm.return_value = mock_manager
-
-            result = runner.invoke(
-                data_cli, ["fetch", "1", "--full"], obj={"verbose": False}
-            )
-
-            assert result.exit_code == 0
-            mock_manager.fetch_project_updates.assert_called_once_with(
-                project_id=1, incremental=False, since_date=None
-            )
-
-    def test_fetch_with_since_option(self):
-        """Test fetch command with --since option."""
-        runner = CliRunner()
-        with patch("rd_burndown.cli.data.get_data_manager") as mock_dm:
-            mock_manager = Mock()
-            mock_dm.return_value = mock_manager
-
-            result = runner.invoke(
-                data_cli,
-                ["fetch", "1", "--since", "2024-01-01"],
-                obj={"verbose": False},
-            )
-
-            assert result.exit_code == 0
-            mock_manager.fetch_project_updates.assert_called_once_with(
-                project_id=1, incremental=True, since_date=date(2024, 1, 1)
-            )
-
-    def test_fetch_with_verbose(self):
-        """Test fetch command with verbose output."""
-        runner = CliRunner()
-        with patch("rd_burndown.cli.data.get_data_manager") as mock_dm:
-            mock_manager = Mock()
-            mock_manager.get_cache_status.return_value = {
-                "tickets_count": 10,
-                "snapshots_count": 20,
-                "scope_changes_count": 5,
-            }
-            mock_dm.return_value = mock_manager
-
-            # Note: The -v flag and obj verbose setting interact in a complex way
-            # This test focuses on the core functionality rather than CLI flag handling
-            result = runner.invoke(data_cli, ["fetch", "1"], obj={"verbose": True})
-
-            assert result.exit_code == 0
-            mock_manager.get_cache_status.assert_called_once_with(1)
-
-
-class TestDataCacheCommand:
-    """Data cache command tests."""
-
-    def test_cache_clear_with_project_id(self):
-        """Test cache clear for specific project."""
-        runner = CliRunner()
-        with patch("rd_burndown.cli.data.get_data_manager") as mock_dm:
-            mock_manager = Mock()
-            mock_dm.return_value = mock_manager
-
-            result = runner.invoke(
-                data_cli,
-                ["cache", "clear", "--project-id", "1"],
-                obj={"verbose": False},
-            )
-
-            assert result.exit_code == 0
-            mock_manager.clear_project_cache.assert_called_once_with(1)
-
-    def test_cache_clear_without_project_id(self):
-        """Test cache clear without project ID."""
-        runner = CliRunner()
-        with patch("rd_burndown.cli.data.get_data_manager") as mock_dm:
-            mock_manager = Mock()
-            mock_dm.return_value = mock_manager
-
-            result = runner.invoke(data_cli, ["cache", "clear"], obj={"verbose": False})
-
-            assert result.exit_code == 0
-            assert "プロジェクトIDを指定してください" in result.output
-
-    def test_cache_clear_error(self):
-        """Test cache clear with error."""
-        runner = CliRunner()
-        with patch("rd_burndown.cli.data.get_data_manager") as mock_dm:
-            mock_manager = Mock()
-            mock_manager.clear_project_cache.side_effect = Exception("Clear error")
-            mock_dm.return_value = mock_manager
-
-            result = runner.invoke(
-                data_cli,
-                ["cache", "clear", "--project-id", "1"],
-                obj={"verbose": False},
-            )
-
-            assert result.exit_code == 1
-            # The exception type varies depending on CLI implementation
-
-    def test_cache_status_specific_project(self):
-        """Test cache status for specific project."""
-        runner = CliRunner()
-        with patch("rd_burndown.cli.data.get_data_manager") as mock_dm:
-            mock_manager = Mock()
-            mock_manager.get_cache_status.return_value = {
-                "project_name": "Test Project",
-                "tickets_count": 10,
-                "snapshots_count": 20,
-                "scope_changes_count": 5,
-                "last_update": "2024-01-01 12:00:00",
-                "database_size": 1024000,
-            }
-            mock_dm.return_value = mock_manager
-
-            result = runner.invoke(
-                data_cli,
-                ["cache", "status", "--project-id", "1"],
-                obj={"verbose": False},
-            )
-
-            assert result.exit_code == 0
-            mock_manager.get_cache_status.assert_called_once_with(1)
-
-    def test_cache_status_project_error(self):
-        """Test cache status for project with error."""
-        runner = CliRunner()
-        with patch("rd_burndown.cli.data.get_data_manager") as mock_dm:
-            mock_manager = Mock()
-            mock_manager.get_cache_status.return_value = {"error": "Project not found"}
-            mock_dm.return_value = mock_manager
-
-            result = runner.invoke(
-                data_cli,
-                ["cache", "status", "--project-id", "1"],
-                obj={"verbose": False},
-            )
-
-            assert result.exit_code == 0
-            assert "Project not found" in result.output
-
-    def test_cache_status_global(self):
-        """Test cache status for all projects."""
-        runner = CliRunner()
-        with patch("rd_burndown.cli.data.get_data_manager") as mock_dm:
-            mock_manager = Mock()
-            mock_manager.get_cache_status.return_value = {
-                "database_info": {
-                    "version": "3.37.0",
-                    "file_size_bytes": 2048000,
-                    "tables": {
-                        "projects": 5,
-                        "tickets": 50,
-                        "daily_snapshots": 100,
-                        "scope_changes": 10,
-                    },
-                },
-                "cache_directory": "/tmp/cache",
-                "cache_ttl_hours": 24,
-            }
-            mock_dm.return_value = mock_manager
-
-            result = runner.invoke(
-                data_cli, ["cache", "status"], obj={"verbose": False}
-            )
-
-            assert result.exit_code == 0
-            mock_manager.get_cache_status.assert_called_once_with(None)
-
-    def test_cache_status_global_verbose(self):
-        """Test cache status for all projects with verbose."""
-        runner = CliRunner()
-        with patch("rd_burndown.cli.data.get_data_manager") as mock_dm:
-            mock_manager = Mock()
-            mock_manager.get_cache_status.return_value = {
-                "database_info": {
-                    "version": "3.37.0",
-                    "file_size_bytes": 2048000,
-                    "tables": {
-                        "projects": 5,
-                        "tickets": 50,
-                        "daily_snapshots": 100,
-                        "scope_changes": 10,
-                    },
-                },
-                "cache_directory": "/tmp/cache",
-                "cache_ttl_hours": 24,
-            }
-            mock_dm.return_value = mock_manager
-
-            result = runner.invoke(data_cli, ["cache", "status"], obj={"verbose": True})
-
-            assert result.exit_code == 0
-
-    def test_cache_status_error(self):
-        """Test cache status with error."""
-        runner = CliRunner()
-        with patch("rd_burndown.cli.data.get_data_manager") as mock_dm:
-            mock_manager = Mock()
-            mock_manager.get_cache_status.side_effect = Exception("Status error")
-            mock_dm.return_value = mock_manager
-
-            result = runner.invoke(
-                data_cli, ["cache", "status"], obj={"verbose": False}
-            )
-
-            assert result.exit_code == 1
-            # The exception type varies depending on CLI implementation
-
-    def test_cache_size_specific_project(self):
-        """Test cache size for specific project."""
-        runner = CliRunner()
-        with patch("rd_burndown.cli.data.get_data_manager") as mock_dm:
-            mock_manager = Mock()
-            mock_manager.get_cache_status.return_value = {"database_size": 1024000}
-            mock_dm.return_value = mock_manager
-
-            result = runner.invoke(
-                data_cli, ["cache", "size", "--project-id", "1"], obj={"verbose": False}
-            )
-
-            assert result.exit_code == 0
-            mock_manager.get_cache_status.assert_called_once_with(1)
-
-    def test_cache_size_project_error(self):
-        """Test cache size for project with error."""
-        runner = CliRunner()
-        with patch("rd_burndown.cli.data.get_data_manager") as mock_dm:
-            mock_manager = Mock()
-            mock_manager.get_cache_status.return_value = {"error": "Project not found"}
-            mock_dm.return_value = mock_manager
-
-            result = runner.invoke(
-                data_cli, ["cache", "size", "--project-id", "1"], obj={"verbose": False}
-            )
-
-            assert result.exit_code == 0
-            assert "Project not found" in result.output
-
-    def test_cache_size_global(self):
-        """Test cache size for all projects."""
-        runner = CliRunner()
-        with patch("rd_burndown.cli.data.get_data_manager") as mock_dm:
-            mock_manager = Mock()
-            mock_manager.get_cache_status.return_value = {
-                "database_info": {"file_size_bytes": 2048000}
-            }
-            mock_dm.return_value = mock_manager
-
-            result = runner.invoke(data_cli, ["cache", "size"], obj={"verbose": False})
-
-            assert result.exit_code == 0
-
-    def test_cache_size_error(self):
-        """Test cache size with error."""
-        runner = CliRunner()
-        with patch("rd_burndown.cli.data.get_data_manager") as mock_dm:
-            mock_manager = Mock()
-            mock_manager.get_cache_status.side_effect = Exception("Size error")
-            mock_dm.return_value = mock_manager
-
-            result = runner.invoke(data_cli, ["cache", "size"], obj={"verbose": False})
-
-            assert result.exit_code == 1
-            # The exception type varies depending on CLI implementation
-
-
-class TestDataExportCommand:
-    """Data export command tests."""
-
-    def test_export_json_default(self):
-        """Test export command with JSON format (default)."""
-        runner = CliRunner()
-        with patch("rd_burndown.cli.data.get_data_manager") as mock_dm:
-            mock_manager = Mock()
-            mock_manager.get_project_timeline.return_value = {
-                "project": {"id": 1, "name": "Test Project"},
-                "snapshots": [{"date": "2024-01-01", "remaining_hours": 100.0}],
-                "scope_changes": [],
-            }
-            mock_dm.return_value = mock_manager
-
-            with (
-                patch("builtins.open", create=True) as mock_open,
-                patch("json.dump") as mock_json_dump,
-            ):
-                mock_file = Mock()
-                mock_open.return_value.__enter__.return_value = mock_file
-
-                result = runner.invoke(
-                    data_cli, ["export", "1"], obj={"verbose": False}
-                )
-
-                assert result.exit_code == 0
-                mock_manager.get_project_timeline.assert_called_once_with(1)
-                mock_json_dump.assert_called_once()
-
-    def test_export_csv_format(self):
-        """Test export command with CSV format."""
-        runner = CliRunner()
-        with patch("rd_burndown.cli.data.get_data_manager") as mock_dm:
-            mock_manager = Mock()
-            mock_manager.get_project_timeline.return_value = {
-                "project": {"id": 1, "name": "Test Project"},
-                "snapshots": [{"date": "2024-01-01", "remaining_hours": 100.0}],
-                "scope_changes": [],
-            }
-            mock_dm.return_value = mock_manager
-
-            with (
-                patch("builtins.open", create=True) as mock_open,
-                patch("csv.DictWriter") as mock_csv,
-            ):
-                mock_file = Mock()
-                mock_open.return_value.__enter__.return_value = mock_file
-                mock_writer = Mock()
-                mock_csv.return_value = mock_writer
-
-                result = runner.invoke(
-                    data_cli,
-                    ["export", "1", "--format", "csv"],
-                    obj={"verbose": False},
-                )
-
-                assert result.exit_code == 0
-                mock_writer.writeheader.assert_called_once()
-                mock_writer.writerows.assert_called_once()
-
-    def test_export_with_output_path(self):
-        """Test export command with custom output path."""
-        runner = CliRunner()
-        with patch("rd_burndown.cli.data.get_data_manager") as mock_dm:
-            mock_manager = Mock()
-            mock_manager.get_project_timeline.return_value = {
-                "project": {"id": 1, "name": "Test Project"},
-                "snapshots": [],
-                "scope_changes": [],
-            }
-            mock_dm.return_value = mock_manager
-
-            with (
-                patch("builtins.open", create=True) as mock_open,
-                patch("json.dump"),
-            ):
-                mock_file = Mock()
-                mock_open.return_value.__enter__.return_value = mock_file
-
-                result = runner.invoke(
-                    data_cli,
-                    ["export", "1", "--output", "custom.json"],
-                    obj={"verbose": False},
-                )
-
-                assert result.exit_code == 0
-
-    def test_export_with_date_range(self):
-        """Test export command with date range filtering."""
-        runner = CliRunner()
-        with patch("rd_burndown.cli.data.get_data_manager") as mock_dm:
-            mock_manager = Mock()
-            mock_manager.get_project_timeline.return_value = {
-                "project": {"id": 1, "name": "Test Project"},
-                "snapshots": [
-                    {"date": "2024-01-01", "remaining_hours": 100.0},
-                    {"date": "2024-01-15", "remaining_hours": 50.0},
-                    {"date": "2024-02-01", "remaining_hours": 25.0},
-                ],
-                "scope_changes": [{"date": "2024-01-10", "hours_delta": 10.0}],
-            }
-            mock_dm.return_value = mock_manager
-
-            with (
-                patch("builtins.open", create=True) as mock_open,
-                patch("json.dump"),
-            ):
-                mock_file = Mock()
-                mock_open.return_value.__enter__.return_value = mock_file
-
-                result = runner.invoke(
-                    data_cli,
-                    ["export", "1", "--from", "2024-01-05", "--to", "2024-01-20"],
-                    obj={"verbose": False},
-                )
-
-                assert result.exit_code == 0
-
-    def test_export_with_verbose(self):
-        """Test export command with verbose output."""
-        runner = CliRunner()
-        with patch("rd_burndown.cli.data.get_data_manager") as mock_dm:
-            mock_manager = Mock()
-            mock_manager.get_project_timeline.return_value = {
-                "project": {"id": 1, "name": "Test Project"},
-                "snapshots": [{"date": "2024-01-01", "remaining_hours": 100.0}],
-                "scope_changes": [],
-            }
-            mock_dm.return_value = mock_manager
-
-            with (
-                patch("builtins.open", create=True) as mock_open,
-                patch("pathlib.Path.stat") as mock_stat,
-                patch("json.dump"),
-            ):
-                mock_file = Mock()
-                mock_open.return_value.__enter__.return_value = mock_file
-                mock_stat_obj = Mock()
-                mock_stat_obj.st_size = 1024
-                mock_stat.return_value = mock_stat_obj
-
-                result = runner.invoke(data_cli, ["export", "1"], obj={"verbose": True})
-
-                assert result.exit_code == 0
-
-    def test_export_project_not_found(self):
-        """Test export command when project not found."""
-        runner = CliRunner()
-        with patch("rd_burndown.cli.data.get_data_manager") as mock_dm:
-            mock_manager = Mock()
-            mock_manager.get_project_timeline.return_value = None
-            mock_dm.return_value = mock_manager
-
-            result = runner.invoke(data_cli, ["export", "999"], obj={"verbose": False})
-
-            assert result.exit_code == 1
-            # The exception type varies depending on CLI implementation
-
-    def test_export_with_error(self):
-        """Test export command with error."""
-        runner = CliRunner()
-        with patch("rd_burndown.cli.data.get_data_manager") as mock_dm:
-            mock_manager = Mock()
-            mock_manager.get_project_timeline.side_effect = Exception("Export error")
-            mock_dm.return_value = mock_manager
-
-            result = runner.invoke(data_cli, ["export", "1"], obj={"verbose": False})
-
-            assert result.exit_code == 1
-            # The exception type varies depending on CLI implementation
+
+@pytest.fixture
+def mock_manager(monkeypatch):
+    """get_data_manager が返すデータマネージャーのモック"""
+    manager = Mock()
+    monkeypatch.setattr("rd_burndown.cli.data.get_data_manager", lambda: manager)
+    return manager
+
+
+def test_data_group_help(runner):
+    """データグループのヘルプテスト"""
+    result = runner.invoke(data_cli, ["--help"], catch_exceptions=False)
+    assert result.exit_code == 0, result.output
+    assert "データ管理コマンド" in result.output
+
+
+def test_fetch_with_full_option(invoke_in_process, mock_manager):
+    """Test fetch command with --full option."""
+    invoke_in_process(
+        data_cli,
+        ["fetch", "1", "--full"],
+        obj={"verbose": False},
+    )
+
+    mock_manager.fetch_project_updates.assert_called_once_with(
+        project_id=1, incremental=False, since_date=None
+    )
+
+
+def test_fetch_with_since_option(invoke_in_process, mock_manager):
+    """Test fetch command with --since option."""
+    invoke_in_process(
+        data_cli,
+        ["fetch", "1", "--since", "2024-01-01"],
+        obj={"verbose": False},
+    )
+
+    mock_manager.fetch_project_updates.assert_called_once_with(
+        project_id=1, incremental=True, since_date=DATE_0101
+    )
+
+
+def test_fetch_with_verbose(invoke_in_process, mock_manager):
+    """Test fetch command with verbose output."""
+    mock_manager.get_cache_status.return_value = {
+        "tickets_count": 10,
+        "snapshots_count": 20,
+        "scope_changes_count": 5,
+    }
+
+    # Note: The -v flag and obj verbose setting interact in a complex way
+    # This test focuses on the core functionality rather than CLI flag handling
+    invoke_in_process(data_cli, ["fetch", "1"], obj={"verbose": True})
+
+    mock_manager.get_cache_status.assert_called_once_with(1)
+
+
+def test_fetch_error(runner, mock_manager):
+    """Test fetch command with error."""
+    mock_manager.fetch_project_updates.side_effect = Exception("Fetch error")
+
+    result = runner.invoke(
+        data_cli, ["fetch", "1"], obj={"verbose": False}, standalone_mode=False
+    )
+
+    assert result.exit_code == 1
+
+
+def test_cache_clear_with_project_id(invoke_in_process, mock_manager):
+    """Test cache clear for specific project."""
+    invoke_in_process(
+        data_cli,
+        ["cache", "clear", "--project-id", "1"],
+        obj={"verbose": False},
+    )
+
+    mock_manager.clear_project_cache.assert_called_once_with(1)
+
+
+def test_cache_clear_without_project_id(runner, mock_manager):
+    """Test cache clear without project ID."""
+    result = runner.invoke(
+        data_cli, ["cache", "clear"], obj={"verbose": False}, catch_exceptions=False
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "プロジェクトIDを指定してください" in result.output
+
+
+def test_cache_clear_error(runner, mock_manager):
+    """Test cache clear with error."""
+    mock_manager.clear_project_cache.side_effect = Exception("Clear error")
+
+    result = runner.invoke(
+        data_cli,
+        ["cache", "clear", "--project-id", "1"],
+        obj={"verbose": False},
+        standalone_mode=False,
+    )
+
+    assert result.exit_code == 1
+    # The exception type varies depending on CLI implementation
+
+
+def test_cache_status_specific_project(invoke_in_process, mock_manager):
+    """Test cache status for specific project."""
+    mock_manager.get_cache_status.return_value = {
+        "project_name": "Test Project",
+        "tickets_count": 10,
+        "snapshots_count": 20,
+        "scope_changes_count": 5,
+        "last_update": "2024-01-01 12:00:00",
+        "database_size": 1024000,
+    }
+
+    invoke_in_process(
+        data_cli,
+        ["cache", "status", "--project-id", "1"],
+        obj={"verbose": False},
+    )
+
+    mock_manager.get_cache_status.assert_called_once_with(1)
+
+
+def test_cache_status_project_error(runner, mock_manager):
+    """Test cache status for project with error."""
+    mock_manager.get_cache_status.return_value = {"error": "Project not found"}
+
+    result = runner.invoke(
+        data_cli,
+        ["cache", "status", "--project-id", "1"],
+        obj={"verbose": False},
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Project not found" in result.output
+
+
+def test_cache_status_global(invoke_in_process, mock_manager):
+    """Test cache status for all projects."""
+    mock_manager.get_cache_status.return_value = {
+        "database_info": {
+            "version": "3.37.0",
+            "file_size_bytes": 2048000,
+            "tables": {
+                "projects": 5,
+                "tickets": 50,
+                "daily_snapshots": 100,
+                "scope_changes": 10,
+            },
+        },
+        "cache_directory": "/tmp/cache",
+        "cache_ttl_hours": 24,
+    }
+
+    invoke_in_process(data_cli, ["cache", "status"], obj={"verbose": False})
+
+    mock_manager.get_cache_status.assert_called_once_with(None)
+
+
+def test_cache_status_global_verbose(invoke_in_process, mock_manager):
+    """Test cache status for all projects with verbose."""
+    mock_manager.get_cache_status.return_value = {
+        "database_info": {
+            "version": "3.37.0",
+            "file_size_bytes": 2048000,
+            "tables": {
+                "projects": 5,
+                "tickets": 50,
+                "daily_snapshots": 100,
+                "scope_changes": 10,
+            },
+        },
+        "cache_directory": "/tmp/cache",
+        "cache_ttl_hours": 24,
+    }
+
+    invoke_in_process(data_cli, ["cache", "status"], obj={"verbose": True})
+
+
+def test_cache_status_error(runner, mock_manager):
+    """Test cache status with error."""
+    mock_manager.get_cache_status.side_effect = Exception("Status error")
+
+    result = runner.invoke(
+        data_cli, ["cache", "status"], obj={"verbose": False}, standalone_mode=False
+    )
+
+    assert result.exit_code == 1
+    # The exception type varies depending on CLI implementation
+
+
+def test_cache_size_specific_project(invoke_in_process, mock_manager):
+    """Test cache size for specific project."""
+    mock_manager.get_cache_status.return_value = {"database_size": 1024000}
+
+    invoke_in_process(
+        data_cli,
+        ["cache", "size", "--project-id", "1"],
+        obj={"verbose": False},
+    )
+
+    mock_manager.get_cache_status.assert_called_once_with(1)
+
+
+def test_cache_size_project_error(runner, mock_manager):
+    """Test cache size for project with error."""
+    mock_manager.get_cache_status.return_value = {"error": "Project not found"}
+
+    result = runner.invoke(
+        data_cli,
+        ["cache", "size", "--project-id", "1"],
+        obj={"verbose": False},
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Project not found" in result.output
+
+
+def test_cache_size_global(invoke_in_process, mock_manager):
+    """Test cache size for all projects."""
+    mock_manager.get_cache_status.return_value = {
+        "database_info": {"file_size_bytes": 2048000}
+    }
+
+    invoke_in_process(data_cli, ["cache", "size"], obj={"verbose": False})
+
+
+def test_cache_size_error(runner, mock_manager):
+    """Test cache size with error."""
+    mock_manager.get_cache_status.side_effect = Exception("Size error")
+
+    result = runner.invoke(
+        data_cli, ["cache", "size"], obj={"verbose": False}, standalone_mode=False
+    )
+
+    assert result.exit_code == 1
+    # The exception type varies depending on CLI implementation
+
+
+def test_export_json_default(invoke_in_process, mock_manager, tmp_path, monkeypatch):
+    """Test export command with JSON format (default)."""
+    mock_manager.get_project_timeline.return_value = _SINGLE_SNAPSHOT_TIMELINE
+    monkeypatch.chdir(tmp_path)
+
+    invoke_in_process(data_cli, ["export", "1"], obj={"verbose": False})
+
+    mock_manager.get_project_timeline.assert_called_once_with(1)
+    exported = json.loads((tmp_path / "project_1_export.json").read_text())
+    assert exported["project"]["id"] == 1
+    assert exported["export_info"]["format"] == "json"
+
+
+def test_export_csv_format(invoke_in_process, mock_manager, tmp_path):
+    """Test export command with CSV format."""
+    mock_manager.get_project_timeline.return_value = _SINGLE_SNAPSHOT_TIMELINE
+    out = tmp_path / "out.csv"
+
+    invoke_in_process(
+        data_cli,
+        ["export", "1", "--format", "csv", "--output", str(out)],
+        obj={"verbose": False},
+    )
+
+    assert out.read_text().splitlines() == [
+        "date,remaining_hours",
+        "2024-01-01,100.0",
+    ]
+
+
+def test_export_with_output_path(invoke_in_process, mock_manager, tmp_path):
+    """Test export command with custom output path."""
+    mock_manager.get_project_timeline.return_value = {
+        "project": {"id": 1, "name": "Test Project"},
+        "snapshots": [],
+        "scope_changes": [],
+    }
+    out = tmp_path / "custom.json"
+
+    invoke_in_process(
+        data_cli,
+        ["export", "1", "--output", str(out)],
+        obj={"verbose": False},
+    )
+
+    assert json.loads(out.read_text())["project"]["id"] == 1
+
+
+def test_export_with_date_range(invoke_in_process, mock_manager, tmp_path):
+    """Test export command with date range filtering."""
+    mock_manager.get_project_timeline.return_value = {
+        "project": {"id": 1, "name": "Test Project"},
+        "snapshots": [
+            {"date": "2024-01-01", "remaining_hours": 100.0},
+            {"date": "2024-01-15", "remaining_hours": 50.0},
+            {"date": "2024-02-01", "remaining_hours": 25.0},
+        ],
+        "scope_changes": [{"date": "2024-01-10", "hours_delta": 10.0}],
+    }
+    out = tmp_path / "range.json"
+
+    invoke_in_process(
+        data_cli,
+        [
+            "export",
+            "1",
+            "--from",
+            "2024-01-05",
+            "--to",
+            "2024-01-20",
+            "--output",
+            str(out),
+        ],
+        obj={"verbose": False},
+    )
+
+    exported = json.loads(out.read_text())
+    assert [s["date"] for s in exported["snapshots"]] == ["2024-01-15"]
+    assert [c["date"] for c in exported["scope_changes"]] == ["2024-01-10"]
+
+
+def test_export_with_verbose(runner, mock_manager, tmp_path):
+    """Test export command with verbose output."""
+    mock_manager.get_project_timeline.return_value = _SINGLE_SNAPSHOT_TIMELINE
+    out = tmp_path / "verbose.json"
+
+    result = runner.invoke(
+        data_cli,
+        ["export", "1", "--output", str(out)],
+        obj={"verbose": True},
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 0, result.output
+    assert f"ファイルサイズ: {out.stat().st_size} bytes" in result.output
+
+
+def test_export_project_not_found(runner, mock_manager):
+    """Test export command when project not found."""
+    mock_manager.get_project_timeline.return_value = None
+
+    result = runner.invoke(
+        data_cli, ["export", "999"], obj={"verbose": False}, standalone_mode=False
+    )
+
+    assert result.exit_code == 1
+    # The exception type varies depending on CLI implementation
+
+
+def test_export_with_error(runner, mock_manager):
+    """Test export command with error."""
+    mock_manager.get_project_timeline.side_effect = Exception("Export error")
+
+    result = runner.invoke(
+        data_cli, ["export", "1"], obj={"verbose": False}, standalone_mode=False
+    )
+
+    assert result.exit_code == 1
+    # The exception type varies depending on CLI implementation
+
+
+def test_get_data_manager_delegates(monkeypatch):
+    """データマネージャー取得の委譲テスト"""
+    from rd_burndown.cli.data import get_data_manager
+
+    manager = Mock()
+    monkeypatch.setattr(
+        "rd_burndown.core.data_manager.get_data_manager", lambda: manager
+    )
+
+    assert get_data_manager() is manager
 
 
 def test_add_data_commands():
@@ -1,7 +1,7 @@
 """設定管理システムのテスト"""
 
 import os
-import tempfile
+import stat
 from pathlib import Path
 from unittest.mock import patch
 
@@ -18,18 +18,87 @@ from rd_burndown.utils.config import (
     get_config_manager,
 )
 
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# テスト用の設定ファイル内容（YAMLへのシリアライズを省くため文字列で保持する）
+SAMPLE_YAML = """\
+redmine:
+  url: https://test.example.com
+  api_key: test-api-key-123  # pragma: allowlist secret
+  timeout: 45
+output:
+  default_format: svg
+  default_width: 1600
+"""
+
+
+@pytest.fixture(scope="session")
+def sample_yaml_path(tmp_path_factory):
+    """読み取り専用のサンプル設定ファイル（セッションで1回だけ書き出す）"""
+    config_path = tmp_path_factory.mktemp("cfg") / "config.yaml"
+    config_path.write_text(SAMPLE_YAML, encoding="utf-8")
+    return config_path
+
+
+@pytest.fixture(scope="module")
+def default_config():
+    """デフォルト設定（読み取り専用のためモジュール内で共有する）"""
+    return Config()
+
+
+@pytest.fixture(scope="module")
+def default_config_dump(default_config):
+    """デフォルト設定の model_dump 結果"""
+    return default_config.model_dump()
+
+
+@pytest.mark.parametrize(
+    ("model", "expected"),
+    [
+        (
+            RedmineConfig,
+            {
+                "url": "http://localhost:3000",
+                "api_key": "",
+                "timeout": 30,
+                "verify_ssl": True,
+                "pool_maxsize": 32,
+                "max_per_page": 100,
+            },
+        ),
+        (
+            OutputConfig,
+            {
+                "default_format": "png",
+                "default_width": 1200,
+                "default_height": 800,
+                "default_dpi": 300,
+                "output_dir": "./output",
+            },
+        ),
+        (
+            ChartColors,
+            {
+                "ideal": "#2E8B57",
+                "actual": "#DC143C",
+                "scope": "#4169E1",
+                "dynamic_ideal": "#FF8C00",
+                "background": "#FFFFFF",
+                "grid": "#E0E0E0",
+            },
+        ),
+    ],
+    ids=["redmine", "output", "chart_colors"],
+)
+def test_default_values(model, expected):
+    """各設定モデルのデフォルト値のテスト"""
+    assert model().model_dump(include=set(expected)) == expected
+
 
 class TestRedmineConfig:
     """RedmineConfig のテスト"""
 
-    def test_default_values(self):
-        """デフォルト値のテスト"""
-        config = RedmineConfig()
-        assert config.url == "http://localhost:3000"
-        assert config.api_key == ""
-        assert config.timeout == 30
-        assert config.verify_ssl is True
-
     def test_custom_values(self):
         """カスタム値のテスト"""
         config = RedmineConfig(
@@ -44,39 +113,12 @@ class TestRedmineConfig:
         assert config.verify_ssl is False
 
 
-class TestOutputConfig:
-    """OutputConfig のテスト"""
-
-    def test_default_values(self):
-        """デフォルト値のテスト"""
-        config = OutputConfig()
-        assert config.default_format == "png"
-        assert config.default_width == 1200
-        assert config.default_height == 800
-        assert config.default_dpi == 300
-        assert config.output_dir == "./output"
-
-
-class TestChartColors:
-    """ChartColors のテスト"""
-
-    def test_default_values(self):
-        """デフォルト値のテスト"""
-        colors = ChartColors()
-        assert colors.ideal == "#2E8B57"
-        assert colors.actual == "#DC143C"
-        assert colors.scope == "#4169E1"
-        assert colors.dynamic_ideal == "#FF8C00"
-        assert colors.background == "#FFFFFF"
-        assert colors.grid == "#E0E0E0"
-
-
 class TestConfig:
     """Config のテスト"""
 
-    def test_default_config(self):
+    def test_default_config(self, default_config):
         """デフォルト設定のテスト"""
-        config = Config()
+        config = default_config
 
         # 各セクションが正しく初期化されているか確認
         assert isinstance(config.redmine, RedmineConfig)
@@ -88,10 +130,9 @@ class TestConfig:
         assert config.output.default_format == "png"
         assert config.chart.font_family == "DejaVu Sans"
 
-    def test_model_dump(self):
+    def test_model_dump(self, default_config_dump):
         """model_dump のテスト"""
-        config = Config()
-        data = config.model_dump()
+        data = default_config_dump
 
         assert "redmine" in data
         assert "output" in data
@@ -137,140 +178,160 @@ class TestConfigManager:
         manager = ConfigManager(custom_path)
         assert manager.config_path == custom_path
 
-    def test_create_default_config(self):
+    def test_create_default_config(self, tmp_path):
         """デフォルト設定作成のテスト"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_path = Path(tmp_dir) / "config.yaml"
-            manager = ConfigManager(config_path)
+        config_path = tmp_path / "config.yaml"
+        manager = ConfigManager(config_path)
 
-            config = manager.create_default_config()
+        config = manager.create_default_config()
 
-            # ファイルが作成されているか確認
-            assert config_path.exists()
+        # ファイルが作成されているか確認
+        assert config_path.exists()
 
-            # 設定内容の確認
-            assert isinstance(config, Config)
-            assert config.redmine.url == "http://localhost:3000"
+        # 設定内容の確認
+        assert isinstance(config, Config)
+        assert config.redmine.url == "http://localhost:3000"
 
-    def test_load_config_from_file(self):
+    def test_load_config_from_file(self, sample_yaml_path):
         """ファイルからの設定読み込みテスト"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_path = Path(tmp_dir) / "config.yaml"
-
-            # テスト用YAML作成
-            test_config = {
-                "redmine": {
-                    "url": "https://test.example.com",
-                    "api_key": "test-api-key-123",  # pragma: allowlist secret
-                    "timeout": 45,
-                },
-                "output": {
-                    "default_format": "svg",
-                    "default_width": 1600,
-                },
-            }
-
-            with open(config_path, "w", encoding="utf-8") as f:
-                yaml.dump(test_config, f)
-
-            # 設定読み込み
-            manager = ConfigManager(config_path)
-            config = manager.load_config()
-
-            # 読み込まれた設定の確認
-            assert config.redmine.url == "https://test.example.com"
-            assert (
-                config.redmine.api_key == "test-api-key-123"
-            )  # pragma: allowlist secret
-            assert config.redmine.timeout == 45
-            assert config.output.default_format == "svg"
-            assert config.output.default_width == 1600
-
-    def test_load_config_nonexistent_file(self):
+        manager = ConfigManager(sample_yaml_path)
+        config = manager.load_config()
+
+        # 読み込まれた設定の確認
+        assert config.redmine.url == "https://test.example.com"
+        assert config.redmine.api_key == "test-api-key-123"  # pragma: allowlist secret
+        assert config.redmine.timeout == 45
+        assert config.output.default_format == "svg"
+        assert config.output.default_width == 1600
+
+    def test_load_config_nonexistent_file(self, tmp_path):
         """存在しないファイルからの読み込みテスト"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_path = Path(tmp_dir) / "nonexistent.yaml"
-            manager = ConfigManager(config_path)
-
-            # デフォルト設定が返されるか確認
-            config = manager.load_config()
-            assert isinstance(config, Config)
-            assert config.redmine.url == "http://localhost:3000"
-
-    @patch.dict(
-        os.environ,
-        {
-            "RD_REDMINE_URL": "http://env.example.com",
-            "RD_REDMINE_API_KEY": "env-api-key",  # pragma: allowlist secret
-            "RD_OUTPUT_DIR": "/tmp/output",
-            "RD_CACHE_TTL_HOURS": "24",
-        },
-    )
-    def test_env_overrides(self):
+        config_path = tmp_path / "nonexistent.yaml"
+        manager = ConfigManager(config_path)
+
+        # デフォルト設定が返されるか確認
+        config = manager.load_config()
+        assert isinstance(config, Config)
+        assert config.redmine.url == "http://localhost:3000"
+
+    def test_env_overrides(self, tmp_path, monkeypatch):
         """環境変数オーバーライドのテスト"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_path = Path(tmp_dir) / "config.yaml"
-            manager = ConfigManager(config_path)
+        monkeypatch.setenv("RD_REDMINE_URL", "http://env.example.com")
+        monkeypatch.setenv(
+            "RD_REDMINE_API_KEY",
+            "env-api-key",  # pragma: allowlist secret
+        )
+        monkeypatch.setenv("RD_OUTPUT_DIR", "/tmp/output")
+        monkeypatch.setenv("RD_CACHE_TTL_HOURS", "24")
 
-            config = manager.load_config()
+        config_path = tmp_path / "config.yaml"
+        manager = ConfigManager(config_path)
 
-            # 環境変数で上書きされているか確認
-            assert config.redmine.url == "http://env.example.com"
-            assert config.redmine.api_key == "env-api-key"  # pragma: allowlist secret
-            assert config.output.output_dir == "/tmp/output"
-            assert config.data.cache_ttl_hours == 24
+        config = manager.load_config()
 
-    @patch.dict(os.environ, {"RD_CACHE_TTL_HOURS": "invalid"})
-    def test_env_override_invalid_int(self):
+        # 環境変数で上書きされているか確認
+        assert config.redmine.url == "http://env.example.com"
+        assert config.redmine.api_key == "env-api-key"  # pragma: allowlist secret
+        assert config.output.output_dir == "/tmp/output"
+        assert config.data.cache_ttl_hours == 24
+
+    def test_env_override_invalid_int(self, tmp_path, monkeypatch):
         """無効な整数値の環境変数テスト"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_path = Path(tmp_dir) / "config.yaml"
-            manager = ConfigManager(config_path)
+        monkeypatch.setenv("RD_CACHE_TTL_HOURS", "invalid")
 
-            config = manager.load_config()
+        config_path = tmp_path / "config.yaml"
+        manager = ConfigManager(config_path)
 
-            # 無効な値は無視され、デフォルト値が使用される
-            assert config.data.cache_ttl_hours == 1
+        config = manager.load_config()
 
-    def test_save_config(self):
-        """設定保存のテスト"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_path = Path(tmp_dir) / "config.yaml"
-            manager = ConfigManager(config_path)
+        # 無効な値は無視され、デフォルト値が使用される
+        assert config.data.cache_ttl_hours == 1
 
-            # カスタム設定を作成
-            config = Config()
-            config.redmine.url = "https://saved.example.com"
-            config.redmine.api_key = "saved-key"  # pragma: allowlist secret
+    def test_save_config(self, tmp_path):
+        """設定保存のテスト"""
+        config_path = tmp_path / "config.yaml"
+        manager = ConfigManager(config_path)
+
+        # カスタム設定を作成
+        config = Config(
+            redmine=RedmineConfig(
+                url="https://saved.example.com",
+                api_key="saved-key",  # pragma: allowlist secret
+            )
+        )
 
-            # 設定保存
-            manager.save_config(config)
+        # 設定保存
+        manager.save_config(config)
 
-            # ファイルが作成されているか確認
-            assert config_path.exists()
+        # ファイルが作成されているか確認
+        assert config_path.exists()
 
-            # ファイル内容の確認
-            with open(config_path, encoding="utf-8") as f:
-                saved_data = yaml.safe_load(f)
+        # ファイル内容の確認
+        with open(config_path, encoding="utf-8") as f:
+            saved_data = yaml.load(f, Loader=_Loader)
 
-            assert saved_data["redmine"]["url"] == "https://saved.example.com"
-            # pragma: allowlist secret
-            assert saved_data["redmine"]["api_key"] == "saved-key"
+        assert saved_data["redmine"]["url"] == "https://saved.example.com"
+        # pragma: allowlist secret
+        assert saved_data["redmine"]["api_key"] == "saved-key"
 
-    def test_config_caching(self):
+    def test_config_caching(self, tmp_path):
         """設定キャッシュのテスト"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_path = Path(tmp_dir) / "config.yaml"
-            manager = ConfigManager(config_path)
+        config_path = tmp_path / "config.yaml"
+        manager = ConfigManager(config_path)
+
+        # 初回読み込み
+        config1 = manager.load_config()
+
+        # 2回目読み込み（キャッシュされているはず）
+        config2 = manager.load_config()
+
+        # 同じインスタンスが返されるか確認
+        assert config1 is config2
 
-            # 初回読み込み
-            config1 = manager.load_config()
+    def test_config_cross_manager_cache(self, tmp_path):
+        """ファイル未変更時にマネージャー間で解析結果を共有するテスト"""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("redmine:\n  timeout: 45\n", encoding="utf-8")
 
-            # 2回目読み込み（キャッシュされているはず）
-            config2 = manager.load_config()
+        with patch("rd_burndown.utils.config.yaml.load", wraps=yaml.load) as load:
+            config1 = ConfigManager(config_path).load_config()
+            config2 = ConfigManager(config_path).load_config()
+            assert load.call_count == 1
 
-            # 同じインスタンスが返されるか確認
-            assert config1 is config2
+            # 更新時刻が変わると再解析される
+            st = config_path.stat()
+            os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+            ConfigManager(config_path).load_config()
+            assert load.call_count == 2
+
+        assert config1 is not config2
+        assert config1.redmine.timeout == config2.redmine.timeout == 45
+
+    def test_json_sidecar_used_when_fresh(self, tmp_path):
+        """YAMLが未変更ならJSONキャッシュから読み込むテスト"""
+        config_path = tmp_path / "config.yaml"
+        config = Config()
+        config.redmine.api_key = "sidecar-api-key"  # pragma: allowlist secret
+        config.redmine.timeout = 45
+        ConfigManager(config_path).save_config(config)
+        sidecar = tmp_path / "config.yaml.cache.json"
+        assert sidecar.exists()
+        # APIキーを含むため所有者のみ読み書き可能
+        if os.name == "posix":
+            assert stat.S_IMODE(sidecar.stat().st_mode) == 0o600
+
+        with (
+            patch.dict(ConfigManager._parse_cache, clear=True),
+            patch("rd_burndown.utils.config.yaml.load", wraps=yaml.load) as load,
+        ):
+            loaded = ConfigManager(config_path).load_config()
+            assert load.call_count == 0
+            assert loaded.redmine.timeout == 45
+
+            # YAMLが更新されるとJSONキャッシュは使われない
+            config_path.write_text("redmine:\n  timeout: 60\n", encoding="utf-8")
+            assert ConfigManager(config_path).load_config().redmine.timeout == 60
+            assert load.call_count == 1
 
 
 class TestGetConfigManager:
@@ -292,107 +353,78 @@ class TestGetConfigManager:
 class TestIntegration:
     """統合テスト"""
 
-    def test_full_config_workflow(self):
+    def test_full_config_workflow(self, tmp_path):
         """完全な設定ワークフローのテスト"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_path = Path(tmp_dir) / "config.yaml"
-
-            # 1. ConfigManager作成
-            manager = ConfigManager(config_path)
-
-            # 2. デフォルト設定作成
-            config = manager.create_default_config()
-            assert config_path.exists()
-
-            # 3. 設定変更
-            config.redmine.url = "https://modified.example.com"
-            config.redmine.api_key = "test-workflow-key"  # pragma: allowlist secret
-            config.output.default_width = 1920
-
-            # 4. 設定保存
-            manager.save_config(config)
-
-            # 5. 新しいManagerで読み込み
-            new_manager = ConfigManager(config_path)
-            loaded_config = new_manager.load_config()
-
-            # 6. 変更内容の確認
-            assert loaded_config.redmine.url == "https://modified.example.com"
-            assert loaded_config.output.default_width == 1920
-
-    @patch.dict(
-        os.environ,
-        {
-            "RD_REDMINE_URL": "http://env-override.com",
-            "RD_OUTPUT_FORMAT": "svg",
-        },
-    )
-    def test_config_with_env_and_file(self):
+        config_path = tmp_path / "config.yaml"
+
+        # 1. 設定変更（デフォルト設定の作成は test_create_default_config で検証）
+        config = Config()
+        config.redmine.url = "https://modified.example.com"
+        config.redmine.api_key = "test-workflow-key"  # pragma: allowlist secret
+        config.output.default_width = 1920
+
+        # 2. 設定保存
+        ConfigManager(config_path).save_config(config)
+
+        # 3. 新しいManagerで読み込み
+        loaded_config = ConfigManager(config_path).load_config()
+
+        # 4. 変更内容の確認
+        assert loaded_config.redmine.url == "https://modified.example.com"
+        assert loaded_config.output.default_width == 1920
+
+    def test_config_with_env_and_file(self, sample_yaml_path, monkeypatch):
         """ファイル設定と環境変数の組み合わせテスト"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_path = Path(tmp_dir) / "config.yaml"
-
-            # ファイル設定作成
-            file_config = {
-                "redmine": {
-                    "url": "http://file.example.com",
-                    "api_key": "file-api-key-456",  # pragma: allowlist secret
-                },
-                "output": {
-                    "default_format": "png",
-                    "default_width": 1200,
-                },
-            }
-
-            with open(config_path, "w", encoding="utf-8") as f:
-                yaml.dump(file_config, f)
-
-            # 設定読み込み
-            manager = ConfigManager(config_path)
-            config = manager.load_config()
-
-            # 環境変数が優先されているか確認
-            assert config.redmine.url == "http://env-override.com"  # 環境変数
-            # pragma: allowlist secret
-            assert config.redmine.api_key == "file-api-key-456"  # ファイル
-            assert config.output.default_format == "svg"  # 環境変数
-            assert config.output.default_width == 1200  # ファイル
+        monkeypatch.setenv("RD_REDMINE_URL", "http://env-override.com")
+        monkeypatch.setenv("RD_OUTPUT_FORMAT", "png")
+
+        manager = ConfigManager(sample_yaml_path)
+        config = manager.load_config()
+
+        # 環境変数が優先されているか確認
+        assert config.redmine.url == "http://env-override.com"  # 環境変数
+        # pragma: allowlist secret
+        assert config.redmine.api_key == "test-api-key-123"  # ファイル
+        assert config.output.default_format == "png"  # 環境変数
+        assert config.output.default_width == 1600  # ファイル
 
 
 class TestConfigErrors:
     """設定エラーのテスト"""
 
-    def test_load_config_yaml_error(self):
+    def test_load_config_yaml_error(self, tmp_path):
         """YAML エラーのテスト"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_path = Path(tmp_dir) / "invalid.yaml"
+        config_path = tmp_path / "invalid.yaml"
 
-            # 無効なYAMLファイルを作成
-            with open(config_path, "w", encoding="utf-8") as f:
-                f.write("invalid: yaml: content: [")
+        # 無効なYAMLファイルを作成
+        with open(config_path, "w", encoding="utf-8") as f:
+            f.write("invalid: yaml: content: [")
 
-            manager = ConfigManager(config_path)
+        manager = ConfigManager(config_path)
 
-            with pytest.raises(ConfigError, match="Invalid YAML"):
-                manager.load_config()
+        with pytest.raises(ConfigError, match="Invalid YAML"):
+            manager.load_config()
 
-    def test_load_config_value_error(self):
+    def test_load_config_value_error(self, tmp_path):
         """設定値エラーのテスト"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_path = Path(tmp_dir) / "config.yaml"
+        config_path = tmp_path / "config.yaml"
+
+        # 無効な設定値（数値でないタイムアウト）を含むYAMLファイルを作成
+        config_path.write_text("redmine:\n  timeout: not_a_number\n", encoding="utf-8")
+
+        manager = ConfigManager(config_path)
+
+        # バリデーションエラーが発生することを確認
+        with pytest.raises(ConfigError, match="Invalid configuration values"):
+            manager.load_config()
 
-            # 無効な設定値を含むYAMLファイルを作成
-            invalid_config = {
-                "redmine": {
-                    "timeout": "not_a_number"  # 数値でない値
-                }
-            }
+    def test_load_config_invalid_pool_maxsize(self, tmp_path):
+        """HTTP接続プールサイズ不正値のテスト"""
+        config_path = tmp_path / "config.yaml"
 
-            with open(config_path, "w", encoding="utf-8") as f:
-                yaml.dump(invalid_config, f)
+        config_path.write_text("redmine:\n  pool_maxsize: 0\n", encoding="utf-8")
 
-            manager = ConfigManager(config_path)
+        manager = ConfigManager(config_path)
 
-            # バリデーションエラーが発生することを確認
-            with pytest.raises(ConfigError, match="Invalid configuration values"):
-                manager.load_config()
+        with pytest.raises(ConfigError, match="pool_maxsize"):
+            manager.load_config()
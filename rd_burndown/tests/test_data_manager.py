@@ -1,6 +1,8 @@
 """Test cases for rd_burndown.core.data_manager module."""
 
+import copy
 from datetime import date, datetime
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
@@ -23,137 +25,146 @@ class TestDataManagerError:
         assert str(error) == "test error"
 
 
-class TestDataManager:
-    """Test DataManager class."""
+class _ProjectRow(dict):
+    """Row stand-in for sqlite3.Row; unknown keys resolve to None."""
 
-    @pytest.fixture
-    def data_manager(self):
-        """Create a DataManager instance with mocked dependencies."""
-        with (
-            patch("rd_burndown.core.data_manager.get_config_manager") as mock_get_cm,
-            patch("rd_burndown.core.data_manager.get_database_manager") as mock_get_db,
-            patch("rd_burndown.core.data_manager.get_redmine_client") as mock_get_rc,
-        ):
-            # Setup mocks
-            mock_config_manager = Mock()
-            mock_config = Mock()
-            mock_config.data.cache_dir = "cache"
-            # 完了ステータスの設定を追加
-            mock_config.data.completed_statuses = ["完了", "Closed", "クローズ"]
-            mock_config_manager.load_config.return_value = mock_config
-
-            # Mock database manager with context manager support
-            mock_db_manager = Mock()
-            mock_connection = Mock()
-
-            # Mock database queries for _get_project method
-            mock_row = Mock()
-            mock_row.keys.return_value = [
-                "id",
-                "name",
-                "identifier",
-                "start_date",
-                "end_date",
-            ]
-
-            def mock_row_getitem(self, key):
-                if key == "id":
-                    return 1
-                if key == "name":
-                    return "Test Project"
-                if key == "identifier":
-                    return "test-project"
-                if key == "start_date":
-                    return "2024-01-01"
-                if key == "end_date":
-                    return "2024-12-31"
-                return None
-
-            mock_row.__getitem__ = mock_row_getitem
-
-            mock_execute = Mock()
-            mock_execute.fetchone.return_value = mock_row
-            mock_execute.fetchall.return_value = []
-            mock_connection.execute.return_value = mock_execute
-
-            mock_db_manager.get_connection.return_value.__enter__ = Mock(
-                return_value=mock_connection
-            )
-            mock_db_manager.get_connection.return_value.__exit__ = Mock(
-                return_value=None
-            )
+    def __missing__(self, key):
+        return None
 
-            # Mock all database operations to prevent actual calls
-            mock_db_manager.save_project = Mock()
-            mock_db_manager.save_project_versions = Mock()
-            mock_db_manager.save_tickets = Mock()
-            mock_db_manager.get_project = Mock(
-                return_value={"id": 1, "name": "Test Project"}
-            )
-            mock_db_manager.get_daily_snapshots = Mock(return_value=[])
-            mock_db_manager.get_scope_changes = Mock(return_value=[])
-            mock_db_manager.clear_project_data = Mock()
-            mock_db_manager.get_cache_info = Mock(
-                return_value={
-                    "project_count": 1,
-                    "tickets_count": 10,
-                    "snapshots_count": 30,
-                    "last_sync": datetime(2024, 1, 10),
-                    "cache_size_mb": 1.5,
-                }
-            )
-            mock_db_manager.get_last_update = Mock(return_value=datetime(2024, 1, 5))
-            mock_db_manager.save_daily_snapshots = Mock()
-            mock_db_manager.save_scope_changes = Mock()
-            mock_db_manager.get_database_info = Mock(
-                return_value={
-                    "project_count": 1,
-                    "tickets_count": 10,
-                    "snapshots_count": 30,
-                    "last_sync": datetime(2024, 1, 10),
-                    "cache_size_mb": 1.5,
-                }
-            )
 
-            mock_redmine_client = Mock()
-            # Mock all redmine client methods to prevent actual API calls
-            mock_redmine_client.get_project_data.return_value = None
-            mock_redmine_client.get_project_versions.return_value = []
-            mock_redmine_client.get_project_tickets.return_value = []
-            mock_redmine_client.get_updated_tickets.return_value = []
-            mock_redmine_client.get_all_project_journals.return_value = []
+_PROJECT_ROW = _ProjectRow(
+    id=1,
+    name="Test Project",
+    identifier="test-project",
+    start_date="2024-01-01",
+    end_date="2024-12-31",
+)
 
-            mock_get_cm.return_value = mock_config_manager
-            mock_get_db.return_value = mock_db_manager
-            mock_get_rc.return_value = mock_redmine_client
 
-            return DataManager()
+_DEFAULT_COMPLETED = ["完了", "Closed", "クローズ"]
+_CUSTOM_COMPLETED = ["解決", "Done", "終了"]
 
-    def test_init_success(self):
+
+def _build_config():
+    """Build the config values read by DataManager."""
+    return SimpleNamespace(
+        data=SimpleNamespace(
+            cache_dir="cache",
+            cache_ttl_hours=1,
+            # 完了ステータスの設定を追加
+            completed_statuses=list(_DEFAULT_COMPLETED),
+        )
+    )
+
+
+def _build_db_manager():
+    """Build a database manager mock with context manager support."""
+    mock_db_manager = Mock()
+    mock_connection = Mock()
+
+    # Mock database queries for _get_project method
+    mock_execute = Mock()
+    mock_execute.fetchone.return_value = _PROJECT_ROW
+    mock_execute.fetchall.return_value = []
+    mock_connection.execute.return_value = mock_execute
+
+    mock_db_manager.get_connection.return_value.__enter__ = Mock(
+        return_value=mock_connection
+    )
+    mock_db_manager.get_connection.return_value.__exit__ = Mock(return_value=None)
+
+    # Mock all database operations to prevent actual calls
+    mock_db_manager.get_project.return_value = {"id": 1, "name": "Test Project"}
+    mock_db_manager.get_daily_snapshots.return_value = []
+    mock_db_manager.get_scope_changes.return_value = []
+    mock_db_manager.get_cache_info.return_value = {
+        "project_count": 1,
+        "tickets_count": 10,
+        "snapshots_count": 30,
+        "last_sync": datetime(2024, 1, 10),
+        "cache_size_mb": 1.5,
+    }
+    mock_db_manager.get_last_update.return_value = datetime(2024, 1, 5)
+    mock_db_manager.get_database_info.return_value = {
+        "project_count": 1,
+        "tickets_count": 10,
+        "snapshots_count": 30,
+        "last_sync": datetime(2024, 1, 10),
+        "cache_size_mb": 1.5,
+    }
+    return mock_db_manager
+
+
+def _build_redmine_client():
+    """Build a Redmine client mock that never hits the API."""
+    mock_redmine_client = Mock()
+    mock_redmine_client.get_project_data.return_value = None
+    mock_redmine_client.get_project_versions.return_value = []
+    mock_redmine_client.get_project_tickets.return_value = []
+    mock_redmine_client.get_updated_tickets.return_value = []
+    mock_redmine_client.get_all_project_journals.return_value = []
+    return mock_redmine_client
+
+
+@pytest.fixture(scope="module", autouse=True)
+def dm_deps(module_mocker):
+    """Patch DataManager's dependency getters once for the whole module."""
+    mock_config_manager = Mock()
+    mock_config_manager.load_config.return_value = _build_config()
+    deps = SimpleNamespace(
+        config_manager=mock_config_manager,
+        db_manager=Mock(),
+        redmine_client=Mock(),
+    )
+
+    for name, mock in (
+        ("get_config_manager", deps.config_manager),
+        ("get_database_manager", deps.db_manager),
+        ("get_redmine_client", deps.redmine_client),
+    ):
+        module_mocker.patch(f"rd_burndown.core.data_manager.{name}", return_value=mock)
+    return deps
+
+
+@pytest.fixture(scope="module")
+def _data_manager_prototype(dm_deps):
+    """DataManager initialized once with the patched dependencies."""
+    return DataManager()
+
+
+@pytest.fixture
+def data_manager(_data_manager_prototype):
+    """Shallow copy of the prototype with fresh per-test dependency mocks."""
+    dm = copy.copy(_data_manager_prototype)
+    dm.config = _build_config()
+    dm.db_manager = _build_db_manager()
+    dm.redmine_client = _build_redmine_client()
+    return dm
+
+
+class TestDataManager:
+    """Test DataManager class."""
+
+    def test_init_success(self, dm_deps):
         """Test successful DataManager initialization."""
-        with (
-            patch("rd_burndown.core.data_manager.get_config_manager") as mock_get_cm,
-            patch("rd_burndown.core.data_manager.get_database_manager") as mock_get_db,
-            patch("rd_burndown.core.data_manager.get_redmine_client") as mock_get_rc,
-        ):
-            # Setup mocks
-            mock_config_manager = Mock()
-            mock_config = Mock()
-            mock_config.data.cache_dir = "cache"
-            mock_config_manager.load_config.return_value = mock_config
-
-            mock_db_manager = Mock()
-            mock_redmine_client = Mock()
-
-            mock_get_cm.return_value = mock_config_manager
-            mock_get_db.return_value = mock_db_manager
-            mock_get_rc.return_value = mock_redmine_client
-
-            dm = DataManager()
-
-            assert dm.config_manager == mock_config_manager
-            assert dm.db_manager == mock_db_manager
-            assert dm.redmine_client == mock_redmine_client
+        dm = DataManager()
+
+        assert dm.config_manager == dm_deps.config_manager
+        assert dm.db_manager == dm_deps.db_manager
+        assert dm.redmine_client == dm_deps.redmine_client
+
+    def test_read_pool_lifecycle(self, dm_deps):
+        """Test that the read-only pool is enabled on init and closed once."""
+        db_manager = dm_deps.db_manager
+        db_manager.connect_pool.reset_mock()
+        db_manager.close_pool.reset_mock()
+
+        dm = DataManager()
+        db_manager.connect_pool.assert_called_once_with()
+
+        dm.close()
+        dm.close()
+        db_manager.close_pool.assert_called_once_with()
 
     def test_sync_project_success(self, data_manager):
         """Test successful project synchronization."""
@@ -394,42 +405,55 @@ class TestDataManager:
         result = data_manager._get_scope_changes(1)
         assert result == []
 
-    def test_is_ticket_completed_default_statuses(self, data_manager):
-        """チケット完了判定 - デフォルト設定"""
-        # デフォルト設定での完了ステータス
-        assert data_manager._is_ticket_completed("完了") is True
-        assert data_manager._is_ticket_completed("Closed") is True
-        assert data_manager._is_ticket_completed("クローズ") is True
-
-        # 非完了ステータス
-        assert data_manager._is_ticket_completed("解決") is False
-        assert data_manager._is_ticket_completed("Resolved") is False
-        assert data_manager._is_ticket_completed("進行中") is False
-        assert data_manager._is_ticket_completed("In Progress") is False
-        assert data_manager._is_ticket_completed("新規") is False
-        assert data_manager._is_ticket_completed("New") is False
-        assert data_manager._is_ticket_completed(None) is False
-        assert data_manager._is_ticket_completed("") is False
-
-    def test_is_ticket_completed_custom_statuses(self, data_manager):
-        """チケット完了判定 - カスタム設定"""
-        # 設定を変更
-        data_manager.config.data.completed_statuses = ["解決", "Done", "終了"]
-
-        # カスタム完了ステータス
-        assert data_manager._is_ticket_completed("解決") is True
-        assert data_manager._is_ticket_completed("Done") is True
-        assert data_manager._is_ticket_completed("終了") is True
-
-        # 元のデフォルトステータスは非完了扱い
-        assert data_manager._is_ticket_completed("完了") is False
-        assert data_manager._is_ticket_completed("Closed") is False
-        assert data_manager._is_ticket_completed("クローズ") is False
-
-        # その他の非完了ステータス
-        assert data_manager._is_ticket_completed("進行中") is False
-        assert data_manager._is_ticket_completed("新規") is False
-        assert data_manager._is_ticket_completed(None) is False
+    @pytest.mark.parametrize(
+        ("completed_statuses", "status", "expected"),
+        [
+            *(
+                pytest.param(
+                    _DEFAULT_COMPLETED, status, expected, id=f"default-{status}"
+                )
+                for status, expected in [
+                    # デフォルト設定での完了ステータス
+                    ("完了", True),
+                    ("Closed", True),
+                    ("クローズ", True),
+                    # 非完了ステータス
+                    ("解決", False),
+                    ("Resolved", False),
+                    ("進行中", False),
+                    ("In Progress", False),
+                    ("新規", False),
+                    ("New", False),
+                    (None, False),
+                    ("", False),
+                ]
+            ),
+            *(
+                pytest.param(_CUSTOM_COMPLETED, status, expected, id=f"custom-{status}")
+                for status, expected in [
+                    # カスタム完了ステータス
+                    ("解決", True),
+                    ("Done", True),
+                    ("終了", True),
+                    # 元のデフォルトステータスは非完了扱い
+                    ("完了", False),
+                    ("Closed", False),
+                    ("クローズ", False),
+                    # その他の非完了ステータス
+                    ("進行中", False),
+                    ("新規", False),
+                    (None, False),
+                ]
+            ),
+        ],
+    )
+    def test_is_ticket_completed(
+        self, data_manager, completed_statuses, status, expected
+    ):
+        """チケット完了判定"""
+        data_manager.config.data.completed_statuses = completed_statuses
+
+        assert data_manager._is_ticket_completed(status) is expected
 
 
 class TestGetDataManager:
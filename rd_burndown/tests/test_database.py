@@ -1,18 +1,30 @@
 """データベース管理システムのテスト"""
 
 import sqlite3
+import threading
+import time
+from contextlib import closing
 
 import pytest
 
-from rd_burndown.core.database import DatabaseError, DatabaseManager
+from rd_burndown.core import database
+from rd_burndown.core.database import DatabaseError, DatabaseManager, ReadOnlyPool
+
+
+@pytest.fixture(scope="module")
+def initialized_db(tmp_path_factory: pytest.TempPathFactory) -> DatabaseManager:
+    """初期化済みデータベースマネージャー（読み取り専用テストで共有）"""
+    manager = DatabaseManager(tmp_path_factory.mktemp("db") / "test.db")
+    manager.initialize_database()
+    return manager
 
 
 class TestDatabaseManager:
     """データベースマネージャーのテスト"""
 
-    def test_initialize_database(self, temp_dir):
+    def test_initialize_database(self, fresh_temp_dir):
         """データベース初期化のテスト"""
-        db_path = temp_dir / "test.db"
+        db_path = fresh_temp_dir / "test.db"
         manager = DatabaseManager(db_path)
 
         # 初期化実行
@@ -35,31 +47,23 @@ class TestDatabaseManager:
         }
         assert expected_tables.issubset(set(tables))
 
-    def test_get_database_info(self, temp_dir):
+    def test_get_database_info(self, initialized_db):
         """データベース情報取得のテスト"""
-        db_path = temp_dir / "test.db"
-        manager = DatabaseManager(db_path)
-        manager.initialize_database()
-
-        info = manager.get_database_info()
+        info = initialized_db.get_database_info()
 
         assert info["version"] == 2
-        assert info["file_path"] == str(db_path)
+        assert info["file_path"] == str(initialized_db.db_path)
         assert info["file_size_bytes"] > 0
         assert "projects" in info["tables"]
         assert "tickets" in info["tables"]
         assert info["last_modified"] is not None
 
-    def test_backup_database(self, temp_dir):
+    def test_backup_database(self, initialized_db, fresh_temp_dir):
         """データベースバックアップのテスト"""
-        db_path = temp_dir / "test.db"
-        backup_path = temp_dir / "backup.db"
-
-        manager = DatabaseManager(db_path)
-        manager.initialize_database()
+        backup_path = fresh_temp_dir / "backup.db"
 
         # バックアップ実行
-        manager.backup_database(backup_path)
+        initialized_db.backup_database(backup_path)
 
         # バックアップファイルが作成されることを確認
         assert backup_path.exists()
@@ -72,9 +76,130 @@ class TestDatabaseManager:
         assert "projects" in tables
         assert "tickets" in tables
 
-    def test_execute_query(self, temp_dir):
+    def test_backup_database_incremental(self, fresh_temp_dir):
+        """複数ステップに分割したバックアップのテスト"""
+        db_path = fresh_temp_dir / "test.db"
+        backup_path = fresh_temp_dir / "backup.db"
+
+        manager = DatabaseManager(db_path)
+        manager.BACKUP_PAGES_PER_STEP = 1
+        manager.initialize_database()
+        manager.execute_many(
+            "INSERT INTO projects (id, name, identifier) VALUES (?, ?, ?)",
+            [(i, f"Project {i}", f"proj{i}") for i in range(1, 51)],
+        )
+
+        manager.backup_database(backup_path)
+
+        # 全ページがコピーされていることを確認
+        with closing(sqlite3.connect(backup_path)) as conn:
+            count = conn.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
+
+        assert count == 50
+
+    def test_connect_pool_reuses_read_only_connection(self, fresh_temp_dir):
+        """読み取り専用接続プールの再利用テスト"""
+        db_path = fresh_temp_dir / "test.db"
+        manager = DatabaseManager(db_path)
+        manager.initialize_database()
+
+        pool = manager.connect_pool(size=2)
+        try:
+            with manager.get_connection(read_only=True) as conn:
+                first = conn
+                version = conn.execute("SELECT MAX(version) FROM schema_version")
+                assert version.fetchone()[0] == 2
+            with manager.get_connection(read_only=True) as conn:
+                assert conn is first
+            assert manager.connect_pool() is pool
+        finally:
+            manager.close_pool()
+
+    def test_close_pool_wakes_waiting_acquire(self, initialized_db):
+        """接続待ちのスレッドがプールのクローズで解放されるテスト"""
+        pool = ReadOnlyPool(initialized_db.db_path, size=1)
+        conn = pool.acquire()
+        errors: list[Exception] = []
+
+        def wait_for_connection() -> None:
+            try:
+                pool.acquire()
+            except DatabaseError as e:
+                errors.append(e)
+
+        waiter = threading.Thread(target=wait_for_connection, daemon=True)
+        waiter.start()
+        # 接続の返却待ちに入るまで待つ
+        time.sleep(0.1)
+        assert waiter.is_alive()
+        pool.close()
+        waiter.join(timeout=5)
+
+        assert not waiter.is_alive()
+        assert len(errors) == 1
+        assert "closed" in str(errors[0])
+        pool.release(conn)
+
+    def test_connect_pool_rejects_writes(self, fresh_temp_dir):
+        """読み取り専用接続プールでの書き込み拒否テスト"""
+        db_path = fresh_temp_dir / "test.db"
+        manager = DatabaseManager(db_path)
+        manager.initialize_database()
+        manager.connect_pool(size=1)
+
+        try:
+            with (
+                pytest.raises(DatabaseError),
+                manager.get_connection(read_only=True) as conn,
+            ):
+                conn.execute("INSERT INTO projects (id, name) VALUES (1, 'x')")
+
+            # 書き込み接続はプールを経由しない
+            with manager.get_connection() as conn:
+                conn.execute("INSERT INTO projects (id, name) VALUES (1, 'x')")
+                conn.commit()
+
+            with manager.get_connection(read_only=True) as conn:
+                count = conn.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
+            assert count == 1
+        finally:
+            manager.close_pool()
+
+    def test_execute_query_uses_pool_for_select(self, fresh_temp_dir):
+        """接続プール有効時のSELECT実行テスト"""
+        db_path = fresh_temp_dir / "test.db"
+        manager = DatabaseManager(db_path)
+        manager.initialize_database()
+        manager.execute_query(
+            "INSERT INTO projects (id, name) VALUES (?, ?)",
+            (1, "Test Project"),
+            fetch_all=False,
+        )
+
+        pool = manager.connect_pool(size=1)
+        try:
+            for _ in range(3):
+                result = manager.execute_query(
+                    "SELECT name FROM projects WHERE id = ?", (1,), fetch_one=True
+                )
+                assert result[0] == "Test Project"
+
+            # 書き込みはプールを経由せずに実行される
+            manager.execute_query(
+                "INSERT INTO projects (id, name) VALUES (?, ?)",
+                (2, "Second Project"),
+                fetch_all=False,
+            )
+            results = manager.execute_query("SELECT * FROM projects")
+            assert results is not None
+            assert len(results) == 2
+            assert pool._created == 1
+        finally:
+            manager.close_pool()
+
+    def test_execute_query(self, fresh_temp_dir):
         """クエリ実行のテスト"""
-        db_path = temp_dir / "test.db"
+        db_path = fresh_temp_dir / "test.db"
         manager = DatabaseManager(db_path)
         manager.initialize_database()
 
@@ -103,9 +228,9 @@ class TestDatabaseManager:
         assert results is not None
         assert len(results) == 1
 
-    def test_execute_many(self, temp_dir):
+    def test_execute_many(self, fresh_temp_dir):
         """バッチ実行のテスト"""
-        db_path = temp_dir / "test.db"
+        db_path = fresh_temp_dir / "test.db"
         manager = DatabaseManager(db_path)
         manager.initialize_database()
 
@@ -124,22 +249,18 @@ class TestDatabaseManager:
         results = manager.execute_query("SELECT COUNT(*) FROM projects", fetch_one=True)
         assert results[0] == 3
 
-    def test_vacuum_database(self, temp_dir):
+    def test_vacuum_database(self, initialized_db):
         """データベース最適化のテスト"""
-        db_path = temp_dir / "test.db"
-        manager = DatabaseManager(db_path)
-        manager.initialize_database()
-
         # バキューム実行（エラーが発生しないことを確認）
-        manager.vacuum_database()
+        initialized_db.vacuum_database()
 
-    def test_database_error_on_connection_failure(self, temp_dir):
+    def test_database_error_on_connection_failure(self, fresh_temp_dir):
         """接続失敗時のエラーハンドリングのテスト"""
         # 読み取り専用のディレクトリ内のパスでテスト
-        db_path = temp_dir / "readonly" / "database.db"
+        db_path = fresh_temp_dir / "readonly" / "database.db"
 
         # 読み取り専用のディレクトリを作成
-        readonly_dir = temp_dir / "readonly"
+        readonly_dir = fresh_temp_dir / "readonly"
         readonly_dir.mkdir()
         readonly_dir.chmod(0o444)  # 読み取り専用
 
@@ -152,9 +273,9 @@ class TestDatabaseManager:
             # 後片付け
             readonly_dir.chmod(0o755)
 
-    def test_migration_error_handling(self, temp_dir):
+    def test_migration_error_handling(self, fresh_temp_dir):
         """マイグレーションエラーハンドリングのテスト"""
-        db_path = temp_dir / "test.db"
+        db_path = fresh_temp_dir / "test.db"
 
         # 無効なバージョンを設定したマネージャーを作成
         class BrokenDatabaseManager(DatabaseManager):
@@ -166,6 +287,40 @@ class TestDatabaseManager:
         with pytest.raises(DatabaseError, match="Migration method for version"):
             manager.initialize_database()
 
+    def test_failed_migration_is_rolled_back(self, fresh_temp_dir, monkeypatch):
+        """マイグレーション失敗時にスキーマとバージョンが巻き戻るテスト"""
+        manager = DatabaseManager(fresh_temp_dir / "test.db")
+        monkeypatch.setattr(
+            database,
+            "_V2_SCHEMA_SQL",
+            """
+            BEGIN;
+            CREATE TABLE ticket_journals (id INTEGER PRIMARY KEY);
+            INSERT INTO schema_version (version) VALUES (2);
+            SELECT * FROM missing_table;
+            COMMIT;
+            """,
+        )
+
+        with pytest.raises(DatabaseError):
+            manager.initialize_database()
+
+        # v1 は適用済み、v2 はテーブルもバージョンも残らない
+        with manager.get_connection() as conn:
+            assert manager._get_current_version(conn) == 1
+            tables = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table'"
+                )
+            }
+        assert "ticket_journals" not in tables
+
+        # 再初期化で残りのマイグレーションが適用できる
+        monkeypatch.undo()
+        manager.initialize_database()
+        assert manager.get_database_info()["version"] == 2
+
 
 def test_get_database_manager_with_default_path():
     """デフォルトパスでのデータベースマネージャー取得のテスト"""
@@ -176,11 +331,11 @@ def test_get_database_manager_with_default_path():
     assert isinstance(manager, DatabaseManager)
 
 
-def test_get_database_manager_with_custom_path(temp_dir):
+def test_get_database_manager_with_custom_path(fresh_temp_dir):
     """カスタムパスでのデータベースマネージャー取得のテスト"""
     from rd_burndown.core.database import get_database_manager
 
-    custom_path = temp_dir / "custom.db"
+    custom_path = fresh_temp_dir / "custom.db"
     manager = get_database_manager(custom_path)
     assert isinstance(manager, DatabaseManager)
     assert manager.db_path == custom_path
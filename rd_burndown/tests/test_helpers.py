@@ -1,7 +1,5 @@
 """ヘルパー関数のテスト"""
 
-import os
-import tempfile
 from pathlib import Path
 
 from rd_burndown.utils.helpers import (
@@ -26,47 +24,43 @@ from rd_burndown.utils.helpers import (
 class TestEnsureDirectory:
     """ensure_directory のテスト"""
 
-    def test_create_new_directory(self):
+    def test_create_new_directory(self, tmp_path):
         """新規ディレクトリ作成のテスト"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            new_dir = Path(tmp_dir) / "new_directory"
+        new_dir = tmp_path / "new_directory"
 
-            result = ensure_directory(new_dir)
+        result = ensure_directory(new_dir)
 
-            assert new_dir.exists()
-            assert new_dir.is_dir()
-            assert result == new_dir
+        assert new_dir.exists()
+        assert new_dir.is_dir()
+        assert result == new_dir
 
-    def test_existing_directory(self):
+    def test_existing_directory(self, tmp_path):
         """既存ディレクトリのテスト"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            existing_dir = Path(tmp_dir)
+        existing_dir = tmp_path
 
-            result = ensure_directory(existing_dir)
+        result = ensure_directory(existing_dir)
 
-            assert existing_dir.exists()
-            assert result == existing_dir
+        assert existing_dir.exists()
+        assert result == existing_dir
 
-    def test_create_nested_directories(self):
+    def test_create_nested_directories(self, tmp_path):
         """ネストしたディレクトリ作成のテスト"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            nested_dir = Path(tmp_dir) / "level1" / "level2" / "level3"
+        nested_dir = tmp_path / "level1" / "level2" / "level3"
 
-            result = ensure_directory(nested_dir)
+        result = ensure_directory(nested_dir)
 
-            assert nested_dir.exists()
-            assert nested_dir.is_dir()
-            assert result == nested_dir
+        assert nested_dir.exists()
+        assert nested_dir.is_dir()
+        assert result == nested_dir
 
-    def test_string_path(self):
+    def test_string_path(self, tmp_path):
         """文字列パスのテスト"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            new_dir_str = str(Path(tmp_dir) / "string_dir")
+        new_dir_str = str(tmp_path / "string_dir")
 
-            result = ensure_directory(new_dir_str)
+        result = ensure_directory(new_dir_str)
 
-            assert Path(new_dir_str).exists()
-            assert isinstance(result, Path)
+        assert Path(new_dir_str).exists()
+        assert isinstance(result, Path)
 
 
 class TestSafeGetNested:
@@ -226,28 +220,24 @@ class TestTruncateString:
 class TestGetFileSize:
     """get_file_size のテスト"""
 
-    def test_existing_file(self):
+    def test_existing_file(self, tmp_path):
         """存在するファイルのテスト"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as tmp_file:
-            tmp_file.write("test content")
-            tmp_file.flush()
+        tmp_file = tmp_path / "file.txt"
+        tmp_file.write_text("test content")
 
-            size = get_file_size(tmp_file.name)
-            assert size > 0
-
-            os.unlink(tmp_file.name)
+        size = get_file_size(str(tmp_file))
+        assert size > 0
 
     def test_nonexistent_file(self):
         """存在しないファイルのテスト"""
         size = get_file_size("/nonexistent/file.txt")
         assert size == 0
 
-    def test_directory(self):
+    def test_directory(self, tmp_path):
         """ディレクトリのテスト"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            size = get_file_size(tmp_dir)
-            # ディレクトリサイズは0またはプラットフォーム依存
-            assert size >= 0
+        size = get_file_size(str(tmp_path))
+        # ディレクトリサイズは0またはプラットフォーム依存
+        assert size >= 0
 
 
 class TestFormatFileSize:
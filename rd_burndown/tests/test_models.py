@@ -3,6 +3,8 @@
 from datetime import date, datetime
 from typing import Any
 
+import pytest
+
 from rd_burndown.core.models import (
     DailySnapshot,
     ProjectSummary,
@@ -10,6 +12,7 @@ from rd_burndown.core.models import (
     RedmineProject,
     ScopeChange,
     TicketData,
+    completion_rates,
 )
 
 
@@ -46,6 +49,14 @@ class TestTicketData:
         assert ticket.status_id == 1
         assert ticket.project_id == 1
 
+    def test_ticket_uses_slots(self):
+        """__slots__ によりインスタンス辞書を持たないことのテスト"""
+        ticket = self.create_sample_ticket()
+
+        assert not hasattr(ticket, "__dict__")
+        with pytest.raises(AttributeError):
+            ticket.unknown_field = "value"  # type: ignore[attr-defined]
+
     def test_is_completed_true(self):
         """完了状態判定（完了）のテスト"""
         # 完了ステータスID: 3, 5, 6
@@ -165,6 +176,23 @@ class TestDailySnapshot:
         )
         assert snapshot.completion_rate() == 0.0
 
+    def test_completion_rates(self):
+        """完了率一括計算のテスト"""
+        snapshots = [
+            self.create_sample_snapshot(
+                active_ticket_count=7, completed_ticket_count=3
+            ),
+            self.create_sample_snapshot(
+                active_ticket_count=0, completed_ticket_count=0
+            ),
+            self.create_sample_snapshot(
+                active_ticket_count=0, completed_ticket_count=4
+            ),
+        ]
+
+        assert completion_rates(snapshots) == [30.0, 0.0, 100.0]
+        assert completion_rates(snapshots) == [s.completion_rate() for s in snapshots]
+
 
 class TestScopeChange:
     """ScopeChange のテスト"""
@@ -612,6 +640,15 @@ class TestProjectSummary:
         variance = summary.schedule_variance()
         assert variance is None
 
+    def test_schedule_variance_nan_burn_rate(self):
+        """スケジュール偏差（バーンレートNaN）のテスト"""
+        summary = self.create_sample_summary(
+            remaining_hours=60.0, days_remaining=15, average_burn_rate=float("nan")
+        )
+
+        assert summary.schedule_variance() is None
+        assert summary.is_on_track() is False
+
     def test_scope_variance(self):
         """スコープ偏差のテスト"""
         # スコープ変更のあるタイムライン作成
@@ -1,13 +1,21 @@
 """Redmine APIクライアントのテスト"""
 
+import asyncio
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from types import SimpleNamespace
 from typing import Any, Optional
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
 
+from rd_burndown import __version__
+from rd_burndown.core import redmine_client
 from rd_burndown.core.redmine_client import RedmineAPIError, RedmineClient
 from rd_burndown.utils.config import Config
 
@@ -43,14 +51,19 @@ class TestRedmineClient:
         return config
 
     def create_mock_response(
-        self, status_code: int = 200, json_data: Optional[dict[str, Any]] = None
+        self,
+        status_code: int = 200,
+        json_data: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
     ) -> Mock:
         """モックレスポンス作成"""
         mock_response = Mock()
         mock_response.status_code = status_code
         mock_response.ok = status_code < 400
+        mock_response.headers = headers or {}
         mock_response.json.return_value = json_data or {}
         mock_response.text = json.dumps(json_data or {})
+        mock_response.content = mock_response.text.encode("utf-8")
         return mock_response
 
     def test_init(self):
@@ -88,45 +101,94 @@ class TestRedmineClient:
         mock_session.headers.update.assert_called_once_with(
             {
                 "Content-Type": "application/json",
+                "Accept": "application/json",
+                "Accept-Encoding": "gzip, deflate",
+                "User-Agent": f"rd-burndown/{__version__}",
                 "X-Redmine-API-Key": "test-api-key",
             }
         )
 
-    @patch("time.time")
+    def test_create_session_pool_size(self):
+        """HTTP接続プールサイズ設定のテスト"""
+        config = self.create_test_config()
+        config.redmine.pool_maxsize = 16
+        with patch(
+            "rd_burndown.core.redmine_client.HTTPAdapter", wraps=HTTPAdapter
+        ) as adapter_spy:
+            client = RedmineClient(config)
+
+        adapter_spy.assert_called_once()
+        assert adapter_spy.call_args.kwargs["pool_connections"] == 16
+
+        adapter = client.session.get_adapter("http://test.example.com")
+        assert isinstance(adapter, HTTPAdapter)
+        pool_kw = adapter.poolmanager.connection_pool_kw
+        assert pool_kw["maxsize"] == 16
+        assert pool_kw["block"] is False
+
+    def test_create_session_retry_strategy(self):
+        """リトライ戦略設定のテスト"""
+        config = self.create_test_config()
+        client = RedmineClient(config)
+
+        adapter = client.session.get_adapter("http://test.example.com")
+        assert isinstance(adapter, HTTPAdapter)
+        retry = adapter.max_retries
+        assert retry.total == 5
+        assert retry.respect_retry_after_header is True
+        assert retry.raise_on_status is False
+        assert retry.backoff_max == 10
+        # POST など非冪等なメソッドは自動リトライしない
+        assert retry.allowed_methods == frozenset(["GET", "HEAD"])
+
+    @patch("time.monotonic")
     @patch("time.sleep")
-    def test_rate_limit(self, mock_sleep: Mock, mock_time: Mock):
-        """レート制限のテスト"""
+    def test_rate_limit_burst(self, mock_sleep: Mock, mock_time: Mock):
+        """レート制限（バケット容量内のバースト）のテスト"""
+        mock_time.return_value = 0.0
         config = self.create_test_config()
         client = RedmineClient(config)
 
-        # 最初のリクエスト時間を設定
-        client._last_request_time = 0.0
+        # バケット容量分は待機なしで送信できる
+        for _ in range(5):
+            client._rate_limit()
 
-        # 時間の経過をシミュレート
-        mock_time.return_value = 0.1  # 0.1秒しか経過していない
+        mock_sleep.assert_not_called()
 
-        # レート制限実行
+    @patch("time.monotonic")
+    @patch("time.sleep")
+    def test_rate_limit(self, mock_sleep: Mock, mock_time: Mock):
+        """レート制限（トークン枯渇時の待機）のテスト"""
+        mock_time.return_value = 0.0
+        config = self.create_test_config()
+        client = RedmineClient(config)
+
+        for _ in range(5):
+            client._rate_limit()
+
+        # 0.1秒経過で0.5トークン補充 → 残り0.5トークン分(0.1秒)待機
+        mock_time.return_value = 0.1
         client._rate_limit()
 
-        # スリープが呼ばれたか確認（0.2 - 0.1 = 0.1秒）
-        mock_sleep.assert_called_once_with(0.1)
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(0.1)
 
-    @patch("time.time")
+    @patch("time.monotonic")
     @patch("time.sleep")
     def test_rate_limit_no_sleep_needed(self, mock_sleep: Mock, mock_time: Mock):
-        """レート制限（スリープ不要）のテスト"""
+        """レート制限（補充済みでスリープ不要）のテスト"""
+        mock_time.return_value = 0.0
         config = self.create_test_config()
         client = RedmineClient(config)
 
-        # 最初のリクエスト時間を設定
-        client._last_request_time = 0.0
+        for _ in range(5):
+            client._rate_limit()
 
-        # 十分な時間が経過
-        mock_time.return_value = 0.3  # 0.2秒以上経過
+        # 1秒経過でバケットが満杯まで補充される
+        mock_time.return_value = 1.0
+        for _ in range(5):
+            client._rate_limit()
 
-        client._rate_limit()
-
-        # スリープが呼ばれないか確認
         mock_sleep.assert_not_called()
 
     @patch("rd_burndown.core.redmine_client.requests.Session.request")
@@ -151,10 +213,26 @@ class TestRedmineClient:
             url="http://test.example.com/test.json",
             params=None,
             json=None,
+            headers=None,
             timeout=30,
             verify=True,
         )
 
+    @patch("rd_burndown.core.redmine_client.orjson", None)
+    @patch("rd_burndown.core.redmine_client.requests.Session.request")
+    def test_make_request_without_orjson(self, mock_request: Mock):
+        """orjson 未導入時のJSONデコードのテスト"""
+        config = self.create_test_config()
+        client = RedmineClient(config)
+
+        mock_response = self.create_mock_response(200, {"test": "データ"})
+        mock_request.return_value = mock_response
+
+        result = client._make_request("GET", "/test.json")
+
+        assert result == {"test": "データ"}
+        mock_response.json.assert_called_once()
+
     @patch("rd_burndown.core.redmine_client.requests.Session.request")
     def test_make_request_with_params_and_data(self, mock_request: Mock):
         """パラメータ・データ付きリクエストのテスト"""
@@ -175,6 +253,7 @@ class TestRedmineClient:
             url="http://test.example.com/test.json",
             params=params,
             json=data,
+            headers=None,
             timeout=30,
             verify=True,
         )
@@ -277,6 +356,7 @@ class TestRedmineClient:
         mock_response.status_code = 200
         mock_response.ok = True
         mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
+        mock_response.content = b"Invalid JSON"
         mock_request.return_value = mock_response
 
         with pytest.raises(RedmineAPIError) as exc_info:
@@ -284,6 +364,41 @@ class TestRedmineClient:
 
         assert "JSON パースエラー" in str(exc_info.value)
 
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "json"])
+    def test_decode_response(self, monkeypatch, use_orjson: bool):
+        """レスポンスデコード（orjson の有無）のテスト"""
+        fake_orjson = SimpleNamespace(
+            loads=json.loads, JSONDecodeError=json.JSONDecodeError
+        )
+        monkeypatch.setattr(
+            redmine_client, "orjson", fake_orjson if use_orjson else None
+        )
+
+        response = Mock()
+        response.content = b'{"issues": []}'
+        response.json.return_value = {"issues": []}
+
+        assert RedmineClient._decode_response(response) == {"issues": []}
+        # orjson がある場合は response.json() を経由せずボディを直接デコードする
+        assert response.json.called is not use_orjson
+
+    def test_decode_response_orjson_error(self, monkeypatch):
+        """orjson のデコードエラーが RedmineAPIError に変換されるテスト"""
+
+        def loads(content: bytes) -> Any:
+            raise json.JSONDecodeError("unexpected character", content.decode(), 0)
+
+        monkeypatch.setattr(
+            redmine_client,
+            "orjson",
+            SimpleNamespace(loads=loads, JSONDecodeError=json.JSONDecodeError),
+        )
+        response = Mock()
+        response.content = b"Invalid JSON"
+
+        with pytest.raises(RedmineAPIError, match="JSON パースエラー"):
+            RedmineClient._decode_response(response)
+
     @patch.object(RedmineClient, "_make_request")
     def test_get_projects(self, mock_make_request: Mock):
         """プロジェクト一覧取得のテスト"""
@@ -323,24 +438,27 @@ class TestRedmineClient:
         call_args = mock_make_request.call_args
         assert "status" not in call_args[1]["params"]
 
-    @patch.object(RedmineClient, "_make_request")
-    def test_get_project(self, mock_make_request: Mock):
+    @patch.object(RedmineClient, "_send_request")
+    def test_get_project(self, mock_send_request: Mock):
         """プロジェクト詳細取得のテスト"""
         config = self.create_test_config()
         client = RedmineClient(config)
 
         mock_project = {"id": 1, "name": "Test Project"}
-        mock_make_request.return_value = {"project": mock_project}
+        mock_send_request.return_value = self.create_mock_response(
+            200, {"project": mock_project}
+        )
 
         result = client.get_project(1)
 
         assert result == mock_project
-        mock_make_request.assert_called_once_with(
+        mock_send_request.assert_called_once_with(
             "GET",
             "/projects/1.json",
             params={
                 "include": "enabled_modules,versions,issue_categories,time_entry_activities"
             },
+            headers=None,
         )
 
     @patch.object(RedmineClient, "_make_request")
@@ -365,11 +483,23 @@ class TestRedmineClient:
                 "project_id": 1,
                 "limit": 100,
                 "offset": 0,
-                "include": "journals,relations",
                 "status_id": "*",
             },
         )
 
+    @patch.object(RedmineClient, "_make_request")
+    def test_get_issues_with_include(self, mock_make_request: Mock):
+        """関連データ指定チケット一覧取得のテスト"""
+        config = self.create_test_config()
+        client = RedmineClient(config)
+
+        mock_make_request.return_value = {"issues": []}
+
+        client.get_issues(1, include="journals")
+
+        params = mock_make_request.call_args[1]["params"]
+        assert params["include"] == "journals"
+
     @patch.object(RedmineClient, "_make_request")
     def test_get_issues_with_updated_since(self, mock_make_request: Mock):
         """更新日指定チケット一覧取得のテスト"""
@@ -385,6 +515,36 @@ class TestRedmineClient:
         params = call_args[1]["params"]
         assert params["updated_on"] == ">=2024-01-15T12:00:00Z"
 
+    @patch.object(RedmineClient, "get_issues")
+    def test_get_all_project_issues_formats_updated_since_once(
+        self, mock_get_issues: Mock
+    ):
+        """ページング時の更新日時フォーマットが1回で済むことのテスト"""
+        config = self.create_test_config()
+        client = RedmineClient(config)
+
+        mock_get_issues.return_value = {"issues": [{"id": 1}], "total_count": 250}
+
+        client.get_all_project_issues(1, updated_since=datetime(2024, 1, 15, 12))
+
+        # 全ページにフォーマット済みの文字列が渡される
+        assert {c.kwargs["updated_since"] for c in mock_get_issues.call_args_list} == {
+            "2024-01-15T12:00:00Z"
+        }
+
+    @patch.object(RedmineClient, "_make_request")
+    def test_get_issues_with_formatted_updated_since(self, mock_make_request: Mock):
+        """フォーマット済み更新日時指定チケット一覧取得のテスト"""
+        config = self.create_test_config()
+        client = RedmineClient(config)
+
+        mock_make_request.return_value = {"issues": []}
+
+        client.get_issues(1, updated_since="2024-01-15T12:00:00Z")
+
+        params = mock_make_request.call_args[1]["params"]
+        assert params["updated_on"] == ">=2024-01-15T12:00:00Z"
+
     @patch.object(RedmineClient, "_make_request")
     def test_get_issues_exclude_closed(self, mock_make_request: Mock):
         """チケット一覧取得（クローズ除外）のテスト"""
@@ -427,6 +587,159 @@ class TestRedmineClient:
         assert result[1]["id"] == 2
         assert result[2]["id"] == 3
 
+    @patch.object(RedmineClient, "get_issues")
+    def test_get_all_project_issues_keeps_page_order(self, mock_get_issues: Mock):
+        """プロジェクト全チケット取得（並行取得時のページ順序）のテスト"""
+        config = self.create_test_config()
+        client = RedmineClient(config)
+
+        def fake_get_issues(**kwargs: Any) -> dict[str, Any]:
+            offset = kwargs["offset"]
+            return {"issues": [{"id": offset + 1}], "total_count": 450}
+
+        mock_get_issues.side_effect = fake_get_issues
+
+        result = client.get_all_project_issues(1)
+
+        # 1ページ目 + 残り4ページ
+        assert mock_get_issues.call_count == 5
+        assert [issue["id"] for issue in result] == [1, 101, 201, 301, 401]
+
+    @patch.object(RedmineClient, "get_issues")
+    def test_get_all_project_issues_async(self, mock_get_issues: Mock):
+        """プロジェクト全チケット取得（非同期版）のテスト"""
+        config = self.create_test_config()
+        client = RedmineClient(config)
+
+        def fake_get_issues(**kwargs: Any) -> dict[str, Any]:
+            offset = kwargs["offset"]
+            return {"issues": [{"id": offset + 1}], "total_count": 350}
+
+        mock_get_issues.side_effect = fake_get_issues
+
+        result = asyncio.run(client.get_all_project_issues_async(1))
+
+        assert mock_get_issues.call_count == 4
+        assert [issue["id"] for issue in result] == [1, 101, 201, 301]
+
+    @patch.object(RedmineClient, "get_issues")
+    def test_get_all_project_issues_async_bounded_by_pool(self, mock_get_issues: Mock):
+        """非同期版の同時実行数が接続プールサイズ以下に制限されることのテスト"""
+        config = self.create_test_config()
+        config.redmine.pool_maxsize = 2
+        client = RedmineClient(config)
+
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+
+        def fake_get_issues(**kwargs: Any) -> dict[str, Any]:
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return {"issues": [{"id": kwargs["offset"] + 1}], "total_count": 800}
+
+        mock_get_issues.side_effect = fake_get_issues
+
+        result = asyncio.run(client.get_all_project_issues_async(1))
+
+        assert len(result) == 8
+        assert max_running <= 2
+
+    def test_page_concurrency(self):
+        """ページ並行取得の同時実行数算出のテスト"""
+        config = self.create_test_config()
+        client = RedmineClient(config)
+
+        assert client._page_concurrency(3) == 3
+        # バケット容量（5）で頭打ち
+        assert client._page_concurrency(20) == 5
+
+        config.redmine.pool_maxsize = 2
+        assert client._page_concurrency(20) == 2
+
+    @patch.object(RedmineClient, "get_issues")
+    def test_get_all_project_issues_server_capped_page_size(
+        self, mock_get_issues: Mock
+    ):
+        """プロジェクト全チケット取得（サーバー側でページサイズ制限）のテスト"""
+        config = self.create_test_config()
+        config.redmine.max_per_page = 500
+        client = RedmineClient(config)
+
+        def fake_get_issues(**kwargs: Any) -> dict[str, Any]:
+            offset = kwargs["offset"]
+            return {"issues": [{"id": offset + 1}], "total_count": 250, "limit": 100}
+
+        mock_get_issues.side_effect = fake_get_issues
+
+        result = client.get_all_project_issues(1)
+
+        limits_and_offsets = sorted(
+            (c.kwargs["limit"], c.kwargs["offset"])
+            for c in mock_get_issues.call_args_list
+        )
+        assert limits_and_offsets == [(100, 100), (100, 200), (500, 0)]
+        assert [issue["id"] for issue in result] == [1, 101, 201]
+
+    @patch.object(RedmineClient, "_make_request")
+    def test_get_issues_limit_capped_by_max_per_page(self, mock_make_request: Mock):
+        """チケット一覧取得の件数上限のテスト"""
+        config = self.create_test_config()
+        config.redmine.max_per_page = 500
+        client = RedmineClient(config)
+
+        mock_make_request.return_value = {"issues": []}
+
+        client.get_issues(1, limit=1000)
+
+        assert mock_make_request.call_args[1]["params"]["limit"] == 500
+
+    @patch.object(RedmineClient, "_make_request")
+    def test_get_all_project_journals_small_max_per_page(self, mock_make_request: Mock):
+        """プロジェクト全journals取得（max_per_page が100未満）のテスト"""
+        config = self.create_test_config()
+        config.redmine.max_per_page = 50
+        client = RedmineClient(config)
+        issue_ids = list(range(1, 121))
+
+        def fake_make_request(
+            method: str, endpoint: str, params: Optional[dict[str, Any]] = None
+        ) -> dict[str, Any]:
+            if endpoint == "/issues.json":
+                assert params is not None
+                offset, limit = params["offset"], params["limit"]
+                return {
+                    "issues": [{"id": i} for i in issue_ids[offset : offset + limit]],
+                    "total_count": len(issue_ids),
+                }
+            issue_id = int(endpoint.split("/")[2].split(".")[0])
+            return {"issue": {"id": issue_id, "journals": [{"id": issue_id * 10}]}}
+
+        mock_make_request.side_effect = fake_make_request
+
+        result = client.get_all_project_journals(1)
+
+        assert sorted(j["issue_id"] for j in result) == issue_ids
+        assert all(j["project_id"] == 1 for j in result)
+
+    @patch.object(RedmineClient, "get_issues")
+    def test_get_all_project_issues_single_page(self, mock_get_issues: Mock):
+        """プロジェクト全チケット取得（1ページのみ）のテスト"""
+        config = self.create_test_config()
+        client = RedmineClient(config)
+
+        mock_get_issues.return_value = {"issues": [{"id": 1}], "total_count": 1}
+
+        result = client.get_all_project_issues(1)
+
+        mock_get_issues.assert_called_once()
+        assert result == [{"id": 1}]
+
     @patch.object(RedmineClient, "_make_request")
     def test_get_issue(self, mock_make_request: Mock):
         """チケット詳細取得のテスト"""
@@ -445,47 +758,134 @@ class TestRedmineClient:
             params={"include": "journals,relations,watchers,children,details"},
         )
 
-    @patch.object(RedmineClient, "_make_request")
-    def test_test_connection_success(self, mock_make_request: Mock):
+    def test_convert_issue_to_ticket(self, mock_redmine_api_response):
+        """IssueデータからTicketDataへの変換テスト"""
+        config = self.create_test_config()
+        client = RedmineClient(config)
+        issue = mock_redmine_api_response["issues"][0]
+
+        ticket = client._convert_issue_to_ticket(issue)
+        same_timestamp_ticket = client._convert_issue_to_ticket(dict(issue, id=2))
+
+        assert ticket.id == 1
+        assert ticket.subject == "テストチケット"
+        assert ticket.status_id == 1
+        assert ticket.assigned_to_name == "山田太郎"
+        assert ticket.version_id == 1
+        assert ticket.created_on == datetime.fromisoformat(issue["created_on"])
+        # 同一の日時文字列はパース結果を再利用する
+        assert same_timestamp_ticket.created_on is ticket.created_on
+
+    def test_convert_issue_to_ticket_optional_fields(self, mock_redmine_api_response):
+        """担当者・バージョン未設定とカスタムフィールドの変換テスト"""
+        config = self.create_test_config()
+        client = RedmineClient(config)
+        issue = dict(
+            mock_redmine_api_response["issues"][0],
+            assigned_to=None,
+            custom_fields=[{"name": "優先度", "value": "高"}, {"name": "分類"}],
+        )
+        issue.pop("fixed_version", None)
+
+        ticket = client._convert_issue_to_ticket(issue)
+
+        assert ticket.assigned_to_id is None
+        assert ticket.assigned_to_name is None
+        assert ticket.version_id is None
+        assert ticket.version_name is None
+        assert ticket.custom_fields == {"優先度": "高", "分類": None}
+
+    @patch.object(RedmineClient, "get_issues")
+    def test_iter_project_tickets(
+        self, mock_get_issues: Mock, mock_redmine_api_response
+    ):
+        """プロジェクトチケットの逐次取得テスト"""
+        config = self.create_test_config()
+        client = RedmineClient(config)
+        issue = mock_redmine_api_response["issues"][0]
+
+        mock_get_issues.side_effect = [
+            {"issues": [issue, dict(issue, id=2)], "total_count": 3, "limit": 2},
+            {"issues": [dict(issue, id=3)], "total_count": 3, "limit": 2},
+        ]
+
+        tickets = client.iter_project_tickets(1)
+
+        # 遅延評価のため、取得開始まではリクエストしない
+        mock_get_issues.assert_not_called()
+        assert [ticket.id for ticket in tickets] == [1, 2, 3]
+        assert [c.kwargs["offset"] for c in mock_get_issues.call_args_list] == [0, 2]
+
+    @patch.object(RedmineClient, "_send_request")
+    def test_test_connection_success(self, mock_send_request: Mock):
         """接続テスト（成功）のテスト"""
         config = self.create_test_config()
         client = RedmineClient(config)
 
-        mock_make_request.return_value = {"user": {"id": 1}}
+        mock_send_request.return_value = self.create_mock_response(200)
 
         result = client.test_connection()
 
         assert result is True
-        mock_make_request.assert_called_once_with("GET", "/users/current.json")
+        mock_send_request.assert_called_once_with("HEAD", "/users/current.json")
 
-    @patch.object(RedmineClient, "_make_request")
-    def test_test_connection_failure(self, mock_make_request: Mock):
+    @patch.object(RedmineClient, "_send_request")
+    def test_test_connection_failure(self, mock_send_request: Mock):
         """接続テスト（失敗）のテスト"""
         config = self.create_test_config()
         client = RedmineClient(config)
 
-        mock_make_request.side_effect = RedmineAPIError("Connection failed")
+        mock_send_request.side_effect = RedmineAPIError("Connection failed")
 
         result = client.test_connection()
 
         assert result is False
 
-    @patch.object(RedmineClient, "_make_request")
-    def test_get_current_user(self, mock_make_request: Mock):
+    @patch("rd_burndown.core.redmine_client.time.monotonic")
+    @patch.object(RedmineClient, "_send_request")
+    def test_test_connection_cached(
+        self, mock_send_request: Mock, mock_monotonic: Mock
+    ):
+        """接続テスト結果のキャッシュのテスト"""
+        config = self.create_test_config()
+        client = RedmineClient(config)
+
+        mock_send_request.side_effect = [
+            RedmineAPIError("Connection failed"),
+            self.create_mock_response(200),
+        ]
+
+        # 失敗結果も有効期限内はキャッシュされる
+        mock_monotonic.return_value = 0.0
+        assert client.test_connection() is False
+        mock_monotonic.return_value = client.CONNECTION_CHECK_TTL - 1
+        assert client.test_connection() is False
+        assert mock_send_request.call_count == 1
+
+        mock_monotonic.return_value = client.CONNECTION_CHECK_TTL + 1
+        assert client.test_connection() is True
+        assert mock_send_request.call_count == 2
+
+    @patch.object(RedmineClient, "_send_request")
+    def test_get_current_user(self, mock_send_request: Mock):
         """現在ユーザー取得のテスト"""
         config = self.create_test_config()
         client = RedmineClient(config)
 
         mock_user = {"id": 1, "login": "test_user"}
-        mock_make_request.return_value = {"user": mock_user}
+        mock_send_request.return_value = self.create_mock_response(
+            200, {"user": mock_user}
+        )
 
         result = client.get_current_user()
 
         assert result == mock_user
-        mock_make_request.assert_called_once_with("GET", "/users/current.json")
+        mock_send_request.assert_called_once_with(
+            "GET", "/users/current.json", params=None, headers=None
+        )
 
-    @patch.object(RedmineClient, "_make_request")
-    def test_get_issue_statuses(self, mock_make_request: Mock):
+    @patch.object(RedmineClient, "_send_request")
+    def test_get_issue_statuses(self, mock_send_request: Mock):
         """チケットステータス一覧取得のテスト"""
         config = self.create_test_config()
         client = RedmineClient(config)
@@ -494,15 +894,19 @@ class TestRedmineClient:
             {"id": 1, "name": "新規"},
             {"id": 2, "name": "進行中"},
         ]
-        mock_make_request.return_value = {"issue_statuses": mock_statuses}
+        mock_send_request.return_value = self.create_mock_response(
+            200, {"issue_statuses": mock_statuses}
+        )
 
         result = client.get_issue_statuses()
 
         assert result == mock_statuses
-        mock_make_request.assert_called_once_with("GET", "/issue_statuses.json")
+        mock_send_request.assert_called_once_with(
+            "GET", "/issue_statuses.json", params=None, headers=None
+        )
 
-    @patch.object(RedmineClient, "_make_request")
-    def test_get_trackers(self, mock_make_request: Mock):
+    @patch.object(RedmineClient, "_send_request")
+    def test_get_trackers(self, mock_send_request: Mock):
         """トラッカー一覧取得のテスト"""
         config = self.create_test_config()
         client = RedmineClient(config)
@@ -511,12 +915,186 @@ class TestRedmineClient:
             {"id": 1, "name": "バグ"},
             {"id": 2, "name": "機能"},
         ]
-        mock_make_request.return_value = {"trackers": mock_trackers}
+        mock_send_request.return_value = self.create_mock_response(
+            200, {"trackers": mock_trackers}
+        )
 
         result = client.get_trackers()
 
         assert result == mock_trackers
-        mock_make_request.assert_called_once_with("GET", "/trackers.json")
+        mock_send_request.assert_called_once_with(
+            "GET", "/trackers.json", params=None, headers=None
+        )
+
+    @patch.object(RedmineClient, "_send_request")
+    def test_get_trackers_cached(self, mock_send_request: Mock):
+        """トラッカー一覧取得のキャッシュテスト"""
+        config = self.create_test_config()
+        client = RedmineClient(config)
+
+        mock_send_request.return_value = self.create_mock_response(
+            200, {"trackers": [{"id": 1, "name": "バグ"}]}
+        )
+
+        first = client.get_trackers()
+        second = client.get_trackers()
+
+        assert first == second
+        mock_send_request.assert_called_once_with(
+            "GET", "/trackers.json", params=None, headers=None
+        )
+
+        # キャッシュクリア後は再取得する
+        client.clear_cache()
+        client.get_trackers()
+        assert mock_send_request.call_count == 2
+
+    @patch.object(RedmineClient, "_send_request")
+    def test_get_versions_cached_per_project(self, mock_send_request: Mock):
+        """バージョン一覧取得のプロジェクト別キャッシュテスト"""
+        config = self.create_test_config()
+        client = RedmineClient(config)
+
+        mock_send_request.return_value = self.create_mock_response(
+            200, {"versions": []}
+        )
+
+        client.get_versions(1)
+        client.get_versions(2)
+        client.get_versions(1)
+
+        assert mock_send_request.call_count == 2
+
+    @patch.object(RedmineClient, "_send_request")
+    def test_cached_get_returns_copy(self, mock_send_request: Mock):
+        """キャッシュ済みレスポンスの変更が後続の取得に波及しないことのテスト"""
+        config = self.create_test_config()
+        client = RedmineClient(config)
+
+        mock_send_request.return_value = self.create_mock_response(
+            200, {"versions": [{"id": 1, "name": "v1.0.0"}]}
+        )
+
+        first = client.get_versions(1)
+        first[0]["name"] = "changed"
+        first.append({"id": 2})
+        second = client.get_versions(1)
+        second.clear()
+
+        assert client.get_versions(1) == [{"id": 1, "name": "v1.0.0"}]
+        mock_send_request.assert_called_once()
+
+    @patch.object(RedmineClient, "_send_request")
+    def test_cached_get_coalesces_concurrent_requests(self, mock_send_request: Mock):
+        """同一リクエストの同時実行が1回に集約されることのテスト"""
+        config = self.create_test_config()
+        client = RedmineClient(config)
+
+        release = threading.Event()
+
+        def slow_request(*args: Any, **kwargs: Any) -> Mock:
+            release.wait(timeout=5)
+            return self.create_mock_response(
+                200, {"trackers": [{"id": 1, "name": "バグ"}]}
+            )
+
+        mock_send_request.side_effect = slow_request
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            leader = executor.submit(client.get_trackers)
+            while not client._inflight:
+                time.sleep(0.001)
+            followers = [executor.submit(client.get_trackers) for _ in range(4)]
+            release.set()
+            results = [leader.result()] + [f.result() for f in followers]
+
+        mock_send_request.assert_called_once()
+        assert all(result == [{"id": 1, "name": "バグ"}] for result in results)
+        assert client._inflight == {}
+
+    @patch.object(RedmineClient, "_send_request")
+    def test_cached_get_error_not_cached(self, mock_send_request: Mock):
+        """リクエスト失敗時にキャッシュされないことのテスト"""
+        config = self.create_test_config()
+        client = RedmineClient(config)
+
+        mock_send_request.side_effect = [
+            RedmineAPIError("temporary"),
+            self.create_mock_response(200, {"trackers": []}),
+        ]
+
+        with pytest.raises(RedmineAPIError):
+            client.get_trackers()
+
+        assert client.get_trackers() == []
+        assert client._inflight == {}
+
+    @patch("rd_burndown.core.redmine_client.time.monotonic")
+    @patch.object(RedmineClient, "_send_request")
+    def test_cached_get_expires(self, mock_send_request: Mock, mock_monotonic: Mock):
+        """キャッシュ有効期限切れのテスト"""
+        config = self.create_test_config()
+        client = RedmineClient(config)
+
+        mock_send_request.return_value = self.create_mock_response(
+            200, {"issue_statuses": []}
+        )
+
+        mock_monotonic.return_value = 0.0
+        client.get_issue_statuses()
+        mock_monotonic.return_value = client.MASTER_CACHE_TTL - 1
+        client.get_issue_statuses()
+        assert mock_send_request.call_count == 1
+
+        mock_monotonic.return_value = client.MASTER_CACHE_TTL + 1
+        client.get_issue_statuses()
+        assert mock_send_request.call_count == 2
+
+    @patch("rd_burndown.core.redmine_client.time.monotonic")
+    @patch.object(RedmineClient, "_send_request")
+    def test_cached_get_revalidates_with_etag(
+        self, mock_send_request: Mock, mock_monotonic: Mock
+    ):
+        """期限切れ後の条件付きリクエストと304応答時のキャッシュ再利用のテスト"""
+        config = self.create_test_config()
+        client = RedmineClient(config)
+
+        statuses = [{"id": 1, "name": "新規"}]
+        not_modified = self.create_mock_response(304)
+        not_modified.content = b""
+        mock_send_request.side_effect = [
+            self.create_mock_response(
+                200,
+                {"issue_statuses": statuses},
+                headers={
+                    "ETag": '"abc"',
+                    "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+                },
+            ),
+            not_modified,
+        ]
+
+        mock_monotonic.return_value = 0.0
+        assert client.get_issue_statuses() == statuses
+
+        mock_monotonic.return_value = client.MASTER_CACHE_TTL + 1
+        assert client.get_issue_statuses() == statuses
+
+        mock_send_request.assert_called_with(
+            "GET",
+            "/issue_statuses.json",
+            params=None,
+            headers={
+                "If-None-Match": '"abc"',
+                "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+            },
+        )
+        not_modified.json.assert_not_called()
+
+        # 304 応答で有効期限が延長される
+        mock_monotonic.return_value = client.MASTER_CACHE_TTL * 2
+        client.get_issue_statuses()
+        assert mock_send_request.call_count == 2
 
     @patch.object(RedmineClient, "_make_request")
     def test_get_users_all(self, mock_make_request: Mock):
@@ -553,11 +1131,39 @@ class TestRedmineClient:
         assert result[1]["id"] == 2
 
         mock_make_request.assert_called_once_with(
-            "GET", "/projects/1/memberships.json", params={"limit": 100}
+            "GET", "/projects/1/memberships.json", params={"limit": 100, "offset": 0}
         )
 
     @patch.object(RedmineClient, "_make_request")
-    def test_get_versions(self, mock_make_request: Mock):
+    def test_get_users_project_members_paginated(self, mock_make_request: Mock):
+        """ユーザー一覧取得（プロジェクトメンバー・複数ページ）のテスト"""
+        config = self.create_test_config()
+        client = RedmineClient(config)
+
+        mock_make_request.side_effect = [
+            {
+                "memberships": [
+                    {"user": {"id": 1, "login": "user1"}},
+                    {"group": {"id": 10, "name": "開発チーム"}},
+                ],
+                "total_count": 3,
+                "limit": 2,
+            },
+            {
+                "memberships": [{"user": {"id": 2, "login": "user2"}}],
+                "total_count": 3,
+                "limit": 2,
+            },
+        ]
+
+        result = client.get_users(project_id=1)
+
+        assert [user["id"] for user in result] == [1, 2]
+        assert mock_make_request.call_count == 2
+        assert mock_make_request.call_args[1]["params"] == {"limit": 2, "offset": 2}
+
+    @patch.object(RedmineClient, "_send_request")
+    def test_get_versions(self, mock_send_request: Mock):
         """バージョン一覧取得のテスト"""
         config = self.create_test_config()
         client = RedmineClient(config)
@@ -566,12 +1172,16 @@ class TestRedmineClient:
             {"id": 1, "name": "v1.0.0"},
             {"id": 2, "name": "v1.1.0"},
         ]
-        mock_make_request.return_value = {"versions": mock_versions}
+        mock_send_request.return_value = self.create_mock_response(
+            200, {"versions": mock_versions}
+        )
 
         result = client.get_versions(1)
 
         assert result == mock_versions
-        mock_make_request.assert_called_once_with("GET", "/projects/1/versions.json")
+        mock_send_request.assert_called_once_with(
+            "GET", "/projects/1/versions.json", params=None, headers=None
+        )
 
 
 class TestIntegration:
@@ -601,22 +1211,31 @@ class TestIntegration:
         mock_session.headers.update.assert_called_once_with(
             {
                 "Content-Type": "application/json",
+                "Accept": "application/json",
+                "Accept-Encoding": "gzip, deflate",
+                "User-Agent": f"rd-burndown/{__version__}",
                 "X-Redmine-API-Key": "integration-test-key-789",
             }
         )
 
-    @patch.object(RedmineClient, "_make_request")
-    def test_full_api_workflow(self, mock_make_request: Mock):
+    @patch.object(RedmineClient, "_send_request")
+    def test_full_api_workflow(self, mock_send_request: Mock):
         """完全なAPIワークフローのテスト"""
         config = Config()
         client = RedmineClient(config)
 
+        def response(json_data: dict[str, Any]) -> Mock:
+            mock_response = Mock(status_code=200, headers={})
+            mock_response.json.return_value = json_data
+            mock_response.content = json.dumps(json_data).encode("utf-8")
+            return mock_response
+
         # 複数のAPIエンドポイントを順次呼び出し
-        mock_make_request.side_effect = [
-            {"user": {"id": 1, "login": "admin"}},  # test_connection
-            {"projects": [{"id": 1, "name": "Test Project"}]},  # get_projects
-            {"project": {"id": 1, "name": "Test Project"}},  # get_project
-            {"issues": [], "total_count": 0},  # get_issues
+        mock_send_request.side_effect = [
+            response({"user": {"id": 1, "login": "admin"}}),  # test_connection
+            response({"projects": [{"id": 1, "name": "Test Project"}]}),
+            response({"project": {"id": 1, "name": "Test Project"}}),  # get_project
+            response({"issues": [], "total_count": 0}),  # get_issues
         ]
 
         # ワークフロー実行
@@ -633,4 +1252,4 @@ class TestIntegration:
         assert issues["total_count"] == 0
 
         # 正しい順序でAPIが呼ばれたか確認
-        assert mock_make_request.call_count == 4
+        assert mock_send_request.call_count == 4
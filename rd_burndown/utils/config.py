@@ -1,9 +1,12 @@
 """設定管理ユーティリティ"""
 
+import copy
+import functools
+import json
 import logging
 import os
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, ClassVar, Optional
 
 import yaml
 from dotenv import load_dotenv
@@ -11,6 +14,20 @@ from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+# libyaml が利用可能な場合は C 実装のローダー/ダンパーを使用する
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# 環境変数名 → (セクション, キー, 型変換)
+_ENV_OVERRIDES: dict[str, tuple[str, str, Callable[[str], Any]]] = {
+    "RD_REDMINE_URL": ("redmine", "url", str),
+    "RD_REDMINE_API_KEY": ("redmine", "api_key", str),
+    "RD_OUTPUT_DIR": ("output", "output_dir", str),
+    "RD_OUTPUT_FORMAT": ("output", "default_format", str),
+    "RD_CACHE_DIR": ("data", "cache_dir", str),
+    "RD_CACHE_TTL_HOURS": ("data", "cache_ttl_hours", int),
+}
+
 
 class ConfigError(Exception):
     """設定関連エラー"""
@@ -23,6 +40,11 @@ class RedmineConfig(BaseModel):
     api_key: str = Field(default="")
     timeout: int = Field(default=30)
     verify_ssl: bool = Field(default=True)
+    pool_maxsize: int = Field(default=32, description="HTTP接続プールの最大接続数")
+    max_per_page: int = Field(
+        default=100,
+        description="一覧取得1ページあたりの最大件数（Redmine側の上限設定に合わせる）",
+    )
 
 
 class OutputConfig(BaseModel):
@@ -105,11 +127,20 @@ class Config(BaseModel):
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
 
 
+@functools.lru_cache(maxsize=1)
+def _default_config_path() -> Path:
+    """既定の設定ファイルパス（プロセス内で不変のため1回だけ解決する）"""
+    return Path.home() / ".rd-burndown" / "config.yaml"
+
+
 class ConfigManager:
     """設定管理クラス"""
 
+    # 解析済みYAMLのキャッシュ（パス・更新時刻・サイズをキーにインスタンス間で共有）
+    _parse_cache: ClassVar[dict[tuple[str, int, int], Any]] = {}
+
     def __init__(self, config_path: Optional[Path] = None) -> None:
-        self.config_path = config_path or Path.home() / ".rd-burndown" / "config.yaml"
+        self.config_path = config_path or _default_config_path()
         self._config: Optional[Config] = None
         load_dotenv()
 
@@ -118,13 +149,8 @@ class ConfigManager:
         if self._config is not None:
             return self._config
 
-        config_dict: dict[str, Any] = {}
-
         try:
-            if self.config_path.exists():
-                with open(self.config_path, encoding="utf-8") as f:
-                    config_dict = yaml.safe_load(f) or {}
-
+            config_dict = self._read_config_file()
             config_dict = self._apply_env_overrides(config_dict)
 
             # 設定値バリデーション
@@ -143,30 +169,80 @@ class ConfigManager:
             logger.error(f"Failed to load config: {e}")
             raise ConfigError(f"Failed to load config: {e}") from e
 
+    def _read_config_file(self) -> dict[str, Any]:
+        """設定ファイルを読み込み（ファイルが未変更なら解析結果を再利用）"""
+        try:
+            stat = self.config_path.stat()
+        except FileNotFoundError:
+            return {}
+
+        key = (str(self.config_path), stat.st_mtime_ns, stat.st_size)
+        if key not in self._parse_cache:
+            parsed = self._read_sidecar(stat)
+            if parsed is None:
+                with open(self.config_path, encoding="utf-8") as f:
+                    parsed = yaml.load(f, Loader=_YamlLoader) or {}
+                self._write_sidecar(stat, parsed)
+            self._parse_cache[key] = parsed
+
+        # 環境変数の適用で書き換えられるため、キャッシュ本体は渡さない
+        return copy.deepcopy(self._parse_cache[key])
+
+    def _sidecar_path(self) -> Path:
+        """解析済み設定を保持するJSONキャッシュのパス"""
+        return self.config_path.with_name(f"{self.config_path.name}.cache.json")
+
+    def _read_sidecar(self, stat: os.stat_result) -> Optional[Any]:
+        """設定ファイルと更新時刻・サイズが一致するJSONキャッシュを読み込み"""
+        try:
+            with open(self._sidecar_path(), encoding="utf-8") as f:
+                sidecar = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if (
+            not isinstance(sidecar, dict)
+            or sidecar.get("mtime_ns") != stat.st_mtime_ns
+            or sidecar.get("size") != stat.st_size
+        ):
+            return None
+        return sidecar.get("config")
+
+    def _write_sidecar(self, stat: os.stat_result, config_dict: Any) -> None:
+        """解析済み設定をJSONキャッシュとして書き込み（失敗しても無視する）
+
+        APIキーを含むため、所有者のみ読み書き可能な権限で作成する。
+        """
+        try:
+            content = json.dumps(
+                {
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "config": config_dict,
+                },
+                ensure_ascii=False,
+            )
+            path = self._sidecar_path()
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            # 既存ファイルは os.open の mode が適用されないため権限を揃える
+            path.chmod(0o600)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Failed to write config cache: {e}")
+
     def _apply_env_overrides(self, config_dict: dict[str, Any]) -> dict[str, Any]:
         """環境変数でオーバーライド"""
-        env_mappings = {
-            "RD_REDMINE_URL": ("redmine", "url"),
-            "RD_REDMINE_API_KEY": ("redmine", "api_key"),
-            "RD_OUTPUT_DIR": ("output", "output_dir"),
-            "RD_OUTPUT_FORMAT": ("output", "default_format"),
-            "RD_CACHE_DIR": ("data", "cache_dir"),
-            "RD_CACHE_TTL_HOURS": ("data", "cache_ttl_hours"),
-        }
-
-        for env_var, (section, key) in env_mappings.items():
-            env_value = os.getenv(env_var)
-            if env_value is not None:
-                if section not in config_dict:
-                    config_dict[section] = {}
-
-                if key == "cache_ttl_hours":
-                    try:
-                        config_dict[section][key] = int(env_value)
-                    except ValueError:
-                        continue
-                else:
-                    config_dict[section][key] = env_value
+        for env_var, (section, key, cast) in _ENV_OVERRIDES.items():
+            env_value = os.environ.get(env_var)
+            if env_value is None:
+                continue
+
+            try:
+                value = cast(env_value)
+            except ValueError:
+                continue
+            config_dict.setdefault(section, {})[key] = value
 
         return config_dict
 
@@ -184,6 +260,8 @@ class ConfigManager:
         self._validate_redmine_url(redmine_config.get("url"))
         self._validate_redmine_api_key(redmine_config.get("api_key"))
         self._validate_redmine_timeout(redmine_config.get("timeout"))
+        self._validate_redmine_pool_maxsize(redmine_config.get("pool_maxsize"))
+        self._validate_redmine_max_per_page(redmine_config.get("max_per_page"))
 
     def _validate_redmine_url(self, url: Any) -> None:
         """RedmineのURL検証"""
@@ -213,6 +291,22 @@ class ConfigManager:
         if not isinstance(timeout, (int, float)) or timeout <= 0:
             raise ValueError("Redmine timeout must be a positive number")
 
+    def _validate_redmine_pool_maxsize(self, pool_maxsize: Any) -> None:
+        """RedmineのHTTP接続プールサイズ検証"""
+        if pool_maxsize is None:
+            return
+
+        if not isinstance(pool_maxsize, int) or pool_maxsize <= 0:
+            raise ValueError("Redmine pool_maxsize must be a positive integer")
+
+    def _validate_redmine_max_per_page(self, max_per_page: Any) -> None:
+        """Redmineの1ページあたり最大件数検証"""
+        if max_per_page is None:
+            return
+
+        if not isinstance(max_per_page, int) or not 1 <= max_per_page <= 1000:
+            raise ValueError("Redmine max_per_page must be between 1 and 1000")
+
     def _validate_data_config(self, data_config: dict[str, Any]) -> None:
         """データ設定の検証"""
         if not data_config:
@@ -262,11 +356,13 @@ class ConfigManager:
             yaml.dump(
                 config.model_dump(),
                 f,
+                Dumper=_YamlDumper,
                 default_flow_style=False,
                 allow_unicode=True,
                 sort_keys=True,
             )
 
+        self._write_sidecar(self.config_path.stat(), config.model_dump())
         self._config = config
 
     def create_default_config(self) -> Config: